@@ -4,3 +4,9 @@ from dataclasses import dataclass
 @dataclass
 class Config:
     default_year: int = 2024
+    bench_warmup_runs: int = 1
+    bench_regression_threshold: float = 0.1
+    bench_results_path: str = 'bench_results.json'
+    bench_baseline_path: str = 'bench_baseline.json'
+    answer_cache_dir: str = '.answer_cache'
+    answer_cache_max_bytes: int = 1_000_000
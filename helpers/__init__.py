@@ -1,4 +1,4 @@
 from helpers.commandline_helpers import CC, pretty_print_result
 from helpers.regex_extract import regex_extract, regex_extract_multiple
-from helpers.timethis import timethis
+from helpers.timethis import timethis, print_timing
 from helpers.input_loader import InputLoader
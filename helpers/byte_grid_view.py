@@ -0,0 +1,76 @@
+from lib.exceptions import OutOfBoundsError
+
+
+class ByteGridView:
+    """
+    Read only two dimensional view over a bytes-like buffer holding a text grid, e.g. memory mapped input. Rows are
+    found by stride arithmetic (row width plus line ending), so no per-line copies are made.
+    """
+    __slots__ = ['buffer', 'width', 'height', 'stride', 'offset']
+
+    def __init__(self, buffer, width: int, height: int, stride: int, offset: int = 0):
+        self.buffer = memoryview(buffer)
+        self.width = width
+        self.height = height
+        self.stride = stride
+        self.offset = offset
+
+    @staticmethod
+    def from_text_buffer(buffer) -> 'ByteGridView':
+        """
+        Create view over a newline separated grid. Handles both \\n and \\r\\n line endings and trailing newline.
+        """
+        view = memoryview(buffer)
+        size = len(view)
+        newline_index = _find_first_newline(view)
+        if newline_index == -1:
+            return ByteGridView(view, size, 1 if size else 0, size)
+        width = newline_index - 1 if newline_index > 0 and view[newline_index - 1] == ord('\r') else newline_index
+        stride = newline_index + 1
+        height = (size - width) // stride + 1
+        return ByteGridView(view, width, height, stride)
+
+    def coordinates_within_bounds(self, row, col) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def index(self, row: int, col: int) -> int:
+        """
+        :return: Position of the cell in the underlying buffer.
+        """
+        return self.offset + row * self.stride + col
+
+    def get(self, row: int, col: int) -> int:
+        """
+        :raise OutOfBoundsError: If the coordinates fall outside the grid.
+        :return: Byte value of the cell.
+        """
+        if not self.coordinates_within_bounds(row, col):
+            raise OutOfBoundsError()
+        return self.buffer[self.offset + row * self.stride + col]
+
+    def row(self, row: int) -> memoryview:
+        """
+        :return: Zero copy view of the row, without line ending.
+        """
+        start = self.offset + row * self.stride
+        return self.buffer[start:start + self.width]
+
+    def col(self, col: int) -> memoryview:
+        """
+        :return: Zero copy strided view of the column.
+        """
+        start = self.offset + col
+        return self.buffer[start:start + (self.height - 1) * self.stride + 1:self.stride]
+
+    def rows(self):
+        return (self.row(row) for row in range(self.height))
+
+
+def _find_first_newline(view: memoryview, search_chunk_size: int = 4096) -> int:
+    start = 0
+    while start < len(view):
+        position = bytes(view[start:start + search_chunk_size]).find(b'\n')
+        if position != -1:
+            return start + position
+        start += search_chunk_size
+    return -1
@@ -12,5 +12,6 @@ class CommandlineColors:
 CC = CommandlineColors()
 
 
-def pretty_print_result(year, day, part, result):
-    print('[', year, '-day', day, '] ', CC.GREEN, 'Result of part ', part, CC.NC, ': ', result, sep='')
+def pretty_print_result(year, day, part, result, cached=False):
+    cached_note = ' (cached)' if cached else ''
+    print('[', year, '-day', day, '] ', CC.GREEN, 'Result of part ', part, CC.NC, ': ', result, cached_note, sep='')
@@ -1,6 +1,20 @@
+import mmap
 import os
+from array import array
+from contextlib import contextmanager
+from typing import Generator, Union
+
+from helpers.byte_grid_view import ByteGridView
 from lib.exceptions import RunException
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+STREAM_CHUNK_SIZE = 1 << 16
+
 
 class InputLoader:
     def __init__(self, filepath):
@@ -8,8 +22,82 @@ class InputLoader:
             raise RunException('Input file with name ' + str(filepath) + ' does not exist.')
         self.filepath = filepath
 
-    def load_input_as_generator(self, item_separator, retype_int=False):
-        raise RunException('Load input function not yet implemented')
+    def load_input_chunks(self, chunk_size=STREAM_CHUNK_SIZE) -> Generator[str, None, None]:
+        """
+        Stream the raw input in chunks of at most chunk_size characters, nothing is stripped or split.
+        """
+        with open(self.filepath, 'r') as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def load_input_as_generator(
+        self, item_separator, retype_int=False, chunk_size=STREAM_CHUNK_SIZE
+    ) -> Generator[Union[str, int], None, None]:
+        """
+        Stream the input item by item without ever holding the whole file in memory. Yields the same items as
+        load_input_array (whole input stripped, then split), separator can be any string incl. multi-character one.
+        :param item_separator:
+        :param retype_int: If true, items are converted to int.
+        :param chunk_size: How many characters are read from the file at once.
+        """
+        if not item_separator:
+            raise RunException('Item separator cannot be empty')
+        retype = int if retype_int else str
+        # Items known to be followed only by whitespace so far. They are held back, because if nothing but
+        # whitespace follows until the end of file, they fall under the strip of the whole input.
+        pending = []
+        buffer = ''
+        started = False
+        with open(self.filepath, 'r') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                buffer += chunk
+                if not started:
+                    buffer = buffer.lstrip()
+                    started = bool(buffer)
+                *complete_items, buffer = buffer.split(item_separator)
+                for item in complete_items:
+                    if item.strip():
+                        for pending_item in pending:
+                            yield retype(pending_item)
+                        pending = [item]
+                    else:
+                        pending.append(item)
+
+        pending.append(buffer)
+        for item in item_separator.join(pending).rstrip().split(item_separator):
+            yield retype(item)
+
+    @contextmanager
+    def map_input(self) -> Generator[memoryview, None, None]:
+        """
+        Memory map the input and provide it as read only bytes view, nothing is decoded nor copied. The view and
+        anything sliced from it must not be used after the with block ends.
+        """
+        with open(self.filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield memoryview(b'')  # empty files cannot be mapped
+                return
+            mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped_file)
+        try:
+            yield view
+        finally:
+            view.release()
+            try:
+                mapped_file.close()
+            except BufferError:
+                pass  # a slice of the view is still alive, the mapping gets closed once it is collected
+
+    @contextmanager
+    def map_input_grid(self) -> Generator[ByteGridView, None, None]:
+        """
+        Memory map the input and provide it as a row strided grid view. Same lifetime rules as for map_input apply.
+        """
+        with self.map_input() as view:
+            yield ByteGridView.from_text_buffer(view)
 
     def load_input(self):
         with open(self.filepath, 'r') as f:
@@ -30,3 +118,22 @@ class InputLoader:
             return [[int(x) for x in y.split(item_separator)] for y in full_input]
         else:
             return [y.split(item_separator) for y in full_input]
+
+    def load_input_int_columns(self, column_count, as_numpy=False) -> list:
+        """
+        Parse whitespace separated integers in bulk and split them into columns, e.g. "3   4" lines into two columns.
+        :param column_count: Number of integers on each line.
+        :param as_numpy: If true, columns are NumPy int64 arrays (views of one parsed array), else array('q').
+        :raise RunException: If the integers do not fill whole lines or NumPy is requested but not installed.
+        """
+        with open(self.filepath, 'r') as f:
+            full_input = f.read()
+        if as_numpy:
+            if numpy is None:
+                raise RunException('NumPy is not installed')
+            numbers = numpy.fromstring(full_input, dtype=numpy.int64, sep=' ')
+        else:
+            numbers = array('q', map(int, full_input.split()))
+        if len(numbers) % column_count:
+            raise RunException(f'{len(numbers)} integers cannot be split into {column_count} columns')
+        return [numbers[column::column_count] for column in range(column_count)]
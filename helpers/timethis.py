@@ -1,13 +1,16 @@
 from datetime import datetime
 
 
+def print_timing(name, seconds):
+    print("[", datetime.now().strftime("%H:%M:%S"), "] '", name, "' took ", seconds, " seconds.", sep="")
+
+
 def timethis(func):
     def wrapper(*args, **kwargs):
         before = datetime.now()
         result = func(*args, **kwargs)
         after = datetime.now()
-        print("[", after.strftime("%H:%M:%S"), "] '", func.__name__, "' took ", (after - before).total_seconds(),
-              " seconds.", sep="")
+        print_timing(func.__name__, (after - before).total_seconds())
         return result
 
     return wrapper
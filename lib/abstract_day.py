@@ -1,8 +1,19 @@
+import copy
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
+
+
+_NOT_PARSED = object()
 
 
 class AbstractDay(ABC):
+    _parsed_input: Any = _NOT_PARSED
+    _recorded_timings: Optional[list[tuple[str, float]]] = None
+    worker_count: Optional[int] = None
+    # parts whose answers may be served from the answer cache, parts with side effects (e.g. drawing the answer
+    # to the terminal) need to be left out
+    cacheable_parts: tuple[int, ...] = (1, 2)
+
     @abstractmethod
     def add_input_loader(self, input_loader) -> None:
         pass
@@ -14,3 +25,64 @@ class AbstractDay(ABC):
     @abstractmethod
     def run_part_two(self) -> Any:
         pass
+
+    def add_worker_count(self, worker_count: Optional[int]) -> None:
+        """
+        Number of processes the day may use, for days that can split their work. None = run serially.
+        """
+        self.worker_count = worker_count
+
+    def record_timing(self, name: str, seconds: float) -> None:
+        """
+        Report timing of a piece of work done by a part (e.g. by one worker process), instead of printing it from
+        the solver. The runner prints recorded timings along with the part timing when timing is enabled.
+        """
+        if self._recorded_timings is None:
+            self._recorded_timings = []
+        self._recorded_timings.append((name, seconds))
+
+    def pop_recorded_timings(self) -> list[tuple[str, float]]:
+        recorded_timings = self._recorded_timings or []
+        self._recorded_timings = None
+        return recorded_timings
+
+    def parse(self) -> Any:
+        """
+        Optional parsing stage shared by both parts. Override to parse the input once, the parts then obtain the
+        result via get_parsed_input().
+        :return: Parsed input.
+        """
+        return None
+
+    @classmethod
+    def is_part_cacheable(cls, part: int) -> bool:
+        return part in cls.cacheable_parts
+
+    @classmethod
+    def has_parse_stage(cls) -> bool:
+        return cls.parse is not AbstractDay.parse
+
+    @property
+    def is_input_parsed(self) -> bool:
+        return self._parsed_input is not _NOT_PARSED
+
+    def prepare_parsed_input(self) -> None:
+        """
+        Run the parse stage unless it already ran.
+        """
+        if not self.is_input_parsed:
+            self._parsed_input = self.parse()
+
+    def get_parsed_input(self, clone: bool = False) -> Any:
+        """
+        Fetch the shared parse result, parsing on first access.
+        :param clone: Parts that mutate the parsed state need to ask for a clone, so the other part still gets
+        the original. Uses clone() of the parsed object if it has one, deep copy otherwise.
+        :return: Parsed input (or its copy).
+        """
+        self.prepare_parsed_input()
+        if not clone:
+            return self._parsed_input
+        if hasattr(self._parsed_input, 'clone'):
+            return self._parsed_input.clone()
+        return copy.deepcopy(self._parsed_input)
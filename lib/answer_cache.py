@@ -0,0 +1,140 @@
+import ast
+import hashlib
+import json
+import os
+from importlib.util import find_spec, resolve_name
+from pathlib import Path
+from typing import Any, Optional
+
+from config import Config
+
+
+LOCAL_PACKAGE_PREFIXES = ('lib', 'helpers', 'year')
+# top level local modules, matched exactly so that e.g. configparser is not taken for config
+LOCAL_MODULES = ('config',)
+# results of unsolved parts (day template returns "---"), these must not outlive the solution being written
+PLACEHOLDER_RESULTS = ('---', None)
+
+
+def _module_imports(source: str, module_name: str) -> set[str]:
+    imported = set()
+    package = module_name.rsplit('.', 1)[0]
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ''
+            if node.level:
+                base = resolve_name('.' * node.level + base, package)
+            imported.add(base)
+            imported.update(base + '.' + alias.name for alias in node.names)
+    return {name for name in imported if name in LOCAL_MODULES or name.startswith(LOCAL_PACKAGE_PREFIXES)}
+
+
+def _module_path(module_name: str) -> Optional[Path]:
+    try:
+        spec = find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None or not spec.origin.endswith('.py'):
+        return None
+    return Path(spec.origin)
+
+
+def source_hash(module_name: str) -> str:
+    """
+    Hash of the module source together with sources of all local modules (lib, helpers, years, config) it imports,
+    transitively. Any change in the solver or its dependencies changes the hash.
+    """
+    module_hashes = {}
+    to_visit = [module_name]
+    while to_visit:
+        name = to_visit.pop()
+        if name in module_hashes:
+            continue
+        path = _module_path(name)
+        if path is None:
+            module_hashes[name] = b''
+            continue
+        source = path.read_bytes()
+        module_hashes[name] = hashlib.sha256(source).digest()
+        to_visit.extend(_module_imports(source.decode(), name))
+
+    digest = hashlib.sha256()
+    for name in sorted(module_hashes):
+        digest.update(name.encode() + b'\0' + module_hashes[name])
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    """
+    Content-addressed on-disk store of answers. Key is a hash of input bytes, solver sources and the part number,
+    so the cache never needs explicit invalidation. Total size is kept under the configured limit by evicting
+    least recently used entries.
+    """
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        config = Config()
+        self.cache_dir = Path(cache_dir if cache_dir is not None else config.answer_cache_dir)
+        self.max_bytes = max_bytes if max_bytes is not None else config.answer_cache_max_bytes
+        self._source_hashes = {}
+
+    def make_key(self, day, year, part, input_filepath) -> str:
+        module_name = 'year' + str(year) + '.days.day' + str(day)
+        if module_name not in self._source_hashes:
+            self._source_hashes[module_name] = source_hash(module_name)
+        digest = hashlib.sha256()
+        with open(input_filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        digest.update(b'\0' + self._source_hashes[module_name].encode() + b'\0' + str(part).encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / (key + '.json')
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        :return: Pair of hit flag and the cached answer (None on miss).
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r') as f:
+                result = json.load(f)['result']
+        except (OSError, ValueError, KeyError):
+            return False, None
+        try:
+            os.utime(path)  # mark as recently used for eviction
+        except OSError:
+            pass  # evicted by another process meanwhile, the answer read is still valid
+        return True, result
+
+    def put(self, key: str, result: Any) -> None:
+        if result in PLACEHOLDER_RESULTS:
+            return
+        try:
+            content = json.dumps({'result': result})
+        except (TypeError, ValueError):
+            return  # answers that do not survive JSON round trip are simply not cached
+        if json.loads(content)['result'] != result:
+            return  # e.g. tuples would come back as lists
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temporary_path = self._entry_path(key).with_suffix('.tmp.' + str(os.getpid()))
+        with open(temporary_path, 'w') as f:
+            f.write(content)
+        os.replace(temporary_path, self._entry_path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
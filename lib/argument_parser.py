@@ -5,7 +5,8 @@ from config import Config
 
 
 class ArgumentParser:
-    __slots__ = ['day', 'year', 'construct', 'run', 'part', 'timeit']
+    __slots__ = ['day', 'year', 'construct', 'run', 'part', 'timeit', 'batch', 'batch_years', 'batch_days', 'workers',
+                 'batch_workers', 'bench', 'warmup', 'threshold', 'save_baseline', 'use_cache']
 
     def parse(self):
         parser = argparse.ArgumentParser(description='AOC custom runner')
@@ -21,6 +22,27 @@ class ArgumentParser:
                             help='Part to run when running day. 0 = both, 1 = part 1, 2 = part 2.')
         parser.add_argument('-t', '--timeit', dest='timeit', default=False, action='store_true',
                             help='When set to true, parts of the day that are run will be timed.')
+        parser.add_argument('--no-cache', dest='no_cache', action='store_true', default=False,
+                            help='Always solve the parts, bypassing the on-disk answer cache.')
+        parser.add_argument('-a', '--all', dest='all', action='store_true', default=False,
+                            help='Batch mode: run every day found. Limited to the year if one is given explicitly.')
+        parser.add_argument('--days', dest='days', type=str,
+                            help='Batch mode: days to run for the year, e.g. "1-15" or "1,3,5-7".')
+        parser.add_argument('--years', dest='years', type=str,
+                            help='Batch mode: years to run, e.g. "2022-2024". Without --days all their days are run.')
+        parser.add_argument('-w', '--workers', dest='workers', type=int,
+                            help='Number of worker processes a day may split its work across, for days that support '
+                                 'it. Days run serially unless set. Applies to every day run in batch mode as well.')
+        parser.add_argument('--batch-workers', dest='batch_workers', type=int,
+                            help='Batch mode: number of days run side by side. Defaults to the number of CPUs.')
+        parser.add_argument('-b', '--bench', dest='bench', type=int,
+                            help='Benchmark mode: time each selected part N times and compare against baseline.')
+        parser.add_argument('--warmup', dest='warmup', type=int,
+                            help='Benchmark mode: untimed runs before the measured ones. Defaults to config value.')
+        parser.add_argument('--threshold', dest='threshold', type=float,
+                            help='Benchmark mode: allowed median slowdown against baseline in percent.')
+        parser.add_argument('--save-baseline', dest='save_baseline', action='store_true', default=False,
+                            help='Benchmark mode: store the results as the new baseline.')
 
         parsed_args = parser.parse_args()
         self._assign_args(parsed_args)
@@ -38,8 +60,52 @@ class ArgumentParser:
         self.run = args.run
         self.part = args.part
         self.timeit = args.timeit
+        self.workers = args.workers
+        self.batch_workers = args.batch_workers
+        self.use_cache = not args.no_cache
+        self.bench = args.bench
+        self.warmup = args.warmup
+        self.threshold = args.threshold / 100 if args.threshold is not None else None
+        self.save_baseline = args.save_baseline
+        if self.bench is not None:
+            self.run = True
+
+        self.batch = args.all or args.days is not None or args.years is not None
+        self.batch_days = self._parse_number_ranges(args.days, 'days') if args.days is not None else None
+        if args.years is not None:
+            self.batch_years = self._parse_number_ranges(args.years, 'years')
+        elif args.year or args.days is not None:
+            self.batch_years = [self.year]
+        else:
+            self.batch_years = None
+        if self.batch:
+            self.run = True
+
+    @staticmethod
+    def _parse_number_ranges(value, name):
+        numbers = []
+        try:
+            for item in value.split(','):
+                if '-' in item:
+                    start, end = item.split('-')
+                    numbers.extend(range(int(start), int(end) + 1))
+                else:
+                    numbers.append(int(item))
+        except ValueError:
+            raise ArgumentException(f'Value of {name} needs to be comma separated numbers or ranges like "1-15"')
+        return sorted(set(numbers))
 
     def _validate(self):
+        if self.workers is not None and self.workers < 1:
+            raise ArgumentException('Worker count needs to be at least 1')
+        if self.batch_workers is not None and self.batch_workers < 1:
+            raise ArgumentException('Batch worker count needs to be at least 1')
+        self._validate_bench()
+        if self.batch:
+            self._validate_batch()
+            return
+        if self.day is None:
+            raise ArgumentException('Day needs to be set unless running in batch mode')
         if self.day < 1 or self.day > 25:
             raise ArgumentException('Day value needs to be <1,25>')
         if self.year < 2015:
@@ -49,6 +115,28 @@ class ArgumentParser:
         if self.part < 0 or self.part > 2:
             raise ArgumentException('Part needs to be a number <0,2>')
 
+    def _validate_bench(self):
+        if self.bench is None:
+            return
+        if self.bench < 1:
+            raise ArgumentException('Benchmark run count needs to be at least 1')
+        if self.warmup is not None and self.warmup < 0:
+            raise ArgumentException('Warmup run count cannot be negative')
+        if self.threshold is not None and self.threshold < 0:
+            raise ArgumentException('Regression threshold cannot be negative')
+
+    def _validate_batch(self):
+        if self.construct:
+            raise ArgumentException('Batch mode cannot be combined with construct mode')
+        if self.timeit:
+            raise ArgumentException('Batch mode cannot be combined with timing, use benchmark mode (-b) instead')
+        if self.batch_days is not None and any(day < 1 or day > 25 for day in self.batch_days):
+            raise ArgumentException('Day values need to be <1,25>')
+        if self.batch_years is not None and any(year < 2015 for year in self.batch_years):
+            raise ArgumentException('Year values need to be 2015 or bigger')
+        if self.part < 0 or self.part > 2:
+            raise ArgumentException('Part needs to be a number <0,2>')
+
     def _cli_override_args(self):
         day = input('What day?\n')
         try:
@@ -0,0 +1,130 @@
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from helpers import CC, pretty_print_result
+from lib.answer_cache import AnswerCache
+from lib.exceptions import RunException
+from lib.runner import Runner
+
+
+YEAR_DIR_REGEX = re.compile(r'^year(\d+)$')
+DAY_FILE_REGEX = re.compile(r'^day(\d+)\.py$')
+
+
+@dataclass
+class BatchJob:
+    year: int
+    day: int
+    part: int
+
+
+@dataclass
+class BatchJobResult:
+    job: BatchJob
+    result: Any
+    elapsed_seconds: float
+    error: Optional[str] = None
+    cached: bool = False
+
+
+def run_batch_job(job: BatchJob, use_cache: bool = True, day_workers: Optional[int] = None) -> BatchJobResult:
+    """
+    Run one part of one day. Executed inside the worker processes, so any failure of the day itself is captured
+    into the result instead of tearing down the whole batch.
+    :param day_workers: Worker processes the day itself may use, see AbstractDay.add_worker_count.
+    """
+    before = time.perf_counter()
+    try:
+        runner = Runner.prepare_day_runner(job.day, job.year, day_workers)
+        cache = AnswerCache() if use_cache else None
+        result, cached = Runner.run_part_cached(runner, job.day, job.year, job.part, cache)
+        return BatchJobResult(job, result, time.perf_counter() - before, cached=cached)
+    except Exception as ex:
+        return BatchJobResult(job, None, time.perf_counter() - before, f'{type(ex).__name__}: {ex}')
+
+
+class BatchRunner:
+    @staticmethod
+    def discover_days(root: Path = Path('.')) -> dict[int, list[int]]:
+        """
+        Find every yearYYYY/days/dayN.py that defines a DayRunner.
+        :param root: Directory containing the year packages.
+        :return: Dictionary of year to sorted list of its days.
+        """
+        discovered = {}
+        for year_dir in root.iterdir():
+            year_match = YEAR_DIR_REGEX.match(year_dir.name)
+            days_dir = year_dir / 'days'
+            if not year_match or not days_dir.is_dir():
+                continue
+            days = []
+            for day_file in days_dir.iterdir():
+                day_match = DAY_FILE_REGEX.match(day_file.name)
+                if day_match and 'class DayRunner' in day_file.read_text():
+                    days.append(int(day_match.group(1)))
+            if days:
+                discovered[int(year_match.group(1))] = sorted(days)
+        return discovered
+
+    @staticmethod
+    def collect_jobs(years: Optional[list[int]], days: Optional[list[int]], part: int) -> list[BatchJob]:
+        """
+        Assemble jobs for the selection, in stable (year, day, part) order.
+        :param years: Years to run, None for every discovered year.
+        :param days: Days to run, None for every discovered day of selected years.
+        :param part: 0 = both parts, 1 or 2 for single part.
+        """
+        discovered = BatchRunner.discover_days()
+        selected_years = sorted(discovered.keys()) if years is None else sorted(years)
+        parts = [1, 2] if part == 0 else [part]
+
+        jobs = []
+        for year in selected_years:
+            available_days = discovered.get(year, [])
+            selected_days = available_days if days is None else sorted(d for d in days if d in available_days)
+            for day in selected_days:
+                jobs.extend(BatchJob(year, day, selected_part) for selected_part in parts)
+        if not jobs:
+            raise RunException('No days with DayRunner found for the selected years and days.')
+        return jobs
+
+    @staticmethod
+    def run(years: Optional[list[int]], days: Optional[list[int]], part: int, batch_workers: Optional[int] = None,
+            use_cache: bool = True, day_workers: Optional[int] = None):
+        """
+        :param batch_workers: Number of processes running the jobs, None for the number of CPUs.
+        :param day_workers: Worker processes every day may use on its own, None to run the days serially.
+        """
+        jobs = BatchRunner.collect_jobs(years, days, part)
+
+        before = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=batch_workers) as executor:
+            results = list(executor.map(run_batch_job, jobs, [use_cache] * len(jobs), [day_workers] * len(jobs)))
+        wall_time = time.perf_counter() - before
+
+        for job_result in results:
+            BatchRunner._print_job_result(job_result)
+        BatchRunner._print_summary(results, wall_time)
+        return results
+
+    @staticmethod
+    def _print_job_result(job_result: BatchJobResult):
+        job = job_result.job
+        if job_result.error is not None:
+            print('[', job.year, '-day', job.day, '] ', CC.RED, 'Part ', job.part, ' failed', CC.NC, ': ',
+                  job_result.error, sep='')
+        else:
+            pretty_print_result(job.year, job.day, job.part, job_result.result, job_result.cached)
+
+    @staticmethod
+    def _print_summary(results: list[BatchJobResult], wall_time: float):
+        serial_time = sum(job_result.elapsed_seconds for job_result in results)
+        failed_count = sum(1 for job_result in results if job_result.error is not None)
+        speedup = serial_time / wall_time if wall_time > 0 else 0.0
+        print(CC.STRONG_YELLOW, 'Batch finished', CC.NC, ': ', len(results), ' jobs (', failed_count, ' failed) in ',
+              f'{wall_time:.3f}', ' seconds, serial time ', f'{serial_time:.3f}', ' seconds, speedup ',
+              f'{speedup:.2f}x', sep='')
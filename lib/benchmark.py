@@ -0,0 +1,145 @@
+import json
+import math
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+from config import Config
+from helpers import CC
+from lib.batch_runner import BatchJob
+from lib.exceptions import BenchmarkRegressionException
+from lib.runner import Runner
+
+
+@dataclass
+class BenchmarkStats:
+    runs: int
+    min_ns: int
+    median_ns: float
+    p95_ns: int
+    stddev_ns: float
+
+    @staticmethod
+    def from_samples(samples: list[int]) -> 'BenchmarkStats':
+        ordered = sorted(samples)
+        p95_index = max(0, math.ceil(0.95 * len(ordered)) - 1)
+        return BenchmarkStats(
+            runs=len(ordered),
+            min_ns=ordered[0],
+            median_ns=statistics.median(ordered),
+            p95_ns=ordered[p95_index],
+            stddev_ns=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        )
+
+
+def job_key(job: BatchJob) -> str:
+    return f'{job.year}/{job.day}/{job.part}'
+
+
+def get_git_revision() -> str:
+    """
+    :return: Short hash of HEAD, suffixed with '+dirty' when the working tree has changes. 'unknown' outside of git.
+    """
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                  check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return revision + '+dirty' if status else revision
+
+
+def _format_ns(nanoseconds: float) -> str:
+    return f'{nanoseconds / 1_000_000:.3f}ms'
+
+
+def _load_json(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _save_json(path: Path, content: dict):
+    with open(path, 'w') as f:
+        json.dump(content, f, indent=2, sort_keys=True)
+
+
+class Benchmark:
+    @staticmethod
+    def measure(job: BatchJob, runs: int, warmup_runs: int, workers: int | None = None) -> BenchmarkStats:
+        """
+        Time one part of one day repeatedly. Every run gets a freshly constructed DayRunner, so state left over by
+        previous runs does not skew the measurement.
+        :param workers: Worker processes the day may use, see AbstractDay.add_worker_count.
+        """
+        samples = []
+        for run_id in range(warmup_runs + runs):
+            runner = Runner.prepare_day_runner(job.day, job.year, workers)
+            part_function = Runner.get_part_function(runner, job.part)
+            before = time.perf_counter_ns()
+            part_function()
+            elapsed = time.perf_counter_ns() - before
+            if run_id >= warmup_runs:
+                samples.append(elapsed)
+        return BenchmarkStats.from_samples(samples)
+
+    @staticmethod
+    def run(jobs: list[BatchJob], runs: int, warmup_runs: int | None = None, threshold: float | None = None,
+            save_baseline: bool = False, workers: int | None = None) -> dict[str, BenchmarkStats]:
+        """
+        Benchmark the jobs one after another, store the results under current git revision and compare medians
+        against the stored baseline.
+        :param threshold: Allowed relative median slowdown against the baseline, 0.1 = 10 %.
+        :param save_baseline: Store the results as the new baseline instead of comparing against the old one.
+        :param workers: Worker processes every day may use, None to run the days serially.
+        :raise BenchmarkRegressionException: If any median regressed past the threshold.
+        """
+        config = Config()
+        warmup_runs = config.bench_warmup_runs if warmup_runs is None else warmup_runs
+        threshold = config.bench_regression_threshold if threshold is None else threshold
+
+        results = {}
+        for job in jobs:
+            stats = Benchmark.measure(job, runs, warmup_runs, workers)
+            results[job_key(job)] = stats
+            print('[', job.year, '-day', job.day, '] ', CC.GREEN, 'Benchmark of part ', job.part, CC.NC, ': min ',
+                  _format_ns(stats.min_ns), ', median ', _format_ns(stats.median_ns), ', p95 ',
+                  _format_ns(stats.p95_ns), ', stddev ', _format_ns(stats.stddev_ns), ' (', stats.runs, ' runs)',
+                  sep='')
+
+        revision = get_git_revision()
+        results_path = Path(config.bench_results_path)
+        stored_results = _load_json(results_path)
+        stored_results.setdefault(revision, {}).update({key: asdict(stats) for key, stats in results.items()})
+        _save_json(results_path, stored_results)
+
+        baseline_path = Path(config.bench_baseline_path)
+        if save_baseline:
+            baseline = _load_json(baseline_path)
+            baseline.update({key: dict(asdict(stats), revision=revision) for key, stats in results.items()})
+            _save_json(baseline_path, baseline)
+            print(CC.STRONG_YELLOW, 'Baseline saved', CC.NC, ' to ', baseline_path, sep='')
+        else:
+            Benchmark._check_regressions(results, _load_json(baseline_path), threshold)
+        return results
+
+    @staticmethod
+    def _check_regressions(results: dict[str, BenchmarkStats], baseline: dict, threshold: float):
+        regressions = []
+        for key, stats in results.items():
+            if key not in baseline:
+                continue
+            baseline_median = baseline[key]['median_ns']
+            if stats.median_ns > baseline_median * (1 + threshold):
+                regressions.append(
+                    f'{key} median {_format_ns(stats.median_ns)} vs baseline {_format_ns(baseline_median)} '
+                    f'({baseline[key].get("revision", "unknown")})'
+                )
+        if regressions:
+            raise BenchmarkRegressionException(
+                f'Median regressed by more than {threshold:.0%}: ' + '; '.join(regressions)
+            )
@@ -19,3 +19,7 @@ class OutOfBoundsError(Exception):
     To be raised when operation on two dimensional map reaches out of bounds.
     """
     pass
+
+
+class BenchmarkRegressionException(RunException):
+    pass
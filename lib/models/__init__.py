@@ -1,3 +1,8 @@
 from lib.models.direction import Direction
 from lib.models.generic_range import CustomRange
+from lib.models.interval_set import IntervalSet
 from lib.models.map_representation import MapVector, GenericMapField, GenericMapRepresentation
+from lib.models.dense_grid import DenseGrid
+from lib.models.neighbour_table import (
+    NeighbourTable, NO_NEIGHBOUR, get_neighbour_table, get_cardinal_neighbour_table, get_omnidirectional_neighbour_table
+)
@@ -0,0 +1,201 @@
+from array import array
+from typing import Iterable, Optional, Union
+
+from lib.exceptions import OutOfBoundsError, RunException
+from lib.models.direction import Direction
+from lib.models.neighbour_table import NeighbourTable, get_cardinal_neighbour_table, get_omnidirectional_neighbour_table
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+CellStorage = Union[bytearray, array]
+
+
+class DenseGrid:
+    """
+    Compact two dimensional grid stored row by row in one flat bytearray (or array.array for other cell types).
+    Cells are addressed either by (row, col) or by flat index = row * col_count + col, which is what the hot loops
+    should work with. Offers the same bounds checked API as GenericMapRepresentation.
+    """
+    __slots__ = ['row_count', 'col_count', 'cells', '_neighbour_tables']
+
+    def __init__(self, row_count: int, col_count: int, cells: Optional[CellStorage] = None, typecode: str = 'B',
+                 fill: int = 0):
+        if cells is None:
+            cells = bytearray([fill]) * (row_count * col_count) if typecode == 'B' \
+                else array(typecode, [fill]) * (row_count * col_count)
+        if len(cells) != row_count * col_count:
+            raise RunException(f"Grid {row_count}x{col_count} cannot hold {len(cells)} cells")
+        self.row_count = row_count
+        self.col_count = col_count
+        self.cells = cells
+        self._neighbour_tables: dict[str, NeighbourTable] = {}
+
+    @staticmethod
+    def from_lines(lines: list[str], translation: Optional[dict[str, int]] = None) -> 'DenseGrid':
+        """
+        Create byte grid from equally long lines of text.
+        :param lines:
+        :param translation: Optional char to cell value mapping (e.g. digits to heights). Chars without mapping keep
+        their byte value.
+        """
+        cells = bytearray(''.join(lines), 'latin-1')
+        if translation:
+            table = bytearray(range(256))
+            for char, value in translation.items():
+                table[ord(char)] = value
+            cells = cells.translate(table)
+        return DenseGrid(len(lines), len(lines[0]) if lines else 0, cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def copy(self) -> 'DenseGrid':
+        return DenseGrid(self.row_count, self.col_count, self.cells[:])
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.col_count + col
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        return divmod(index, self.col_count)
+
+    def coordinates_within_bounds(self, row, col) -> bool:
+        """
+        Check if the coordinates are within the map bounds.
+        :param row:
+        :param col:
+        :return: True if they are, false if not.
+        """
+        return 0 <= row < self.row_count and 0 <= col < self.col_count
+
+    def get(self, row: int, col: int) -> int:
+        """
+        :raise OutOfBoundsError: If the coordinates fall outside the grid.
+        """
+        if not self.coordinates_within_bounds(row, col):
+            raise OutOfBoundsError()
+        return self.cells[row * self.col_count + col]
+
+    def set(self, row: int, col: int, value: int) -> None:
+        """
+        :raise OutOfBoundsError: If the coordinates fall outside the grid.
+        """
+        if not self.coordinates_within_bounds(row, col):
+            raise OutOfBoundsError()
+        self.cells[row * self.col_count + col] = value
+
+    def get_next_index_in_direction(self, index: int, direction: Direction) -> int:
+        """
+        Flat index of the cell next to given one in given direction.
+        :raise OutOfBoundsError: If the new cell falls outside the grid.
+        """
+        row, col = divmod(index, self.col_count)
+        new_row = row + direction.value[0]
+        new_col = col + direction.value[1]
+        if not self.coordinates_within_bounds(new_row, new_col):
+            raise OutOfBoundsError()
+        return new_row * self.col_count + new_col
+
+    def get_cardinal_neighbouring_indices(
+        self, index: int, include_out_of_bounds: bool = True
+    ) -> dict[Direction, Optional[int]]:
+        """
+        Get flat indices of all neighbouring cells in cardinal directions.
+        :param index:
+        :param include_out_of_bounds: If true, cells out of bounds will return as None under direction key. If false,
+        the direction itself will be left out of keys.
+        :return: Dictionary where keys are directions and values the indices.
+        """
+        row, col = divmod(index, self.col_count)
+        neighbours = {}
+        for direction in Direction.get_cardinal():
+            new_row = row + direction.value[0]
+            new_col = col + direction.value[1]
+            if self.coordinates_within_bounds(new_row, new_col):
+                neighbours[direction] = new_row * self.col_count + new_col
+            elif include_out_of_bounds:
+                neighbours[direction] = None
+        return neighbours
+
+    @property
+    def cardinal_neighbour_table(self) -> NeighbourTable:
+        if 'cardinal' not in self._neighbour_tables:
+            self._neighbour_tables['cardinal'] = get_cardinal_neighbour_table(self.row_count, self.col_count)
+        return self._neighbour_tables['cardinal']
+
+    @property
+    def omnidirectional_neighbour_table(self) -> NeighbourTable:
+        if 'omnidirectional' not in self._neighbour_tables:
+            self._neighbour_tables['omnidirectional'] = get_omnidirectional_neighbour_table(
+                self.row_count, self.col_count
+            )
+        return self._neighbour_tables['omnidirectional']
+
+    def find_all(self, value: int) -> list[int]:
+        """
+        :return: Flat indices of all cells holding the value, in row-major order.
+        """
+        if isinstance(self.cells, bytearray):
+            indices = []
+            position = self.cells.find(value)
+            while position != -1:
+                indices.append(position)
+                position = self.cells.find(value, position + 1)
+            return indices
+        return [index for index, cell in enumerate(self.cells) if cell == value]
+
+    def iter_values(self, indices: Iterable[int]) -> Iterable[int]:
+        cells = self.cells
+        return (cells[index] for index in indices)
+
+    def shifted(self, direction: Direction, fill: int = 0) -> 'DenseGrid':
+        """
+        Whole-grid neighbour lookup: cell of the result holds the value of its neighbour in given direction (fill
+        where the neighbour is out of bounds). Lets a day compare every cell with its neighbour at once instead of
+        cell by cell. Uses NumPy when available, row slices otherwise.
+        """
+        row_diff, col_diff = direction.value
+        if numpy is not None:
+            return self._shifted_numpy(row_diff, col_diff, fill)
+
+        result = DenseGrid(self.row_count, self.col_count, typecode=self._typecode(), fill=fill)
+        copied_width = self.col_count - abs(col_diff)
+        if copied_width <= 0:
+            return result
+        for row in range(max(0, -row_diff), min(self.row_count, self.row_count - row_diff)):
+            source_start = (row + row_diff) * self.col_count + max(0, col_diff)
+            target_start = row * self.col_count + max(0, -col_diff)
+            result.cells[target_start:target_start + copied_width] = \
+                self.cells[source_start:source_start + copied_width]
+        return result
+
+    def _shifted_numpy(self, row_diff: int, col_diff: int, fill: int) -> 'DenseGrid':
+        source = self.to_numpy()
+        target = numpy.full_like(source, fill)
+        rows, cols = self.row_count, self.col_count
+        target[max(0, -row_diff):rows - max(0, row_diff), max(0, -col_diff):cols - max(0, col_diff)] = \
+            source[max(0, row_diff):rows - max(0, -row_diff), max(0, col_diff):cols - max(0, -col_diff)]
+        cells = bytearray(target.tobytes()) if self._typecode() == 'B' else array(self._typecode(), target.tobytes())
+        return DenseGrid(rows, cols, cells)
+
+    def _typecode(self) -> str:
+        return 'B' if isinstance(self.cells, bytearray) else self.cells.typecode
+
+    def to_numpy(self):
+        """
+        :raise RunException: If NumPy is not installed.
+        :return: Two dimensional NumPy array sharing memory with the grid.
+        """
+        if numpy is None:
+            raise RunException('NumPy is not installed')
+        dtype = numpy.uint8 if isinstance(self.cells, bytearray) else numpy.dtype(self.cells.typecode)
+        return numpy.frombuffer(self.cells, dtype=dtype).reshape(self.row_count, self.col_count)
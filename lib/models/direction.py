@@ -76,3 +76,16 @@ class Direction(Enum):
             Direction.DOWN,
             Direction.LEFT,
         ]
+
+    @staticmethod
+    def get_omnidirectional() -> list['Direction']:
+        return [
+            Direction.UP,
+            Direction.UP_RIGHT,
+            Direction.RIGHT,
+            Direction.DOWN_RIGHT,
+            Direction.DOWN,
+            Direction.DOWN_LEFT,
+            Direction.LEFT,
+            Direction.UP_LEFT,
+        ]
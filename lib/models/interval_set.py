@@ -0,0 +1,184 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Optional
+
+from lib.models.generic_range import CustomRange
+
+
+class IntervalSet:
+    """
+    Set of integers stored as sorted, non-overlapping and non-touching inclusive ranges (the same <start;end>
+    convention as CustomRange). Lookups use bisect, so the ranges are never iterated element by element.
+    """
+    __slots__ = ['starts', 'ends']
+
+    def __init__(self, ranges: Iterable[CustomRange] = ()):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        for custom_range in sorted(ranges, key=lambda r: r.start):
+            self._append_sorted(custom_range.start, custom_range.end)
+
+    @staticmethod
+    def from_bounds(bounds: Iterable[tuple[int, int]]) -> 'IntervalSet':
+        """
+        Create set from inclusive (start, end) pairs, empty pairs with start > end are skipped the same way add does.
+        """
+        interval_set = IntervalSet()
+        for start, end in sorted(bounds):
+            if start <= end:
+                interval_set._append_sorted(start, end)
+        return interval_set
+
+    def _append_sorted(self, start: int, end: int) -> None:
+        # start is never smaller than start of the last range
+        if self.ends and start <= self.ends[-1] + 1:
+            if end > self.ends[-1]:
+                self.ends[-1] = end
+        else:
+            self.starts.append(start)
+            self.ends.append(end)
+
+    def copy(self) -> 'IntervalSet':
+        interval_set = IntervalSet()
+        interval_set.starts = self.starts.copy()
+        interval_set.ends = self.ends.copy()
+        return interval_set
+
+    def __str__(self):
+        return '{' + ', '.join(str(custom_range) for custom_range in self) + '}'
+
+    def __repr__(self):
+        return str(self)
+
+    def __iter__(self) -> Iterator[CustomRange]:
+        return (CustomRange(start, end) for start, end in zip(self.starts, self.ends))
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, IntervalSet) and self.starts == other.starts and self.ends == other.ends
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect_right(self.starts, value) - 1
+        return index >= 0 and value <= self.ends[index]
+
+    @property
+    def range_count(self) -> int:
+        return len(self.starts)
+
+    @property
+    def coverage(self) -> int:
+        """
+        :return: Count of integers in the set.
+        """
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    @property
+    def min(self) -> Optional[int]:
+        return self.starts[0] if self.starts else None
+
+    @property
+    def max(self) -> Optional[int]:
+        return self.ends[-1] if self.ends else None
+
+    def add(self, start: int, end: int) -> None:
+        """
+        Add all integers of <start;end>, merging with overlapping and touching ranges.
+        """
+        if start > end:
+            return
+        first = bisect_left(self.ends, start - 1)  # first range that ends at or after start - 1
+        last = bisect_right(self.starts, end + 1)  # ranges before this one start at or before end + 1
+        if first < last:
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+        self.starts[first:last] = [start]
+        self.ends[first:last] = [end]
+
+    def add_range(self, custom_range: CustomRange) -> None:
+        self.add(custom_range.start, custom_range.end)
+
+    def remove(self, start: int, end: int) -> None:
+        """
+        Remove all integers of <start;end>, ranges partially covered get trimmed or split.
+        """
+        if start > end:
+            return
+        first = bisect_left(self.ends, start)  # first range that ends at or after start
+        last = bisect_right(self.starts, end)  # ranges before this one start at or before end
+        if first >= last:
+            return
+        new_starts, new_ends = [], []
+        if self.starts[first] < start:
+            new_starts.append(self.starts[first])
+            new_ends.append(start - 1)
+        if self.ends[last - 1] > end:
+            new_starts.append(end + 1)
+            new_ends.append(self.ends[last - 1])
+        self.starts[first:last] = new_starts
+        self.ends[first:last] = new_ends
+
+    def remove_range(self, custom_range: CustomRange) -> None:
+        self.remove(custom_range.start, custom_range.end)
+
+    def union(self, other: 'IntervalSet') -> 'IntervalSet':
+        return IntervalSet.from_bounds(list(zip(self.starts, self.ends)) + list(zip(other.starts, other.ends)))
+
+    def intersection(self, other: 'IntervalSet') -> 'IntervalSet':
+        result = IntervalSet()
+        i, j = 0, 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start <= end:
+                result._append_sorted(start, end)
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+    def difference(self, other: 'IntervalSet') -> 'IntervalSet':
+        result = IntervalSet()
+        j = 0
+        for start, end in zip(self.starts, self.ends):
+            while j < len(other.starts) and other.ends[j] < start:
+                j += 1
+            k = j
+            while start <= end and k < len(other.starts) and other.starts[k] <= end:
+                if other.starts[k] > start:
+                    result._append_sorted(start, other.starts[k] - 1)
+                start = max(start, other.ends[k] + 1)
+                k += 1
+            if start <= end:
+                result._append_sorted(start, end)
+        return result
+
+    def clipped(self, start: int, end: int) -> 'IntervalSet':
+        """
+        :return: Part of the set within <start;end>.
+        """
+        return self.intersection(IntervalSet.from_bounds([(start, end)]))
+
+    def gaps(self, start: int, end: int) -> list[CustomRange]:
+        """
+        :return: Ranges within <start;end> not covered by the set.
+        """
+        return list(IntervalSet.from_bounds([(start, end)]).difference(self))
+
+    def map_offsets(self, mapping: Iterable[tuple[CustomRange, int]]) -> 'IntervalSet':
+        """
+        Move parts of the set covered by source ranges of the mapping by the offset of that source range, parts not
+        covered by any source range stay in place. Source ranges must not overlap each other.
+        :param mapping: Pairs of source range and offset to add to its integers.
+        :return: New set with the mapped values.
+        """
+        mapped_bounds = []
+        unmapped = self
+        for source_range, offset in mapping:
+            source = IntervalSet.from_bounds([(source_range.start, source_range.end)])
+            covered = self.intersection(source)
+            mapped_bounds.extend((s + offset, e + offset) for s, e in zip(covered.starts, covered.ends))
+            unmapped = unmapped.difference(source)
+        mapped_bounds.extend(zip(unmapped.starts, unmapped.ends))
+        return IntervalSet.from_bounds(mapped_bounds)
@@ -0,0 +1,84 @@
+from array import array
+from typing import Iterator
+
+from lib.models.direction import Direction
+
+
+NO_NEIGHBOUR = -1
+# signed typecodes from the smallest, the first one able to hold every cell index of the grid is used
+INDEX_TYPECODES = ('i', 'l', 'q')
+
+
+def index_typecode(cell_count: int) -> str:
+    """
+    :return: Smallest signed array typecode holding indices 0..cell_count-1 as well as NO_NEIGHBOUR.
+    """
+    for typecode in INDEX_TYPECODES:
+        if cell_count <= 1 << (8 * array(typecode).itemsize - 1):
+            return typecode
+    return INDEX_TYPECODES[-1]
+
+
+class NeighbourTable:
+    """
+    Precomputed flat-index neighbours of every cell of a grid with given shape. For each direction there is one array
+    holding the index of the neighbour of each cell, or NO_NEIGHBOUR at the edge, so iterating neighbours needs no
+    bounds checks, no exceptions and no new objects per cell. Indices use the smallest typecode fitting the grid.
+    """
+    __slots__ = ['row_count', 'col_count', 'directions', 'tables']
+
+    def __init__(self, row_count: int, col_count: int, directions: tuple[Direction, ...]):
+        self.row_count = row_count
+        self.col_count = col_count
+        self.directions = directions
+        self.tables = tuple(self._build_direction_table(direction) for direction in directions)
+
+    def _build_direction_table(self, direction: Direction) -> array:
+        row_diff, col_diff = direction.value
+        row_count, col_count = self.row_count, self.col_count
+        typecode = index_typecode(row_count * col_count)
+        table = array(typecode, [NO_NEIGHBOUR]) * (row_count * col_count)
+        col_start, col_end = max(0, -col_diff), min(col_count, col_count - col_diff)
+        if col_start >= col_end:
+            return table
+        offset = row_diff * col_count + col_diff
+        for row in range(max(0, -row_diff), min(row_count, row_count - row_diff)):
+            start = row * col_count
+            neighbours = range(start + col_start + offset, start + col_end + offset)
+            table[start + col_start:start + col_end] = array(typecode, neighbours)
+        return table
+
+    def table_for(self, direction: Direction) -> array:
+        return self.tables[self.directions.index(direction)]
+
+    def iter_neighbours(self, index: int) -> Iterator[int]:
+        """
+        Yield flat indices of all in-bounds neighbours of the cell.
+        """
+        for table in self.tables:
+            neighbour = table[index]
+            if neighbour != NO_NEIGHBOUR:
+                yield neighbour
+
+    def iter_neighbours_with_directions(self, index: int) -> Iterator[tuple[Direction, int]]:
+        """
+        Yield (direction, neighbour index) pairs for every direction, neighbour index is NO_NEIGHBOUR at the edge.
+        """
+        for direction, table in zip(self.directions, self.tables):
+            yield direction, table[index]
+
+
+def get_neighbour_table(row_count: int, col_count: int, directions: tuple[Direction, ...]) -> NeighbourTable:
+    """
+    Build neighbour table for the grid shape. Nothing is cached here, grids keep the tables they built themselves
+    so the tables are freed together with the grid.
+    """
+    return NeighbourTable(row_count, col_count, directions)
+
+
+def get_cardinal_neighbour_table(row_count: int, col_count: int) -> NeighbourTable:
+    return get_neighbour_table(row_count, col_count, tuple(Direction.get_cardinal()))
+
+
+def get_omnidirectional_neighbour_table(row_count: int, col_count: int) -> NeighbourTable:
+    return get_neighbour_table(row_count, col_count, tuple(Direction.get_omnidirectional()))
@@ -1,11 +1,13 @@
 import pathlib
 from importlib import import_module
 from os.path import sep
+from typing import Optional
 
 from helpers import pretty_print_result
-from helpers import timethis
+from helpers import timethis, print_timing
 from helpers.input_loader import InputLoader
 from lib.abstract_day import AbstractDay
+from lib.answer_cache import AnswerCache
 from lib.exceptions import RunException
 
 
@@ -21,10 +23,13 @@ class Runner:
             raise RunException(e.msg)
 
     @staticmethod
-    def _construct_input_loader(day, year) -> InputLoader:
+    def _input_filepath(day, year) -> pathlib.Path:
         local_filepath = '.' + sep + 'year' + str(year) + sep + 'inputs' + sep + 'day' + str(day) + '_input'
-        filepath = pathlib.Path(local_filepath).resolve()
-        return InputLoader(filepath)
+        return pathlib.Path(local_filepath).resolve()
+
+    @staticmethod
+    def _construct_input_loader(day, year) -> InputLoader:
+        return InputLoader(Runner._input_filepath(day, year))
 
     @staticmethod
     def _run_with_conditioned_timing(func, timeit):
@@ -33,12 +38,57 @@ class Runner:
         return func()
 
     @staticmethod
-    def run(day, year, part, timeit):
+    def _run_part_with_conditioned_timing(runner: AbstractDay, func, timeit):
+        result = Runner._run_with_conditioned_timing(func, timeit)
+        for name, seconds in runner.pop_recorded_timings():
+            if timeit:
+                print_timing(name, seconds)
+        return result
+
+    @staticmethod
+    def _prepare_parsed_input(runner: AbstractDay, timeit):
+        """
+        Parse the input ahead of the parts, so that with timing enabled the parse time is reported on its own
+        instead of being included in the first part.
+        """
+        if runner.has_parse_stage() and not runner.is_input_parsed:
+            Runner._run_with_conditioned_timing(runner.prepare_parsed_input, timeit)
+
+    @staticmethod
+    def prepare_day_runner(day, year, workers=None) -> AbstractDay:
         runner = Runner._import_day_runner(day, year)
         runner.add_input_loader(Runner._construct_input_loader(day, year))
-        if part == 0 or part == 1:
-            result = Runner._run_with_conditioned_timing(runner.run_part_one, timeit)
-            pretty_print_result(year, day, 1, result)
-        if part == 0 or part == 2:
-            result = Runner._run_with_conditioned_timing(runner.run_part_two, timeit)
-            pretty_print_result(year, day, 2, result)
+        runner.add_worker_count(workers)
+        return runner
+
+    @staticmethod
+    def get_part_function(runner: AbstractDay, part):
+        return runner.run_part_one if part == 1 else runner.run_part_two
+
+    @staticmethod
+    def run_part_cached(runner: AbstractDay, day, year, part, cache: Optional[AnswerCache], timeit=False):
+        """
+        Run one part, answering from the cache when neither the input nor the solver sources changed.
+        :return: Pair of the result and flag whether it came from the cache.
+        """
+        func = Runner.get_part_function(runner, part)
+        if cache is None or not runner.is_part_cacheable(part):
+            Runner._prepare_parsed_input(runner, timeit)
+            return Runner._run_part_with_conditioned_timing(runner, func, timeit), False
+        key = cache.make_key(day, year, part, Runner._input_filepath(day, year))
+        hit, result = cache.get(key)
+        if hit:
+            return result, True
+        Runner._prepare_parsed_input(runner, timeit)
+        result = Runner._run_part_with_conditioned_timing(runner, func, timeit)
+        cache.put(key, result)
+        return result, False
+
+    @staticmethod
+    def run(day, year, part, timeit, use_cache=True, workers=None):
+        runner = Runner.prepare_day_runner(day, year, workers)
+        cache = AnswerCache() if use_cache else None
+        for selected_part in (1, 2):
+            if part == 0 or part == selected_part:
+                result, cached = Runner.run_part_cached(runner, day, year, selected_part, cache, timeit)
+                pretty_print_result(year, day, selected_part, result, cached)
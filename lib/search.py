@@ -0,0 +1,183 @@
+import heapq
+import math
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Union
+
+from lib.models.neighbour_table import NO_NEIGHBOUR, get_cardinal_neighbour_table, NeighbourTable
+
+
+Cost = Union[int, float]
+NeighbourFunction = Callable[[int], Iterable[int]]
+WeightedNeighbourFunction = Callable[[int], Iterable[tuple[int, Cost]]]
+TargetFunction = Callable[[int], bool]
+
+UNREACHED = -1
+
+
+@dataclass
+class SearchResult:
+    """
+    Outcome of a search over nodes numbered 0..node_count-1 (for grids the flat cell index).
+    distances hold UNREACHED (BFS) or math.inf (weighted searches) for nodes the search did not get to.
+    """
+    distances: Union[array, list[Cost]]
+    target: Optional[int] = None
+    predecessors: Optional[array] = None
+
+    @property
+    def target_distance(self) -> Optional[Cost]:
+        return None if self.target is None else self.distances[self.target]
+
+    def reached(self, node: int) -> bool:
+        distance = self.distances[node]
+        return distance != UNREACHED and distance != math.inf
+
+    def path_to(self, node: int) -> list[int]:
+        """
+        Reconstruct the path from (one of) the sources to the node, both included.
+        :raise ValueError: If the search did not track paths or did not reach the node.
+        """
+        if self.predecessors is None:
+            raise ValueError('Search was run without path tracking')
+        if not self.reached(node):
+            raise ValueError(f'Node {node} was not reached')
+        path = [node]
+        while self.predecessors[node] != UNREACHED:
+            node = self.predecessors[node]
+            path.append(node)
+        path.reverse()
+        return path
+
+
+def _new_predecessors(node_count: int, track_paths: bool) -> Optional[array]:
+    return array('q', [UNREACHED]) * node_count if track_paths else None
+
+
+def bfs(node_count: int, start: int, neighbours: NeighbourFunction, is_target: Optional[TargetFunction] = None,
+        track_paths: bool = False) -> SearchResult:
+    """
+    Breadth first search over unweighted graph.
+    :param node_count: Nodes are numbered 0..node_count-1.
+    :param start:
+    :param neighbours: Function giving nodes reachable from a node in one step.
+    :param is_target: If given, search stops at the first node it accepts.
+    :param track_paths: Keep predecessors so that SearchResult.path_to works.
+    """
+    return multi_source_bfs(node_count, [start], neighbours, is_target, track_paths)
+
+
+def multi_source_bfs(node_count: int, starts: Iterable[int], neighbours: NeighbourFunction,
+                     is_target: Optional[TargetFunction] = None, track_paths: bool = False) -> SearchResult:
+    """
+    Breadth first search started from all the nodes at once, distance of a node is distance to the closest start.
+    Parameters are the same as for bfs.
+    """
+    distances = array('q', [UNREACHED]) * node_count
+    predecessors = _new_predecessors(node_count, track_paths)
+    queue = deque()
+    for start in starts:
+        if distances[start] == UNREACHED:
+            distances[start] = 0
+            queue.append(start)
+            if is_target is not None and is_target(start):
+                return SearchResult(distances, start, predecessors)
+
+    while queue:
+        node = queue.popleft()
+        next_distance = distances[node] + 1
+        for neighbour in neighbours(node):
+            if distances[neighbour] != UNREACHED:
+                continue
+            distances[neighbour] = next_distance
+            if predecessors is not None:
+                predecessors[neighbour] = node
+            if is_target is not None and is_target(neighbour):
+                return SearchResult(distances, neighbour, predecessors)
+            queue.append(neighbour)
+
+    return SearchResult(distances, None, predecessors)
+
+
+def dijkstra(node_count: int, starts: Iterable[int], neighbours: WeightedNeighbourFunction,
+             is_target: Optional[TargetFunction] = None, track_paths: bool = False) -> SearchResult:
+    """
+    Heap based Dijkstra search, costs need to be non-negative.
+    :param neighbours: Function giving (neighbour, cost of the step) pairs of a node.
+    Other parameters are the same as for multi_source_bfs.
+    """
+    return a_star(node_count, starts, neighbours, lambda node: 0, is_target, track_paths)
+
+
+def a_star(node_count: int, starts: Iterable[int], neighbours: WeightedNeighbourFunction,
+           heuristic: Callable[[int], Cost], is_target: Optional[TargetFunction] = None,
+           track_paths: bool = False) -> SearchResult:
+    """
+    A* search. Closed nodes are never reopened, so the heuristic has to be consistent (h(node) <= cost of the step
+    + h(neighbour), e.g. manhattan distance on grid) for the distance of the target to be optimal. Being admissible
+    (never overestimating) is not enough.
+    :param heuristic: Estimated remaining cost from a node to the target.
+    Other parameters are the same as for dijkstra.
+    """
+    distances = [math.inf] * node_count
+    predecessors = _new_predecessors(node_count, track_paths)
+    closed = bytearray(node_count)
+    heap = []
+    for start in starts:
+        distances[start] = 0
+        heapq.heappush(heap, (heuristic(start), start))
+
+    while heap:
+        _, node = heapq.heappop(heap)
+        if closed[node]:
+            continue
+        closed[node] = 1
+        if is_target is not None and is_target(node):
+            return SearchResult(distances, node, predecessors)
+        node_distance = distances[node]
+        for neighbour, cost in neighbours(node):
+            new_distance = node_distance + cost
+            if closed[neighbour] or new_distance >= distances[neighbour]:
+                continue
+            distances[neighbour] = new_distance
+            if predecessors is not None:
+                predecessors[neighbour] = node
+            heapq.heappush(heap, (new_distance + heuristic(neighbour), neighbour))
+
+    return SearchResult(distances, None, predecessors)
+
+
+def grid_neighbours(grid, can_move: Optional[Callable[[int, int], bool]] = None,
+                    neighbour_table: Optional[NeighbourTable] = None) -> NeighbourFunction:
+    """
+    Neighbour function for grid models from lib.models (DenseGrid, GenericMapRepresentation), nodes are flat
+    cell indices row * col_count + col.
+    :param grid:
+    :param can_move: Optional check whether step from one cell index to the other is allowed.
+    :param neighbour_table: Defaults to cardinal neighbours of the grid.
+    """
+    if neighbour_table is None:
+        neighbour_table = get_cardinal_neighbour_table(grid.row_count, grid.col_count)
+    tables = neighbour_table.tables
+
+    def neighbours(node: int) -> Iterable[int]:
+        for table in tables:
+            neighbour = table[node]
+            if neighbour != NO_NEIGHBOUR and (can_move is None or can_move(node, neighbour)):
+                yield neighbour
+
+    return neighbours
+
+
+def manhattan_heuristic(grid, target: int) -> Callable[[int], int]:
+    """
+    Manhattan distance to the target cell, consistent heuristic for cardinal moves with cost of at least 1.
+    """
+    target_row, target_col = divmod(target, grid.col_count)
+
+    def heuristic(node: int) -> int:
+        row, col = divmod(node, grid.col_count)
+        return abs(row - target_row) + abs(col - target_col)
+
+    return heuristic
@@ -1,6 +1,10 @@
-from lib.exceptions import RunException, ConstructionException, ArgumentException
+import sys
+
+from lib.exceptions import RunException, ConstructionException, ArgumentException, BenchmarkRegressionException
 from helpers import CC
 from lib.runner import Runner
+from lib.batch_runner import BatchRunner, BatchJob
+from lib.benchmark import Benchmark
 from lib.scaffold_constructor import ScaffoldConstructor
 from lib.argument_parser import ArgumentParser
 
@@ -8,8 +12,17 @@ from lib.argument_parser import ArgumentParser
 def main():
     try:
         args = ArgumentParser().parse()
-        if args.run:
-            Runner.run(args.day, args.year, args.part, args.timeit)
+        if args.bench is not None:
+            if args.batch:
+                jobs = BatchRunner.collect_jobs(args.batch_years, args.batch_days, args.part)
+            else:
+                jobs = [BatchJob(args.year, args.day, part) for part in (1, 2) if args.part in (0, part)]
+            Benchmark.run(jobs, args.bench, args.warmup, args.threshold, args.save_baseline, args.workers)
+        elif args.batch:
+            BatchRunner.run(args.batch_years, args.batch_days, args.part, args.batch_workers, args.use_cache,
+                            args.workers)
+        elif args.run:
+            Runner.run(args.day, args.year, args.part, args.timeit, args.use_cache, args.workers)
         else:
             ScaffoldConstructor.construct(args.day, args.year)
 
@@ -17,6 +30,9 @@ def main():
         print(CC.RED, 'Argument Error: ', CC.NC, ex, sep='')
     except ConstructionException as ex:
         print(CC.RED, 'Construction Error: ', CC.NC, ex, sep='')
+    except BenchmarkRegressionException as ex:
+        print(CC.RED, 'Benchmark Regression: ', CC.NC, ex, sep='')
+        sys.exit(1)
     except RunException as ex:
         print(CC.RED, 'Run Error: ', CC.NC, ex, sep='')
 
@@ -13,18 +13,15 @@ class Computer:
     def __init__(self, instructions):
         self.x = 1
         self.cycle = 1
-        self.instructions = instructions
-        self.instructions_index = 0
+        self.instructions = iter(instructions)
         self.next_addx_value = 0
         self.next_function = self._get_next_function()
 
     def _get_next_instruction_string(self) -> List[str]:
         try:
-            instruction = self.instructions[self.instructions_index].split(" ")
-        except IndexError:
+            return next(self.instructions).split(" ")
+        except StopIteration:
             raise LastInstructionException()
-        self.instructions_index += 1
-        return instruction
 
     def _get_next_function(self):
         instruction = self._get_next_instruction_string()
@@ -87,6 +84,8 @@ def part_two(input_array, display_lenght, display_height):
 
 
 class DayRunner(AbstractDay):
+    cacheable_parts = (1,)  # part two draws the answer to the terminal
+
     def __init__(self):
         self.input_loader: Union[InputLoader, None] = None
 
@@ -94,11 +93,11 @@ class DayRunner(AbstractDay):
         self.input_loader = input_loader
 
     def run_part_one(self):
-        input_array = self.input_loader.load_input_array("\n")
-        result = part_one(input_array, [20, 60, 100, 140, 180, 220], 220)
+        input_lines = self.input_loader.load_input_as_generator("\n")
+        result = part_one(input_lines, [20, 60, 100, 140, 180, 220], 220)
         return result
 
     def run_part_two(self):
-        input_array = self.input_loader.load_input_array("\n")
-        part_two(input_array, 40, 6)
+        input_lines = self.input_loader.load_input_as_generator("\n")
+        part_two(input_lines, 40, 6)
         return 'See terminal'
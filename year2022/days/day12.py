@@ -1,16 +1,8 @@
-from enum import Enum
-from typing import Union
+from typing import Optional, Union
 from lib.abstract_day import AbstractDay
 from helpers.input_loader import InputLoader
 from lib.exceptions import RunException
-
-
-class OutOfBoundsError(RunException):
-    pass
-
-
-class AlreadyVisitedError(RunException):
-    pass
+from lib.search import grid_neighbours, multi_source_bfs
 
 
 def letter_to_height(letter):
@@ -23,13 +15,6 @@ def letter_to_height(letter):
     raise RunException(f"Given letter {letter} is not a-z nor S or E, the only allowed letters.")
 
 
-class Direction(Enum):
-    UP = (-1, 0)
-    LEFT = (0, -1)
-    DOWN = (1, 0)
-    RIGHT = (0, 1)
-
-
 class Field:
     def __init__(self, row, col, letter_height, field_id):
         self.height = letter_to_height(letter_height)
@@ -69,109 +54,26 @@ class Map:
                 if self.start and self.end:
                     return
 
-    def _coordinates_within_bounds(self, row, col):
-        return 0 <= row < self.row_count and 0 <= col < self.col_count
-
-    def grab_relative_field(self, field, direction):
-        new_row = field.row + direction.value[0]
-        new_col = field.col + direction.value[1]
-        if not self._coordinates_within_bounds(new_row, new_col):
-            raise OutOfBoundsError()
-        new_field = self.fields[new_row][new_col]
-        return new_field
-
-
-class Route:
-    def __init__(self, og_route=None):
-        if og_route:
-            self.visited = og_route.visited.copy()
-        else:
-            self.visited = []
-        self.last_field = None
-
-    def visited_field(self, field: Field):
-        return field.id in self.visited
-
-    def route_length(self):
-        return len(self.visited) - 1
-
-    def add_visited(self, field: Field):
-        if self.visited_field(field):
-            raise AlreadyVisitedError(f"This route already visited {field.id}")
-        self.visited.append(field.id)
-        self.last_field = field
-
 
 class RouteFinder:
     def __init__(self, height_map):
         self.map = height_map
-        self.best_waypoints = {}
-        self.routes_to_check = []
-        self.best_route_cost = None
-
-    def _move_possible(self, field: Field, direction: Direction):
-        try:
-            return self.map.grab_relative_field(field, direction).height <= field.height + 1
-        except OutOfBoundsError:
-            return False
-
-    def _reverse_move_possible(self, field: Field, direction: Direction):
-        try:
-            return self.map.grab_relative_field(field, direction).height + 1 >= field.height
-        except OutOfBoundsError:
-            return False
-
-    def _note_cost_and_asses_worthiness(self, new_field, new_cost):
-        if new_field.id not in self.best_waypoints.keys():
-            self.best_waypoints[new_field.id] = new_cost
-            return True
-        if new_cost < self.best_waypoints[new_field.id]:
-            self.best_waypoints[new_field.id] = new_cost
-            return True
-        return False
-
-    def asign_best_result(self, new_route_length):
-        if not self.best_route_cost:
-            self.best_route_cost = new_route_length
-
-        if new_route_length < self.best_route_cost:
-            self.best_route_cost = new_route_length
-
-    def _check_route(self, route):
-        for direction in Direction:
-            if not self._move_possible(route.last_field, direction):
-                continue
-
-            new_field = self.map.grab_relative_field(route.last_field, direction)
-            if route.visited_field(new_field):
-                continue
-
-            new_route = Route(route)
-            new_route.add_visited(new_field)
-
-            if new_field.end:
-                new_route_length = new_route.route_length()
-                self.asign_best_result(new_route_length)
-                continue
-
-            if not self._note_cost_and_asses_worthiness(new_field, new_route.route_length()):
-                continue
-
-            self.routes_to_check.append(new_route)
+        self.heights = [field.height for row in height_map.fields for field in row]
 
-    def find_best_route_from_start(self):
-        current_field = self.map.start
-        default_route = Route()
-        default_route.add_visited(current_field)
-        self.routes_to_check.append(default_route)
+    def _move_possible(self, from_field_id, to_field_id):
+        return self.heights[to_field_id] <= self.heights[from_field_id] + 1
 
-        while True:
-            if len(self.routes_to_check) == 0:
-                break
-            next_route = self.routes_to_check.pop(0)
-            self._check_route(next_route)
+    def find_best_route(self, starts: list[Field]) -> Optional[int]:
+        result = multi_source_bfs(
+            node_count=len(self.heights),
+            starts=(start.id for start in starts),
+            neighbours=grid_neighbours(self.map, can_move=self._move_possible),
+            is_target=lambda field_id: field_id == self.map.end.id,
+        )
+        return result.target_distance
 
-        return self.best_route_cost
+    def find_best_route_from_start(self):
+        return self.find_best_route([self.map.start])
 
 
 def find_possible_start_fields(field_map):
@@ -184,22 +86,7 @@ def find_possible_start_fields(field_map):
 
 
 def part_two(field_map):
-    all_possible_starts = find_possible_start_fields(field_map)
-    field_map.start.start = False  # resets the fields flag that it is a start
-
-    best_route = None
-    for possible_start in all_possible_starts:
-        field_map.start = possible_start
-        possible_start.start = True
-
-        route_cost = RouteFinder(field_map).find_best_route_from_start()
-        if not best_route:
-            best_route = route_cost
-        if route_cost and route_cost < best_route:
-            best_route = route_cost
-
-        possible_start.start = False
-    return best_route
+    return RouteFinder(field_map).find_best_route(find_possible_start_fields(field_map))
 
 
 class DayRunner(AbstractDay):
@@ -209,14 +96,15 @@ class DayRunner(AbstractDay):
     def add_input_loader(self, input_loader):
         self.input_loader = input_loader
 
+    def parse(self):
+        return Map(self.input_loader.load_input_array("\n"))
+
     def run_part_one(self):
-        input_array = self.input_loader.load_input_array("\n")
-        field_map = Map(input_array)
+        field_map = self.get_parsed_input()
         result = RouteFinder(field_map).find_best_route_from_start()
         return result
 
     def run_part_two(self):
-        input_array = self.input_loader.load_input_array("\n")
-        field_map = Map(input_array)
+        field_map = self.get_parsed_input()
         result = part_two(field_map)
         return result
@@ -2,7 +2,7 @@ from typing import Union
 from lib.abstract_day import AbstractDay
 from helpers import regex_extract_multiple, InputLoader
 from lib.exceptions import RunException
-from lib.models import CustomRange as Range
+from lib.models import CustomRange as Range, IntervalSet
 
 """
 DIAGONAL SPACE explanation
@@ -159,24 +159,9 @@ def construct_sensors(input_array):
     return sensors
 
 
-def extract_scanned_ranges(distance_goal, sensors) -> list[Range]:
+def extract_scanned_ranges(distance_goal, sensors) -> IntervalSet:
     raw_ranges = [s.affected_range_on_y(distance_goal) for s in sensors]
-    ranges = [r for r in raw_ranges if r is not None]
-    ranges.sort(key=lambda r: r.start)
-    return ranges
-
-
-def process_range(r, last_checked_point) -> tuple[int, int]:
-    # range adds itself whole to the scanned points
-    if not last_checked_point or last_checked_point < r.start:
-        return r.end, (r.end - r.start + 1)
-
-    # range doesn't add anything to the scanned points
-    if last_checked_point > r.end:
-        return last_checked_point, 0
-
-    # range adds some to the scanned points
-    return r.end, r.end - last_checked_point
+    return IntervalSet(r for r in raw_ranges if r is not None)
 
 
 def beacon_count_on_y(sensors, y):
@@ -190,47 +175,47 @@ def beacon_count_on_y(sensors, y):
 
 
 def part_one(sensors, distance_goal):
-    ranges = extract_scanned_ranges(distance_goal, sensors)
-    checked_points = 0
-    last_checked_point = None
-    for r in ranges:
-        last_checked_point, new_checked_points = process_range(r, last_checked_point)
-        checked_points += new_checked_points
+    checked_points = extract_scanned_ranges(distance_goal, sensors).coverage
     checked_points -= beacon_count_on_y(sensors, distance_goal)
     return checked_points
 
 
-def find_not_covered_md(md_range: Range, scanner_md_ranges: list[Range]):
-    not_covered = []
-    scanner_md_ranges.sort(key=lambda x: x.start)
-    first_unscanned_md = md_range.start
-    for r in scanner_md_ranges:
-        if r.end < first_unscanned_md:
-            continue
-        elif r.start <= first_unscanned_md:
-            first_unscanned_md = r.end + 1
-        else:
-            not_covered.append(Range(first_unscanned_md, r.start - 1))
-            first_unscanned_md = r.end + 1
+def find_not_covered_md(md_range: Range, scanner_md_ranges: list[Range]) -> list[Range]:
+    return IntervalSet(scanner_md_ranges).gaps(md_range.start, md_range.end)
+
 
-    return not_covered
+def split_sd_range_by_active_sensors(sd_range: Range, sensors) -> list[tuple[Range, list[Sensor]]]:
+    """
+    Cut the sd range into segments in which the same set of sensors is active, so the md coverage is computed once
+    per segment instead of once per sd.
+    """
+    cut_points = {sd_range.start, sd_range.end + 1}
+    for sensor in sensors:
+        cut_points.update(sd for sd in (sensor.diagonal_min_sd, sensor.diagonal_max_sd + 1)
+                          if sd_range.start < sd <= sd_range.end)
+    cut_points = sorted(cut_points)
+    segments = []
+    for segment_start, next_segment_start in zip(cut_points, cut_points[1:]):
+        active_sensors = [s for s in sensors if s.diagonal_min_sd <= segment_start <= s.diagonal_max_sd]
+        segments.append((Range(segment_start, next_segment_start - 1), active_sensors))
+    return segments
 
 
 def part_two(sensors, max_xy_value):
     space = CartesianAndDiagonalSpaceBinding(max_xy_value)
-    sd_range = space.sd_possible_range()
-    sd = sd_range.start
+    widest_md_range = space.md_possible_range_for_fixed_sd(max_xy_value)
     unscanned = []
-    while sd <= sd_range.end:
-        md_range = space.md_possible_range_for_fixed_sd(sd)
-        sensor_md_ranges = [s.md_range for s in sensors if (s.diagonal_min_sd <= sd <= s.diagonal_max_sd)]
-        not_covered = find_not_covered_md(md_range, sensor_md_ranges)
-        if not_covered:
-            for r in not_covered:
-                for md in r:
+    for sd_segment, active_sensors in split_sd_range_by_active_sensors(space.sd_possible_range(), sensors):
+        # whole segment shares the gaps, only sd values where a gap reaches into the cartesian space are checked
+        for gap in find_not_covered_md(widest_md_range, [s.md_range for s in active_sensors]):
+            gap_distance_from_zero_md = 0 if gap.start <= 0 <= gap.end else min(abs(gap.start), abs(gap.end))
+            first_sd = max(sd_segment.start, gap_distance_from_zero_md)
+            last_sd = min(sd_segment.end, 2 * max_xy_value - gap_distance_from_zero_md)
+            for sd in range(first_sd, last_sd + 1):
+                md_range = space.md_possible_range_for_fixed_sd(sd)
+                for md in range(max(gap.start, md_range.start), min(gap.end, md_range.end) + 1):
                     if Coordinate.can_be_constructed_from_diagonal(md, sd):
                         unscanned.append(Coordinate.from_diagonal(md, sd))
-        sd += 1
 
     if len(unscanned) == 1:
         return int(unscanned[0].x * 4000000 + unscanned[0].y)
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Sequence, Union
 
 from lib.abstract_day import AbstractDay
 from lib.exceptions import RunException
@@ -13,32 +13,31 @@ class DayRunner(AbstractDay):
         self.input_loader = input_loader
 
     def run_part_one(self):
-        sequence = self.input_loader.load_input()
-        result = self.part_one(sequence)
+        with self.input_loader.map_input() as sequence:
+            result = self.part_one(sequence)
         return result
 
     def run_part_two(self):
-        sequence = self.input_loader.load_input()
-        result = self.part_two(sequence)
+        with self.input_loader.map_input() as sequence:
+            result = self.part_two(sequence)
         return result
 
-    def part_generalized(self, sequence: str, length: int) -> int:
-        last_chars = []
+    @staticmethod
+    def part_generalized(sequence: Sequence[int], length: int) -> int:
+        # sliding window over the raw bytes, window starts right after the last repeated character
+        last_seen_at = [-1] * 256
+        window_start = 0
         for i, char in enumerate(sequence):
-            last_chars.append(char)
-            if len(last_chars) < length:
-                continue
-            last_chars_set = set(last_chars)
-            if len(last_chars_set) == length:
-                self.dbg("last chars:", last_chars)
-                self.dbg("last chars set:", last_chars_set)
+            if last_seen_at[char] >= window_start:
+                window_start = last_seen_at[char] + 1
+            last_seen_at[char] = i
+            if i - window_start + 1 == length:
                 return i + 1
-            last_chars.pop(0)
 
         raise RunException('Sequence was supposed to be found.')
 
-    def part_one(self, sequence: str) -> int:
+    def part_one(self, sequence: Sequence[int]) -> int:
         return self.part_generalized(sequence, 4)
 
-    def part_two(self, sequence: str) -> int:
+    def part_two(self, sequence: Sequence[int]) -> int:
         return self.part_generalized(sequence, 14)
@@ -1,26 +1,16 @@
+from collections import Counter
 from typing import Optional
 
 from lib.abstract_day import AbstractDay
 from helpers import InputLoader
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-class IdList:
-    def __init__(self, id_list):
-        self.id_list = sorted(id_list)
-        self.id_list_generator = iter(self.id_list)
-        self.number_map = {}
-        for number in id_list:
-            if number not in self.number_map:
-                self.number_map[number] = 1
-            else:
-                self.number_map[number] += 1
 
-    def next_smallest(self) -> int:
-        """
-        :raises StopIteration: when id_list is exhausted
-        :return: next smallest id
-        """
-        return next(self.id_list_generator)
+BINCOUNT_MAX_ID = 1 << 24
 
 
 class DayRunner(AbstractDay):
@@ -30,44 +20,48 @@ class DayRunner(AbstractDay):
     def add_input_loader(self, input_loader):
         self.input_loader = input_loader
 
+    def parse(self):
+        return self.input_loader.load_input_int_columns(column_count=2, as_numpy=numpy is not None)
+
     def run_part_one(self):
-        input_array = self.input_loader.load_input_array(item_separator="\n")
-        first_id_list, second_id_list = assemble_id_lists(input_array)
-        result = calculate_list_distance(first_id_list, second_id_list)
-        return result
+        first_id_list, second_id_list = self.get_parsed_input()
+        return calculate_list_distance(first_id_list, second_id_list)
 
     def run_part_two(self):
-        input_array = self.input_loader.load_input_array(item_separator="\n")
-        first_id_list, second_id_list = assemble_id_lists(input_array)
-        result = calculate_item_similarity_score(first_id_list, second_id_list)
-        return result
-
-
-def assemble_id_lists(input_array: list[str]) -> tuple[IdList, IdList]:
-    first_list, second_list = [], []
-    for line in input_array:
-        first_item, second_item = (item for item in line.split(" ") if len(item) > 0)
-        first_list.append(int(first_item))
-        second_list.append(int(second_item))
-    return IdList(first_list), IdList(second_list)
-
-
-def calculate_list_distance(first_id_list: IdList, second_id_list: IdList) -> int:
-    distance_sum = 0
-    try:
-        while True:
-            first_item = first_id_list.next_smallest()
-            second_item = second_id_list.next_smallest()
-            distance_sum += abs(first_item - second_item)
-    except StopIteration:
-        pass
-
-    return distance_sum
-
-
-def calculate_item_similarity_score(first_id_list: IdList, second_id_list: IdList) -> int:
-    similarity_score = 0
-    for number, number_count in first_id_list.number_map.items():
-        if number in second_id_list.number_map:
-            similarity_score += number * number_count * second_id_list.number_map[number]
-    return similarity_score
+        first_id_list, second_id_list = self.get_parsed_input()
+        return calculate_item_similarity_score(first_id_list, second_id_list)
+
+
+def calculate_list_distance(first_id_list, second_id_list) -> int:
+    """
+    Sum of distances between the smallest ids of both lists, the second smallest ones and so on.
+    :param first_id_list: array('q') or NumPy array of ids
+    :param second_id_list: array('q') or NumPy array of ids
+    """
+    if numpy is not None and isinstance(first_id_list, numpy.ndarray):
+        return int(numpy.abs(numpy.sort(first_id_list) - numpy.sort(second_id_list)).sum())
+    return sum(
+        abs(first_item - second_item) for first_item, second_item in zip(sorted(first_id_list), sorted(second_id_list))
+    )
+
+
+def calculate_item_similarity_score(first_id_list, second_id_list) -> int:
+    """
+    Sum of every id of the first list multiplied by the number of its occurrences in the second list.
+    :param first_id_list: array('q') or NumPy array of ids
+    :param second_id_list: array('q') or NumPy array of ids
+    """
+    if numpy is not None and isinstance(first_id_list, numpy.ndarray):
+        if len(second_id_list) == 0:
+            return 0
+        if second_id_list.min() >= 0 and second_id_list.max() <= BINCOUNT_MAX_ID:
+            # ids are small enough to count them directly by value
+            counts = numpy.bincount(second_id_list)
+            known = (first_id_list >= 0) & (first_id_list < len(counts))
+            return int((first_id_list[known] * counts[first_id_list[known]]).sum())
+        values, counts = numpy.unique(second_id_list, return_counts=True)
+        positions = numpy.searchsorted(values, first_id_list).clip(max=len(values) - 1)
+        matching = values[positions] == first_id_list
+        return int((first_id_list[matching] * counts[positions[matching]]).sum())
+    second_id_counts = Counter(second_id_list)
+    return sum(number * second_id_counts[number] for number in first_id_list)
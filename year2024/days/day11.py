@@ -1,66 +1,12 @@
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 
 from helpers import InputLoader
 from lib.abstract_day import AbstractDay
 
 
-class StoneRule(Enum):
-    MAKE_ONE = 0
-    SPLIT = 1
-    MULTIPLY = 2
-
-
-@dataclass
-class StoneState:
-    value: int
-    count: int = 1
-
-    def applicable_rule(self) -> StoneRule:
-        if self.value == 0:
-            return StoneRule.MAKE_ONE
-        if len(str(self.value)) % 2 == 0:
-            return StoneRule.SPLIT
-        return StoneRule.MULTIPLY
-
-
-@dataclass
-class BasicStoneLine:
-    stones: dict[int, StoneState] = field(default_factory=dict)
-
-    def execute_blink(self) -> None:
-        stones = list(self.stones.values())
-        self.stones = {}
-        for stone in stones:
-            stone_rule = stone.applicable_rule()
-            self.apply_rule_to_stone_and_save(stone, stone_rule)
-
-    def apply_rule_to_stone_and_save(self, stone: StoneState, rule: StoneRule) -> None:
-        if rule == StoneRule.MAKE_ONE:
-            self.add_stone(StoneState(value=1, count=stone.count))
-            return
-
-        if rule == StoneRule.MULTIPLY:
-            self.add_stone(StoneState(value=stone.value*2024, count=stone.count))
-            return
-
-        # StoneRule.SPLIT
-        value_as_string = str(stone.value)
-        firstpart, secondpart = value_as_string[:len(value_as_string) // 2], value_as_string[len(value_as_string) // 2:]
-        first_new_stone = StoneState(value=int(firstpart), count=stone.count)
-        second_new_stone = StoneState(value=int(secondpart), count=stone.count)
-        self.add_stone(first_new_stone)
-        self.add_stone(second_new_stone)
-
-    def add_stone(self, stone: StoneState) -> None:
-        if stone.value in self.stones:
-            self.stones[stone.value].count += stone.count
-        else:
-            self.stones[stone.value] = stone
-
-    def count_stones(self) -> int:
-        return sum(stone.count for stone in self.stones.values())
+POWERS_OF_TEN = [10 ** exponent for exponent in range(64)]
 
 
 class DayRunner(AbstractDay):
@@ -70,26 +16,101 @@ class DayRunner(AbstractDay):
     def add_input_loader(self, input_loader):
         self.input_loader = input_loader
 
+    def parse(self) -> 'StoneLine':
+        return StoneLine.from_values(int(raw_stone) for raw_stone in self.input_loader.load_input_array(" "))
+
     def run_part_one(self):
-        stone_line = parse_basic_stone_line(self.input_loader.load_input_array(" "))
-        for x in range(25):
-            stone_line.execute_blink()
-        return stone_line.count_stones()
+        return self.get_parsed_input().count_stones_after(25)
 
     def run_part_two(self):
-        stone_line = parse_basic_stone_line(self.input_loader.load_input_array(" "))
-        for x in range(75):
-            stone_line.execute_blink()
-        return stone_line.count_stones()
+        # continues from the blinks part one already evaluated on the shared stone line
+        return self.get_parsed_input().count_stones_after(75)
+
 
+def count_digits(value: int) -> int:
+    if value <= 0:
+        return 1
+    while POWERS_OF_TEN[-1] <= value:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return bisect_right(POWERS_OF_TEN, value)
 
-def parse_basic_stone_line(raw_stones: list[str]) -> BasicStoneLine:
-    stone_line = BasicStoneLine()
-    for raw_stone in raw_stones:
-        stone_value = int(raw_stone)
-        stone = StoneState(stone_value)
-        stone_line.add_stone(stone)
-    return stone_line
 
+def blink_stone(value: int) -> tuple[int, ...]:
+    """
+    Apply the first matching rule to a single stone.
+    :return: The stones replacing the given one after one blink.
+    """
+    if value == 0:
+        return 1,
+    digit_count = count_digits(value)
+    if digit_count % 2 == 0:
+        return divmod(value, POWERS_OF_TEN[digit_count // 2])
+    return value * 2024,
 
-# 4048 should be there, instead, i have 4048
+
+@dataclass
+class StoneLine:
+    """
+    Stones only grouped by their engraved value, the order of stones never matters for the count. Stones sharing
+    descendants are therefore evolved only once. The line keeps the stone count after every blink evaluated so far
+    and the transition of every value it has seen, so both only grow with the number of blinks and distinct values.
+    """
+    stones: dict[int, int] = field(default_factory=dict)
+    blinks: int = 0
+    counts_per_blink: list[int] = field(default_factory=list)
+    transitions: dict[int, tuple[int, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def from_values(cls, values: Iterable[int]) -> 'StoneLine':
+        stone_line = cls()
+        for value in values:
+            stone_line.stones[value] = stone_line.stones.get(value, 0) + 1
+        stone_line.counts_per_blink.append(stone_line.count_stones())
+        return stone_line
+
+    def execute_blink(self) -> None:
+        transitions = self.transitions
+        stones = {}
+        for value, count in self.stones.items():
+            new_values = transitions.get(value)
+            if new_values is None:
+                new_values = transitions[value] = blink_stone(value)
+            for new_value in new_values:
+                stones[new_value] = stones.get(new_value, 0) + count
+        self.stones = stones
+        self.blinks += 1
+        self.counts_per_blink.append(self.count_stones())
+
+    def count_stones(self) -> int:
+        return sum(self.stones.values())
+
+    def count_stones_after(self, blinks: int) -> int:
+        """
+        Stone count after the given number of blinks from the initial line. More blinks continue from the last
+        evaluated one, fewer blinks are read from the recorded counts.
+        """
+        while self.blinks < blinks:
+            self.execute_blink()
+        return self.counts_per_blink[blinks]
+
+
+def count_stone_line_for_blinks(values: Iterable[int], blink_counts: Iterable[int]) -> dict[int, int]:
+    """
+    Answer several blink counts for the same stone line in a single pass, each query continues from the previous one.
+    :param values: Values of the initial stones
+    :param blink_counts: Blink counts to report the stone count for, in any order
+    :return: Stone count for every requested blink count
+    """
+    stone_line = StoneLine.from_values(values)
+    return {blink_count: stone_line.count_stones_after(blink_count) for blink_count in sorted(set(blink_counts))}
+
+
+def count_stone_line(values: Iterable[int], blinks: int) -> int:
+    return StoneLine.from_values(values).count_stones_after(blinks)
+
+
+def count_stones(value: int, blinks: int) -> int:
+    """
+    Count the stones a single stone turns into after the given number of blinks.
+    """
+    return count_stone_line([value], blinks)
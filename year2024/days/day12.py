@@ -1,117 +1,68 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from functools import cache
-from typing import Optional, cast
+from typing import Optional
 
 from helpers import InputLoader
 from lib.abstract_day import AbstractDay
-from lib.models import GenericMapField, GenericMapRepresentation, Direction
+from lib.exceptions import RunException
 
 
-@dataclass
-class FenceField:
-    row: int
-    col: int
-    side: Direction
-
-
-@dataclass
-class HorizontalFence:
-    lies_before_row: int
-    runs_across_col: int
-    topside_is_out: bool
+BORDER = ord('.')
 
 
 @dataclass
-class VerticalFence:
-    lies_before_col: int
-    runs_across_row: int
-    rightside_is_out: bool
-
-
-@dataclass
-class FarmField(GenericMapField):
-    name: Optional[str] = None
-    area: Optional['Area'] = None
-
-
-@dataclass
-class Area:
-    id: int
-    name: str
-    fields: list[FarmField] = field(default_factory=list)
-    fences: list[FenceField] = field(default_factory=list)
-    horizontal_fences: dict[int, list[HorizontalFence]] = field(default_factory=dict)
-    vertical_fences: dict[int, list[VerticalFence]] = field(default_factory=dict)
+class Region:
+    plant: str
+    area: int = 0
+    perimeter: int = 0
+    corners: int = 0
 
     @property
     def number_of_sides(self) -> int:
-        if len(self.horizontal_fences) == 0 or len(self.vertical_fences) == 0:
-            raise RuntimeError(f"Fences were not categorized! Run categorize_fences() first.")
-
-        count = 0
-        for horizontal_fences_in_a_row in self.horizontal_fences.values():
-            count += self.count_continous_fence_sequence(
-                [(f.runs_across_col, f.topside_is_out) for f in horizontal_fences_in_a_row]
-            )
-        for vertical_fences_in_a_col in self.vertical_fences.values():
-            count += self.count_continous_fence_sequence(
-                [(f.runs_across_row, f.rightside_is_out) for f in vertical_fences_in_a_col]
-            )
-
-        return count
-
-    @staticmethod
-    def count_continous_fence_sequence(affiliated_numbers: list[tuple[int, bool]]) -> int:
-        affiliated_sorted_numbers = sorted(affiliated_numbers, key=lambda x: x[0])
-        sequence_count = 0
-        expected_number = None
-        expected_affinity: Optional[bool] = None
-
-        for number, affinity in affiliated_sorted_numbers:
-            if number == expected_number and affinity == expected_affinity:
-                expected_number += 1
-            else:
-                sequence_count += 1
-                expected_number = number + 1
-                expected_affinity = affinity
-
-        return sequence_count
-
-    def categorize_fences(self) -> None:
-        for fence in self.fences:
-            if fence.side == Direction.UP:
-                self.add_horizontal_fence(runs_across_col=fence.col, lies_before_row=fence.row, topside_is_out=True)
-            if fence.side == Direction.DOWN:
-                self.add_horizontal_fence(runs_across_col=fence.col, lies_before_row=fence.row + 1, topside_is_out=False)
-            if fence.side == Direction.LEFT:
-                self.add_vertical_fence(runs_across_row=fence.row, lies_before_col=fence.col, rightside_is_out=False)
-            if fence.side == Direction.RIGHT:
-                self.add_vertical_fence(runs_across_row=fence.row, lies_before_col=fence.col + 1, rightside_is_out=True)
-
-    def add_horizontal_fence(self, runs_across_col: int, lies_before_row: int, topside_is_out: bool) -> None:
-        horizontal_fence = HorizontalFence(
-            runs_across_col=runs_across_col, lies_before_row=lies_before_row, topside_is_out=topside_is_out
-        )
-        if lies_before_row in self.horizontal_fences:
-            self.horizontal_fences[lies_before_row].append(horizontal_fence)
-        else:
-            self.horizontal_fences[lies_before_row] = [horizontal_fence]
-
-    def add_vertical_fence(self, runs_across_row: int, lies_before_col: int, rightside_is_out: bool) -> None:
-        vertical_fence = VerticalFence(
-            runs_across_row=runs_across_row, lies_before_col=lies_before_col, rightside_is_out=rightside_is_out
-        )
-        if lies_before_col in self.vertical_fences:
-            self.vertical_fences[lies_before_col].append(vertical_fence)
-        else:
-            self.vertical_fences[lies_before_col] = [vertical_fence]
+        # a closed polygon has as many sides as corners
+        return self.corners
+
+    def absorb(self, other: 'Region') -> None:
+        self.area += other.area
+        self.perimeter += other.perimeter
+        self.corners += other.corners
 
 
 @dataclass
-class Farm(GenericMapRepresentation):
-    fields: list[list[FarmField]] = field(default_factory=list)
-    areas: list[Area] = field(default_factory=list)
-    unmatched_fields: list[FarmField] = field(default_factory=list)
+class StripLabels:
+    """
+    Regions found in a horizontal strip of the farm, keyed by the padded index of their root cell. Roots of the
+    first and last row are kept so strips can be stitched together afterwards.
+    """
+    row_start: int
+    row_end: int
+    regions: dict[int, Region] = field(default_factory=dict)
+    first_row_roots: list[int] = field(default_factory=list)
+    last_row_roots: list[int] = field(default_factory=list)
+
+
+class Farm:
+    """
+    Plant names stored row by row in one bytes object, surrounded by a one cell border of BORDER, so neighbours
+    of every farm cell can be looked up without bounds checks.
+    """
+    __slots__ = ['row_count', 'col_count', 'stride', 'cells']
+
+    def __init__(self, lines: list[str]):
+        if len({len(line) for line in lines}) > 1:
+            raise RunException("Farm lines are not equally long")
+        if any(chr(BORDER) in line for line in lines):
+            raise RunException(f"Farm must not contain border character '{chr(BORDER)}'")
+        self.row_count = len(lines)
+        self.col_count = len(lines[0]) if lines else 0
+        self.stride = self.col_count + 2
+        border_row = '.' * self.stride
+        padded_lines = [border_row] + [f".{line}." for line in lines] + [border_row]
+        self.cells = ''.join(padded_lines).encode('ascii')
+
+    def padded_index(self, row: int, col: int) -> int:
+        return (row + 1) * self.stride + col + 1
 
 
 class DayRunner(AbstractDay):
@@ -121,61 +72,140 @@ class DayRunner(AbstractDay):
     def add_input_loader(self, input_loader):
         self.input_loader = input_loader
 
+    def parse(self) -> list[Region]:
+        farm = Farm(self.input_loader.load_input_array("\n"))
+        if self.worker_count is not None and self.worker_count > 1:
+            return label_regions_in_parallel(farm, self.worker_count)
+        return label_regions(farm)
+
     def run_part_one(self):
-        farm = parse_farm(self.input_loader.load_input_array("\n"))
-        return sum(len(area.fences) * len(area.fields) for area in farm.areas)
+        return sum(region.area * region.perimeter for region in self.get_parsed_input())
 
     def run_part_two(self):
-        farm = parse_farm(self.input_loader.load_input_array("\n"))
-        price = 0
-        for area in farm.areas:
-            area.categorize_fences()
-            price += len(area.fields) * area.number_of_sides
-        return price
-
-
-def parse_farm(input_array: list[str]) -> Farm:
-    farm = Farm()
-
-    # load basic fields
-    for row, line in enumerate(input_array):
-        farm_row = []
-        for col, char in enumerate(line):
-            new_field = FarmField(name=char, row=row, col=col)
-            farm_row.append(new_field)
-            farm.unmatched_fields.append(new_field)
-        farm.fields.append(farm_row)
-
-    sort_fields_into_areas(farm)
-    return farm
-
-
-def sort_fields_into_areas(farm: Farm) -> None:
-    while len(farm.unmatched_fields) > 0:
-        field_to_area_match = farm.unmatched_fields.pop(0)
-        create_area_from_one_field(field_to_area_match, farm)
-
-
-def create_area_from_one_field(field_to_area_match: FarmField, farm: Farm) -> None:
-    new_area = Area(name=field_to_area_match.name, id=len(farm.areas))
-    new_area.fields.append(field_to_area_match)
-    field_to_area_match.area = new_area
-
-    flood_match_fields = [field_to_area_match]
-    while len(flood_match_fields) > 0:
-        current_field = flood_match_fields.pop(0)
-        neighbours = farm.get_cardinal_neighbouring_fields(current_field=current_field, include_out_of_bounds=True)
-        for direction, neighbour in neighbours.items():
-            neighbour = cast(FarmField, neighbour)  # for typing comfort
-            if neighbour is None or neighbour.name != current_field.name:
-                # different field or side of map
-                new_area.fences.append(FenceField(row=current_field.row, col=current_field.col, side=direction))
-            elif neighbour in new_area.fields or neighbour in flood_match_fields:
-                pass  # neighbour already processed/in queue
+        return sum(region.area * region.number_of_sides for region in self.get_parsed_input())
+
+
+def label_strip(farm: Farm, row_start: int, row_end: int) -> StripLabels:
+    """
+    Label the regions of rows row_start..row_end-1 with union-find in a single row-major sweep. Area, perimeter and
+    corners only depend on the 3x3 neighbourhood of a cell, so they are added to the current root right away and
+    merged whenever two roots are united.
+    """
+    cells = farm.cells
+    stride = farm.stride
+    base = (row_start + 1) * stride
+    parent = array('q', range((row_end - row_start) * stride))
+    areas = array('q', bytes(8 * len(parent)))
+    perimeters = array('q', areas)
+    corners = array('q', areas)
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for row in range(row_start, row_end):
+        row_index = (row + 1) * stride + 1
+        for g in range(row_index, row_index + farm.col_count):
+            plant = cells[g]
+            up = cells[g - stride] == plant
+            down = cells[g + stride] == plant
+            left = cells[g - 1] == plant
+            right = cells[g + 1] == plant
+            cell_corners = 0
+            if up == left and (not up or cells[g - stride - 1] != plant):
+                cell_corners += 1
+            if up == right and (not up or cells[g - stride + 1] != plant):
+                cell_corners += 1
+            if down == left and (not down or cells[g + stride - 1] != plant):
+                cell_corners += 1
+            if down == right and (not down or cells[g + stride + 1] != plant):
+                cell_corners += 1
+
+            local = g - base
+            root = find(local - 1) if left else local
+            if up and row > row_start:
+                up_root = find(local - stride)
+                if root == local:
+                    root = up_root
+                elif up_root != root:
+                    parent[up_root] = root
+                    areas[root] += areas[up_root]
+                    perimeters[root] += perimeters[up_root]
+                    corners[root] += corners[up_root]
+            parent[local] = root
+            areas[root] += 1
+            perimeters[root] += 4 - up - down - left - right
+            corners[root] += cell_corners
+
+    strip_labels = StripLabels(row_start=row_start, row_end=row_end)
+    for row in range(row_start, row_end):
+        row_index = (row + 1) * stride + 1
+        for g in range(row_index, row_index + farm.col_count):
+            local = g - base
+            if parent[local] == local:
+                strip_labels.regions[g] = Region(chr(cells[g]), areas[local], perimeters[local], corners[local])
+    if row_end > row_start:
+        first_row = farm.padded_index(row_start, 0) - base
+        last_row = farm.padded_index(row_end - 1, 0) - base
+        strip_labels.first_row_roots = [find(local) + base for local in range(first_row, first_row + farm.col_count)]
+        strip_labels.last_row_roots = [find(local) + base for local in range(last_row, last_row + farm.col_count)]
+    return strip_labels
+
+
+def merge_strip_labels(farm: Farm, strips: list[StripLabels]) -> list[Region]:
+    """
+    Unite regions that continue across the border of two consecutive strips.
+    :param strips: Labels of strips covering the farm top to bottom without gaps
+    """
+    parent: dict[int, int] = {}
+
+    def find(root: int) -> int:
+        while parent.get(root, root) != root:
+            root = parent[root]
+        return root
+
+    for upper, lower in zip(strips, strips[1:]):
+        upper_row = farm.padded_index(upper.row_end - 1, 0)
+        lower_row = farm.padded_index(lower.row_start, 0)
+        for col in range(farm.col_count):
+            if farm.cells[upper_row + col] == farm.cells[lower_row + col]:
+                upper_root = find(upper.last_row_roots[col])
+                lower_root = find(lower.first_row_roots[col])
+                if upper_root != lower_root:
+                    parent[lower_root] = upper_root
+
+    regions: dict[int, Region] = {}
+    for strip in strips:
+        for root, region in strip.regions.items():
+            merged_root = find(root)
+            if merged_root in regions:
+                regions[merged_root].absorb(region)
             else:
-                new_area.fields.append(neighbour)
-                flood_match_fields.append(neighbour)
-                farm.unmatched_fields.remove(neighbour)
-                neighbour.area = new_area
+                regions[merged_root] = Region(region.plant, region.area, region.perimeter, region.corners)
+    return list(regions.values())
+
+
+def label_regions(farm: Farm) -> list[Region]:
+    return merge_strip_labels(farm, [label_strip(farm, 0, farm.row_count)])
+
+
+_worker_farm: Optional[Farm] = None
+
+
+def _init_worker(farm: Farm) -> None:
+    global _worker_farm
+    _worker_farm = farm
+
+
+def _label_strip_in_worker(row_range: tuple[int, int]) -> StripLabels:
+    return label_strip(_worker_farm, *row_range)
+
 
-    farm.areas.append(new_area)
+def label_regions_in_parallel(farm: Farm, worker_count: int) -> list[Region]:
+    strip_height = max(1, -(-farm.row_count // worker_count))
+    row_ranges = [(row, min(row + strip_height, farm.row_count)) for row in range(0, farm.row_count, strip_height)]
+    with ProcessPoolExecutor(max_workers=worker_count, initializer=_init_worker, initargs=(farm,)) as executor:
+        strips = list(executor.map(_label_strip_in_worker, row_ranges))
+    return merge_strip_labels(farm, strips)
@@ -1,5 +1,4 @@
-import math
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
 from helpers import InputLoader
@@ -28,69 +27,43 @@ class ClawMachine:
     b_button: Button
     x_goal: int
     y_goal: int
-    winning_moves: list[WinningMove] = field(default_factory=list)
 
-    @property
-    def cheapest_winning_move(self) -> Optional[WinningMove]:
-        if len(self.winning_moves) == 0:
+    def with_goal_offset(self, goal_offset: int) -> 'ClawMachine':
+        return ClawMachine(self.a_button, self.b_button, self.x_goal + goal_offset, self.y_goal + goal_offset)
+
+    def find_cheapest_winning_move(self) -> Optional[WinningMove]:
+        """
+        Solve a * A + b * B = goal exactly with integer Cramer's rule. If both buttons move along the same line,
+        there may be many solutions, the cheapest one is then found with the extended Euclidean algorithm.
+        :return: Cheapest combination of non-negative press counts reaching the prize, None if there is none.
+        """
+        a, b = self.a_button, self.b_button
+        determinant = a.x_move * b.y_move - a.y_move * b.x_move
+        if determinant == 0:
+            return self._find_cheapest_collinear_winning_move()
+
+        a_presses, a_remainder = divmod(self.x_goal * b.y_move - self.y_goal * b.x_move, determinant)
+        b_presses, b_remainder = divmod(a.x_move * self.y_goal - a.y_move * self.x_goal, determinant)
+        if a_remainder or b_remainder or a_presses < 0 or b_presses < 0:
             return None
-        cheapest_winning_move = self.winning_moves[0]
-        for winning_move in self.winning_moves[1:]:
-            if winning_move.price < cheapest_winning_move.price:
-                cheapest_winning_move = winning_move
-        return cheapest_winning_move
-
-    def calculate_winning_moves_dumb_way(self) -> None:
-        max_b_moves_on_x = self.x_goal // self.b_button.x_move
-        max_b_moves_on_y = self.y_goal // self.b_button.y_move
-
-        current_b_move_count = min(max_b_moves_on_x, max_b_moves_on_y)
-        current_a_move_count = 0
-        current_a_move_x = 0
-        current_a_move_y = 0
-
-        leftover_x_from_b_move = self.x_goal - current_b_move_count * self.b_button.x_move
-        leftover_y_from_b_move = self.y_goal - current_b_move_count * self.b_button.y_move
-
-        while current_b_move_count >= 0:
-            while current_a_move_x <= leftover_x_from_b_move and current_a_move_y <= leftover_y_from_b_move:
-                if current_a_move_x == leftover_x_from_b_move and current_a_move_y == leftover_y_from_b_move:
-                    self.winning_moves.append(WinningMove(a_presses=current_a_move_count, b_presses=current_b_move_count))
-                    print(self.winning_moves[-1].price, flush=True)
-                current_a_move_count += 1
-                current_a_move_x += self.a_button.x_move
-                current_a_move_y += self.a_button.y_move
-            # ready for next round
-            current_b_move_count -= 1
-            leftover_x_from_b_move += self.b_button.x_move
-            leftover_y_from_b_move += self.b_button.y_move
-
-    def calculate_winning_moves_smart_way(self) -> None:
-        b_press_count = self.calculate_b_press_count()
-        a_press_count = self.calculate_a_press_count(b_press_count)
-        if a_press_count is not None and b_press_count is not None:
-            self.winning_moves.append(WinningMove(a_presses=a_press_count, b_presses=b_press_count))
-
-    def calculate_b_press_count(self) -> int | None:
-        b_count_raw = (
-            (self.y_goal * self.a_button.x_move - self.x_goal * self.a_button.y_move) /
-            (self.b_button.y_move * self.a_button.x_move - self.b_button.x_move * self.a_button.y_move)
-        )
-        in_int_form = int(b_count_raw)
-        if in_int_form == b_count_raw:
-            return in_int_form
-        return None
-
-    def calculate_a_press_count(self, b_press_count: int | None) -> int | None:
-        if b_press_count is None:
+        return WinningMove(a_presses=a_presses, b_presses=b_presses)
+
+    def _find_cheapest_collinear_winning_move(self) -> Optional[WinningMove]:
+        a, b = self.a_button, self.b_button
+        if a.x_move * self.y_goal != a.y_move * self.x_goal or b.x_move * self.y_goal != b.y_move * self.x_goal:
+            return None  # goal does not lie on the line both buttons move along
+        if a.x_move or b.x_move:
+            winning_move = cheapest_presses_on_line(a.x_move, b.x_move, self.x_goal)
+        else:
+            winning_move = cheapest_presses_on_line(a.y_move, b.y_move, self.y_goal)
+        if winning_move is None:
             return None
-        a_count_raw = (
-            (self.x_goal - self.b_button.x_move * b_press_count) / self.a_button.x_move
-        )
-        in_int_form = int(a_count_raw)
-        if in_int_form == a_count_raw:
-            return in_int_form
-        return None
+        # the solution of one axis has to hit the goal on both of them
+        reached_x = winning_move.a_presses * a.x_move + winning_move.b_presses * b.x_move
+        reached_y = winning_move.a_presses * a.y_move + winning_move.b_presses * b.y_move
+        if (reached_x, reached_y) != (self.x_goal, self.y_goal):
+            return None
+        return winning_move
 
 
 class DayRunner(AbstractDay):
@@ -100,30 +73,67 @@ class DayRunner(AbstractDay):
     def add_input_loader(self, input_loader):
         self.input_loader = input_loader
 
+    def parse(self) -> list[ClawMachine]:
+        return parse_claw_machines(self.input_loader.load_input_array("\n\n"))
+
     def run_part_one(self):
-        claw_machines = parse_claw_machines(self.input_loader.load_input_array("\n\n"))
-        total_cost = 0
-        for claw_machine in claw_machines:
-            # claw_machine.calculate_winning_moves_dumb_way()
-            claw_machine.calculate_winning_moves_smart_way()
-            if claw_machine.cheapest_winning_move is not None:
-                total_cost += claw_machine.cheapest_winning_move.price
-        return total_cost
+        return calculate_total_cost(self.get_parsed_input())
 
     def run_part_two(self):
-        claw_machines = parse_claw_machines(
-            raw_claw_machines=self.input_loader.load_input_array("\n\n"),
-            goal_offset=10000000000000,
-        )
-        total_cost = 0
-        for claw_machine in claw_machines:
-            claw_machine.calculate_winning_moves_smart_way()
-            if claw_machine.cheapest_winning_move is not None:
-                total_cost += claw_machine.cheapest_winning_move.price
-        return total_cost
-
-
-def parse_claw_machines(raw_claw_machines: list[str], goal_offset: int = 0) -> list[ClawMachine]:
+        return calculate_total_cost(self.get_parsed_input(), goal_offset=10000000000000)
+
+
+def calculate_total_cost(claw_machines: list[ClawMachine], goal_offset: int = 0) -> int:
+    total_cost = 0
+    for claw_machine in claw_machines:
+        winning_move = claw_machine.with_goal_offset(goal_offset).find_cheapest_winning_move()
+        if winning_move is not None:
+            total_cost += winning_move.price
+    return total_cost
+
+
+def extended_gcd(a: int, b: int) -> tuple[int, int, int]:
+    """
+    :return: gcd(a, b) and Bezout coefficients x, y with a * x + b * y = gcd(a, b)
+    """
+    old_remainder, remainder = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while remainder:
+        quotient = old_remainder // remainder
+        old_remainder, remainder = remainder, old_remainder - quotient * remainder
+        old_x, x = x, old_x - quotient * x
+        old_y, y = y, old_y - quotient * y
+    return old_remainder, old_x, old_y
+
+
+def cheapest_presses_on_line(a_move: int, b_move: int, goal: int) -> Optional[WinningMove]:
+    """
+    Cheapest solution of a * a_move + b * b_move = goal with non-negative a and b, moves must be non-negative.
+    """
+    if a_move == 0 and b_move == 0:
+        return WinningMove(0, 0) if goal == 0 else None
+    if a_move == 0 or b_move == 0:
+        presses, remainder = divmod(goal, a_move or b_move)
+        if remainder or presses < 0:
+            return None
+        return WinningMove(0, presses) if a_move == 0 else WinningMove(presses, 0)
+
+    divisor, x, y = extended_gcd(a_move, b_move)
+    if goal % divisor:
+        return None
+    a_base, b_base = x * (goal // divisor), y * (goal // divisor)
+    # all solutions are (a_base + k * a_step, b_base - k * b_step), the price changes by 3 * a_step - b_step per k
+    a_step, b_step = b_move // divisor, a_move // divisor
+    lowest_k = -(a_base // a_step)  # smallest k keeping a >= 0
+    highest_k = b_base // b_step  # largest k keeping b >= 0
+    if lowest_k > highest_k:
+        return None
+    k = lowest_k if 3 * a_step >= b_step else highest_k
+    return WinningMove(a_presses=a_base + k * a_step, b_presses=b_base - k * b_step)
+
+
+def parse_claw_machines(raw_claw_machines: list[str]) -> list[ClawMachine]:
     claw_machines: list[ClawMachine] = []
 
     for raw_claw_machine in raw_claw_machines:
@@ -134,8 +144,8 @@ def parse_claw_machines(raw_claw_machines: list[str], goal_offset: int = 0) -> l
         claw_machines.append(ClawMachine(
             a_button=Button(int(raw_button_a_x), int(raw_button_a_y)),
             b_button=Button(int(raw_button_b_x), int(raw_button_b_y)),
-            x_goal=int(raw_prize_x) + goal_offset,
-            y_goal=int(raw_prize_y) + goal_offset,
+            x_goal=int(raw_prize_x),
+            y_goal=int(raw_prize_y),
         ))
 
     return claw_machines
@@ -1,238 +1,128 @@
-from dataclasses import dataclass
-from enum import StrEnum
-from typing import cast, Literal
+from itertools import groupby
 
 from helpers import InputLoader
 from lib.abstract_day import AbstractDay
-from lib.models import Direction, GenericMapField, GenericMapRepresentation
+from lib.exceptions import RunException
 
 
-class NoMoreInstructions(Exception):
-    """
-    No more instructions available.
-    """
-
-
-class FieldType(StrEnum):
-    WALL = "#"
-    EMPTY = "."
-    CRATE = "O"
-    CRATE_LEFT = "["
-    CRATE_RIGHT = "]"
-
-
-@dataclass
-class Robot(GenericMapField):
-    pass
-
-
-@dataclass
-class InstructionSet:
-    instructions: list[Direction]
-    current_index: int = 0
+WALL = ord("#")
+EMPTY = ord(".")
+CRATE = ord("O")
+CRATE_LEFT = ord("[")
+CRATE_RIGHT = ord("]")
+CRATE_PARTS = frozenset((CRATE, CRATE_LEFT, CRATE_RIGHT))
+WIDE_MAP_TRANSLATION = str.maketrans({"#": "##", "O": "[]", ".": "..", "@": "@."})
 
-    def next_instruction(self) -> Direction | None:
-        if self.current_index >= len(self.instructions):
-            return None
 
-        instruction = self.instructions[self.current_index]
-        self.current_index += 1
-        return instruction
-
-
-@dataclass
-class FactoryMapField(GenericMapField):
-    type: FieldType
-
-    @property
-    def gps_coordiates(self) -> int:
-        return self.row * 100 + self.col
-
-    def __hash__(self) -> int:
-        return hash(self.gps_coordiates)
-
-
-@dataclass
-class FactoryMap(GenericMapRepresentation):
-    fields: list[list[FactoryMapField]]
-    instructions: InstructionSet
-    robot: Robot
+class Warehouse:
+    """
+    Cells live in one flat bytearray and the robot is a flat index, so every move is index arithmetic with
+    a precomputed step per instruction. The map has to be surrounded by walls, which makes bounds checks
+    unnecessary.
+    """
+    __slots__ = ['cells', 'width', 'robot', 'steps']
+
+    def __init__(self, raw_map: str):
+        lines = raw_map.strip().splitlines()
+        self.width = len(lines[0])
+        if any(len(line) != self.width for line in lines):
+            raise RunException("Warehouse lines are not equally long")
+        self.cells = bytearray("".join(lines), "ascii")
+        self.robot = self.cells.find(b"@")
+        if self.robot < 0:
+            raise RunException("Warehouse has no robot")
+        self.cells[self.robot] = EMPTY
+        self.steps = {"^": -self.width, "v": self.width, "<": -1, ">": 1}
+
+    @staticmethod
+    def from_raw_map(raw_map: str, wide_version: bool = False) -> 'Warehouse':
+        return Warehouse(raw_map.translate(WIDE_MAP_TRANSLATION) if wide_version else raw_map)
 
     @property
     def crate_gps_coordinates(self) -> int:
         gps_sum = 0
-        for row in self.fields:
-            for field in row:
-                if field.type in (FieldType.CRATE, FieldType.CRATE_LEFT):
-                    gps_sum += field.gps_coordiates
+        for crate_type in (CRATE, CRATE_LEFT):
+            index = self.cells.find(crate_type)
+            while index >= 0:
+                row, col = divmod(index, self.width)
+                gps_sum += row * 100 + col
+                index = self.cells.find(crate_type, index + 1)
         return gps_sum
 
-    def print_map(self):
-        for row in self.fields:
-            for field in row:
-                if field.row == self.robot.row and field.col == self.robot.col:
-                    print("@", end="")
-                else:
-                    print(field.type.value, end="")
-            print()
-
-    def process_next_instruction(self, wide_version: bool) -> bool:
-        instruction = self.instructions.next_instruction()
-        if instruction is None:
+    def execute(self, instructions: str) -> None:
+        """
+        Execute a string of "^v<>" instructions. A blocked move leaves the warehouse unchanged, so the rest of a
+        run of identical instructions is skipped as soon as one of them is blocked.
+        """
+        for instruction, run in groupby(instructions):
+            step = self.steps[instruction]
+            for _ in run:
+                if not self.move_robot(step):
+                    break
+
+    def move_robot(self, step: int) -> bool:
+        """
+        :return: Whether the robot moved, False if the move was blocked by a wall.
+        """
+        if step == 1 or step == -1:
+            return self._push_horizontally(step)
+        return self._push_vertically(step)
+
+    def _push_horizontally(self, step: int) -> bool:
+        cells = self.cells
+        robot = self.robot
+        end = robot + step
+        while cells[end] in CRATE_PARTS:
+            end += step
+        if cells[end] == WALL:
             return False
 
-        if self.robot_can_move(instruction, wide_version):
-            self.move_robot(instruction, wide_version)
-        return True
-
-    def _robot_can_move_narrow_version(self, direction: Direction) -> bool:
-        current_field = self.robot
-        while True:
-            next_field = cast(FactoryMapField, self.get_next_field_in_direction(current_field, direction))
-            if next_field.type == FieldType.WALL:
-                return False
-            if next_field.type == FieldType.EMPTY:
-                return True
-            current_field = next_field
-
-    def _check_move_and_gather_movable_crates(
-            self, direction: Literal[Direction.UP, Direction.DOWN], gather_crates: bool
-    ) -> tuple[bool, set[FactoryMapField] | None]:
-        next_field = cast(FactoryMapField, self.get_next_field_in_direction(self.robot, direction))
-        crates_to_move = set() if gather_crates else None
-        to_investigate = set()
-
-        if next_field.type == FieldType.WALL:
-            return False, crates_to_move
-        elif next_field.type == FieldType.EMPTY:
-            return True, crates_to_move
-        elif next_field.type in (FieldType.CRATE_LEFT, FieldType.CRATE_RIGHT):
-            to_investigate.add(next_field)
-            to_investigate.add(self.get_other_crate_part(next_field))
-            if crates_to_move is not None:
-                crates_to_move.add(next_field)
-                crates_to_move.add(self.get_other_crate_part(next_field))
-        else:
-            raise RuntimeError(f"Unknown field type for wide version: {next_field.type}")
-
-        while len(to_investigate) > 0:
-            current_field = to_investigate.pop()
-            next_field = cast(FactoryMapField, self.get_next_field_in_direction(current_field, direction))
-            if next_field.type == FieldType.WALL:
-                return False, crates_to_move
-            elif next_field.type == FieldType.EMPTY:
-                continue
-            elif next_field.type in (FieldType.CRATE_LEFT, FieldType.CRATE_RIGHT):
-                to_investigate.add(next_field)
-                to_investigate.add(self.get_other_crate_part(next_field))
-                if crates_to_move is not None:
-                    crates_to_move.add(next_field)
-                    crates_to_move.add(self.get_other_crate_part(next_field))
-            else:
-                raise RuntimeError(f"Unknown field type for wide version: {next_field.type}")
-
-        return True, crates_to_move
-
-    def _robot_can_move_wide_version_vertical(self, direction: Literal[Direction.UP, Direction.DOWN]) -> bool:
-        can_move, _ = self._check_move_and_gather_movable_crates(direction, gather_crates=False)
-        return can_move
-
-    def _robot_can_move_wide_version(self, direction: Direction) -> bool:
-        if direction in (Direction.LEFT, Direction.RIGHT):
-            return self._robot_can_move_narrow_version(direction)
-        elif direction in (Direction.UP, Direction.DOWN):
-            return self._robot_can_move_wide_version_vertical(direction)
-        else:
-            raise RuntimeError(f"Unknown direction {direction}")
-
-    def robot_can_move(self, direction: Direction, wide_version: bool) -> bool:
-        if wide_version:
-            return self._robot_can_move_wide_version(direction)
+        # shift the whole run of crates by one with a single slice assignment
+        if step == 1:
+            cells[robot + 2:end + 1] = cells[robot + 1:end]
         else:
-            return self._robot_can_move_narrow_version(direction)
-
-    def _create_mapping_after_crate_move(
-        self, creates_to_move: set[FactoryMapField], direction: Direction
-    ) -> dict[FactoryMapField, FieldType]:
-        mapping = {}
-
-        # put empty for now in all the previous fields
-        for create_piece in creates_to_move:
-            mapping[create_piece] = FieldType.EMPTY
-
-        # for each create piece, mark it for moving in the direction
-        for create_piece in creates_to_move:
-            field_in_move_direction = cast(FactoryMapField, self.get_next_field_in_direction(create_piece, direction))
-            mapping[field_in_move_direction] = create_piece.type
-
-        return mapping
-
-    def _move_robot_narrow_version(self, direction: Direction):
-        next_field_to_resolve = self.get_next_field_in_direction(self.robot, direction)
-        self.robot.row += direction.value[0]
-        self.robot.col += direction.value[1]
-
-        if next_field_to_resolve.type == FieldType.EMPTY:
-            return
-        else:
-            next_field_to_resolve.type = FieldType.EMPTY  # set empty as robot pushed it out
-
-        while True:
-            next_field_to_resolve = self.get_next_field_in_direction(next_field_to_resolve, direction)
-            if next_field_to_resolve.type == FieldType.EMPTY:
-                next_field_to_resolve.type = FieldType.CRATE
-                return
-
-    def _move_robot_wide_version_horizontal(self, direction: Literal[Direction.LEFT, Direction.RIGHT]) -> None:
-        next_field_to_resolve = self.get_next_field_in_direction(self.robot, direction)
-        self.robot.row += direction.value[0]
-        self.robot.col += direction.value[1]
-
-        if next_field_to_resolve.type == FieldType.EMPTY:
-            return
-
-        crate_piece_getting_pushed = next_field_to_resolve.type
-        next_field_to_resolve.type = FieldType.EMPTY  # set empty as robot pushed it out
-
-        while True:
-            next_field_to_resolve = self.get_next_field_in_direction(next_field_to_resolve, direction)
-            if next_field_to_resolve.type == FieldType.EMPTY:
-                next_field_to_resolve.type = crate_piece_getting_pushed
-                return
-            crate_piece_to_place = crate_piece_getting_pushed
-            crate_piece_getting_pushed = next_field_to_resolve.type
-            next_field_to_resolve.type = crate_piece_to_place
-
-
-    def _move_robot_wide_version_vertical(self, direction: Literal[Direction.UP, Direction.DOWN]) -> None:
-        crates_to_move = self._check_move_and_gather_movable_crates(direction, gather_crates=True)[1]
-        field_states_after_move = self._create_mapping_after_crate_move(crates_to_move, direction)
-        for field, type_after_move in field_states_after_move.items():
-            field.type = type_after_move
-        self.robot.row += direction.value[0]
-        self.robot.col += direction.value[1]
+            cells[end:robot - 1] = cells[end + 1:robot]
+        cells[robot + step] = EMPTY
+        self.robot = robot + step
+        return True
 
-    def _move_robot_wide_version(self, direction: Direction) -> None:
-        if direction in (Direction.LEFT, Direction.RIGHT):
-            self._move_robot_wide_version_horizontal(direction)
-        elif direction in (Direction.UP, Direction.DOWN):
-            self._move_robot_wide_version_vertical(direction)
-        else:
-            raise RuntimeError(f"Unknown instruction {direction}")
+    def _push_vertically(self, step: int) -> bool:
+        cells = self.cells
+        frontier = [self.robot]
+        levels = []
+        while frontier:
+            next_frontier = set()
+            for index in frontier:
+                next_index = index + step
+                cell = cells[next_index]
+                if cell == WALL:
+                    return False
+                if cell == CRATE:
+                    next_frontier.add(next_index)
+                elif cell == CRATE_LEFT:
+                    next_frontier.add(next_index)
+                    next_frontier.add(next_index + 1)
+                elif cell == CRATE_RIGHT:
+                    next_frontier.add(next_index)
+                    next_frontier.add(next_index - 1)
+            if next_frontier:
+                levels.append(next_frontier)
+            frontier = next_frontier
+
+        # move the farthest crates first, so every crate moves into an already emptied cell
+        for level in reversed(levels):
+            for index in level:
+                cells[index + step] = cells[index]
+                cells[index] = EMPTY
+        self.robot += step
+        return True
 
-    def move_robot(self, direction: Direction, wide_version: bool) -> None:
-        if wide_version:
-            self._move_robot_wide_version(direction)
-        else:
-            self._move_robot_narrow_version(direction)
-
-    def get_other_crate_part(self, crate_field: FactoryMapField) -> FactoryMapField:
-        if crate_field.type == FieldType.CRATE_RIGHT:
-            return cast(FactoryMapField, self.get_next_field_in_direction(crate_field, Direction.LEFT))
-        elif crate_field.type == FieldType.CRATE_LEFT:
-            return cast(FactoryMapField, self.get_next_field_in_direction(crate_field, Direction.RIGHT))
-        else:
-            raise RuntimeError("Get other crate part called on non crate field!")
+    def print_map(self) -> None:
+        for row_start in range(0, len(self.cells), self.width):
+            row = bytearray(self.cells[row_start:row_start + self.width])
+            if row_start <= self.robot < row_start + self.width:
+                row[self.robot - row_start] = ord("@")
+            print(row.decode("ascii"))
 
 
 class DayRunner(AbstractDay):
@@ -242,74 +132,18 @@ class DayRunner(AbstractDay):
     def add_input_loader(self, input_loader):
         self.input_loader = input_loader
 
-    def run_part_one(self):
+    def parse(self) -> tuple[str, str]:
         raw_map, raw_instructions = self.input_loader.load_input_array("\n\n")
-        factory_map = parse_factory_map(raw_map, parse_instructions(raw_instructions))
+        return raw_map, raw_instructions.strip().replace("\n", "")
 
-        while factory_map.process_next_instruction(wide_version=False):
-            # returns False when end of instructions is reached
-            pass
-        return factory_map.crate_gps_coordinates
+    def run_part_one(self):
+        raw_map, instructions = self.get_parsed_input()
+        warehouse = Warehouse.from_raw_map(raw_map)
+        warehouse.execute(instructions)
+        return warehouse.crate_gps_coordinates
 
     def run_part_two(self):
-        raw_map, raw_instructions = self.input_loader.load_input_array("\n\n")
-        factory_map = parse_factory_map_wide_version(raw_map, parse_instructions(raw_instructions))
-
-        while factory_map.process_next_instruction(wide_version=True):
-            pass
-        return factory_map.crate_gps_coordinates
-
-
-def parse_instructions(raw_instructions: str) -> InstructionSet:
-    direction_mapping = {
-        "^": Direction.UP,
-        "v": Direction.DOWN,
-        "<": Direction.LEFT,
-        ">": Direction.RIGHT,
-    }
-    return InstructionSet(
-        [
-            direction_mapping[char] for char in raw_instructions.strip().replace("\n", "")
-        ]
-    )
-
-
-def parse_factory_map(raw_map: str, instructions: InstructionSet) -> FactoryMap:
-    map_fields = []
-    robot = None
-
-    for row_id, raw_map_line in enumerate(raw_map.splitlines()):
-        map_row = []
-        for col_id, char in enumerate(raw_map_line):
-            if char == "@":
-                map_row.append(FactoryMapField(row=row_id, col=col_id, type=FieldType.EMPTY))
-                robot = Robot(row=row_id, col=col_id)
-            else:
-                map_row.append(FactoryMapField(row=row_id, col=col_id, type=FieldType(char)))
-        map_fields.append(map_row)
-
-    return FactoryMap(fields=map_fields, instructions=instructions, robot=robot)
-
-
-def parse_factory_map_wide_version(raw_map: str, instructions: InstructionSet) -> FactoryMap:
-    map_fields = []
-    robot = None
-
-    for row_id, raw_map_line in enumerate(raw_map.splitlines()):
-        map_row = []
-        col_id = 0
-        for char in raw_map_line:
-            if char == "@":
-                map_row.append(FactoryMapField(row=row_id, col=col_id, type=FieldType.EMPTY))
-                map_row.append(FactoryMapField(row=row_id, col=col_id + 1, type=FieldType.EMPTY))
-                robot = Robot(row=row_id, col=col_id)
-            elif char == "O":
-                map_row.append(FactoryMapField(row=row_id, col=col_id, type=FieldType.CRATE_LEFT))
-                map_row.append(FactoryMapField(row=row_id, col=col_id + 1, type=FieldType.CRATE_RIGHT))
-            else:  # for wall or empty
-                map_row.append(FactoryMapField(row=row_id, col=col_id, type=FieldType(char)))
-                map_row.append(FactoryMapField(row=row_id, col=col_id + 1, type=FieldType(char)))
-            col_id += 2
-        map_fields.append(map_row)
-
-    return FactoryMap(fields=map_fields, instructions=instructions, robot=robot)
+        raw_map, instructions = self.get_parsed_input()
+        warehouse = Warehouse.from_raw_map(raw_map, wide_version=True)
+        warehouse.execute(instructions)
+        return warehouse.crate_gps_coordinates
@@ -1,76 +1,109 @@
-from typing import Optional
-from enum import Enum
+from typing import Generator, Optional
 
 from lib.abstract_day import AbstractDay
+from lib.exceptions import RunException
 from helpers import InputLoader
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+INCREASING_LIMITS = (1, 3)
+DECREASING_LIMITS = (-3, -1)
+
 
 class Report:
     def __init__(self, report_list: list[int]):
         self.levels: list[int] = report_list
 
     def is_all_decreasing_safely(self, can_ignore_one_level: bool = False) -> bool:
-        return self._levels_are_changing_within_limits(
-            next_item_min_diff=-3, next_item_max_diff=-1, can_ignore_one_level=can_ignore_one_level
-        )
+        return self._levels_are_changing_within_limits(*DECREASING_LIMITS, can_ignore_one_level=can_ignore_one_level)
 
     def is_all_increasing_safely(self, can_ignore_one_level: bool = False) -> bool:
-        return self._levels_are_changing_within_limits(
-            next_item_min_diff=1, next_item_max_diff=3, can_ignore_one_level=can_ignore_one_level
+        return self._levels_are_changing_within_limits(*INCREASING_LIMITS, can_ignore_one_level=can_ignore_one_level)
+
+    def is_safe(self, can_ignore_one_level: bool = False) -> bool:
+        return (
+            self.is_all_decreasing_safely(can_ignore_one_level)
+            or self.is_all_increasing_safely(can_ignore_one_level)
         )
 
     def _levels_are_changing_within_limits(
             self, next_item_min_diff: int, next_item_max_diff: int, can_ignore_one_level: bool = False
     ) -> bool:
-        last_item = None
-        levels_are_safe_without_delete = list_is_changing_within_limits(self.levels, next_item_min_diff, next_item_max_diff)
-
+        """
+        Works on the differences of neighbouring levels. Removing level k only replaces differences k-1 and k by
+        their sum, so after counting the faulty differences once, every removal is checked in constant time. Only
+        the two levels around the first faulty difference are worth removing, the faulty pair stays otherwise.
+        """
+        levels = self.levels
+        diffs = [current_item - last_item for last_item, current_item in zip(levels, levels[1:])]
+        faulty = [not next_item_min_diff <= diff <= next_item_max_diff for diff in diffs]
+        faulty_count = sum(faulty)
+        if faulty_count == 0:
+            return True
         if not can_ignore_one_level:
-            return levels_are_safe_without_delete
-
-        # at this point, list is faulty but maybe can be fixed
-        level_variations = self._prepare_level_variations()
-        return any(
-            list_is_changing_within_limits(level_variations, next_item_min_diff, next_item_max_diff)
-            for level_variations
-            in level_variations
-        )
-
-    def _prepare_level_variations(self) -> list[list[int]]:
-        level_variations = []
-        for i in range(len(self.levels)):
-            new_level_variation = self.levels.copy()
-            new_level_variation.pop(i)
-            level_variations.append(new_level_variation)
-        return level_variations
-
-
-def list_is_changing_within_limits(
-    number_list: list[int], next_item_min_diff: int, next_item_max_diff: int
-) -> bool:
-    last_item = None
-    for current_item in number_list:
-        if not level_change_safe(
-            current_item=current_item,
-            last_item=last_item,
-            next_item_min_diff=next_item_min_diff,
-            next_item_max_diff=next_item_max_diff,
-        ):
             return False
-        last_item = current_item
-    return True
 
-
-def level_change_safe(
-    current_item: int,
-    last_item: Optional[int],
-    next_item_min_diff: int,
-    next_item_max_diff: int,
-) -> bool:
-    if last_item is None:
-        return True
-    last_item_diff = current_item - last_item
-    return next_item_min_diff <= last_item_diff <= next_item_max_diff
+        first_faulty = faulty.index(True)
+        for removed_level in (first_faulty, first_faulty + 1):
+            remaining_faulty_count = faulty_count
+            if removed_level > 0:
+                remaining_faulty_count -= faulty[removed_level - 1]
+            if removed_level < len(diffs):
+                remaining_faulty_count -= faulty[removed_level]
+            if remaining_faulty_count:
+                continue
+            if 0 < removed_level < len(diffs):
+                merged_diff = diffs[removed_level - 1] + diffs[removed_level]
+                if not next_item_min_diff <= merged_diff <= next_item_max_diff:
+                    continue
+            return True
+        return False
+
+
+def count_safe_reports_in_batch(reports: list[list[int]], can_ignore_one_level: bool = False) -> int:
+    """
+    Same check as Report.is_safe for all reports at once. Reports are padded to equal length, padded differences
+    are never faulty, and every possible removal is evaluated as one column operation over all reports.
+    :raise RunException: If NumPy is not installed.
+    """
+    if numpy is None:
+        raise RunException('NumPy is not installed')
+    if not reports:
+        return 0
+
+    lengths = numpy.array([len(report) for report in reports])
+    width = int(lengths.max())
+    levels = numpy.zeros((len(reports), width), dtype=numpy.int64)
+    for row, report in enumerate(reports):
+        levels[row, :len(report)] = report
+
+    diffs = numpy.diff(levels, axis=1)
+    diff_is_real = numpy.arange(width - 1)[None, :] < (lengths - 1)[:, None]
+    safe = numpy.zeros(len(reports), dtype=bool)
+    for min_diff, max_diff in (DECREASING_LIMITS, INCREASING_LIMITS):
+        faulty = ((diffs < min_diff) | (diffs > max_diff)) & diff_is_real
+        faulty_count = faulty.sum(axis=1)
+        safe |= faulty_count == 0
+        if not can_ignore_one_level:
+            continue
+
+        for removed_level in range(width):
+            remaining_faulty_count = faulty_count.copy()
+            merged_ok = numpy.ones(len(reports), dtype=bool)
+            if removed_level > 0:
+                remaining_faulty_count -= faulty[:, removed_level - 1]
+            if removed_level < width - 1:
+                remaining_faulty_count -= faulty[:, removed_level]
+            if 0 < removed_level < width - 1:
+                merged_diff = diffs[:, removed_level - 1] + diffs[:, removed_level]
+                has_merged_diff = diff_is_real[:, removed_level]
+                merged_ok = ~has_merged_diff | ((merged_diff >= min_diff) & (merged_diff <= max_diff))
+            safe |= (remaining_faulty_count == 0) & merged_ok & (removed_level < lengths)
+    return int(safe.sum())
 
 
 class DayRunner(AbstractDay):
@@ -81,19 +114,18 @@ class DayRunner(AbstractDay):
         self.input_loader = input_loader
 
     def run_part_one(self):
-        input_lists = self.input_loader.load_input_array_of_array(
-            subarray_separator="\n", item_separator=" ", retype_item_to_int=True
-        )
-        reports = [Report(input_list) for input_list in input_lists]
-        return len([1 for r in reports if r.is_all_decreasing_safely() or r.is_all_increasing_safely()])
+        return self.count_safe_reports(can_ignore_one_level=False)
 
     def run_part_two(self):
-        input_lists = self.input_loader.load_input_array_of_array(
-            subarray_separator="\n", item_separator=" ", retype_item_to_int=True
-        )
-        reports = [Report(input_list) for input_list in input_lists]
-        return len([
-            1
-            for r in reports
-            if r.is_all_decreasing_safely(can_ignore_one_level=True) or r.is_all_increasing_safely(can_ignore_one_level=True)
-        ])
+        return self.count_safe_reports(can_ignore_one_level=True)
+
+    def count_safe_reports(self, can_ignore_one_level: bool) -> int:
+        if numpy is not None:
+            reports = [report.levels for report in load_reports(self.input_loader)]
+            return count_safe_reports_in_batch(reports, can_ignore_one_level)
+        return sum(1 for report in load_reports(self.input_loader) if report.is_safe(can_ignore_one_level))
+
+
+def load_reports(input_loader: InputLoader) -> Generator[Report, None, None]:
+    for line in input_loader.load_input_as_generator(item_separator="\n"):
+        yield Report([int(level) for level in line.split(" ")])
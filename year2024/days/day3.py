@@ -1,20 +1,15 @@
-from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 import re
 
 from lib.abstract_day import AbstractDay
 from helpers import InputLoader
 
 
-BASIC_MULTIPLICATION_REGEX = r"mul\(\d+,\d+\)"
-DO_DONT_MUL_REGEX = r"(mul\(\d+,\d+\)|do(n't)?\(\))"
-
-
-class MultiplicationItem:
-    def __init__(self, string: str):
-        first_number_string, second_number_string = string.replace("mul(", "").replace(")", "").split(",")
-        self.first_number = int(first_number_string)
-        self.second_number = int(second_number_string)
+INSTRUCTION_REGEX = re.compile(r"mul\((\d+),(\d+)\)|do\(\)|don't\(\)")
+# any unfinished instruction at the end of a chunk, the instruction may get completed by the next chunk
+PARTIAL_INSTRUCTION_REGEX = re.compile(r"m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?")
+DO_INSTRUCTION = "do()"
+DONT_INSTRUCTION = "don't()"
 
 
 class DayRunner(AbstractDay):
@@ -25,35 +20,40 @@ class DayRunner(AbstractDay):
         self.input_loader = input_loader
 
     def run_part_one(self):
-        multiplications = load_multiplications(self.input_loader.load_input())
-        return sum((mi.first_number * mi.second_number for mi in multiplications))
+        return sum_multiplications(self.input_loader.load_input_chunks(), honor_conditionals=False)
 
     def run_part_two(self):
-        multiplications = load_only_valid_multiplications(self.input_loader.load_input())
-        return sum((mi.first_number * mi.second_number for mi in multiplications))
-
-
-def load_multiplications(input_string: str) -> list[MultiplicationItem]:
-    multiplication_items = []
-    for multiplication_string in re.findall(BASIC_MULTIPLICATION_REGEX, input_string):
-        multiplication_items.append(MultiplicationItem(multiplication_string))
-    return multiplication_items
+        return sum_multiplications(self.input_loader.load_input_chunks(), honor_conditionals=True)
 
 
-def load_only_valid_multiplications(input_string: str) -> list[MultiplicationItem]:
-    multiplication_items = []
+def sum_multiplications(chunks: Iterable[str], honor_conditionals: bool) -> int:
+    """
+    Sum the products of all mul(a,b) instructions while streaming over the input chunks. An instruction cut by a
+    chunk boundary is carried over to the next chunk, together with the do()/don't() state.
+    :param chunks: Consecutive pieces of the corrupted memory
+    :param honor_conditionals: If true, multiplications after don't() are skipped until the next do().
+    """
+    total = 0
     enabled = True
-
-    for instruction_item, _ in re.findall(DO_DONT_MUL_REGEX, input_string):  # _ for the second capture group we do not care about
-        if instruction_item == "do()":
-            enabled = True
-        elif instruction_item == "don't()":
-            enabled = False
-        elif instruction_item.startswith("mul"):
-            if enabled:
-                multiplication_items.append(MultiplicationItem(instruction_item))
-        else:
-            raise RuntimeError(f"Unrecognized instruction item: {instruction_item}")
-
-    return multiplication_items
-
+    carry = ""
+    for chunk in chunks:
+        buffer = carry + chunk
+        consumed = 0
+        for match in INSTRUCTION_REGEX.finditer(buffer):
+            first_number, second_number = match.groups()
+            if first_number is not None:
+                if enabled:
+                    total += int(first_number) * int(second_number)
+            elif honor_conditionals:
+                enabled = match.group() == DO_INSTRUCTION
+            consumed = match.end()
+        carry = _unfinished_instruction(buffer, consumed)
+    return total
+
+
+def _unfinished_instruction(buffer: str, consumed: int) -> str:
+    # an unfinished instruction contains neither another "m" nor "d", so it can only start at the last of them
+    start = max(buffer.rfind("m", consumed), buffer.rfind("d", consumed))
+    if start >= 0 and PARTIAL_INSTRUCTION_REGEX.fullmatch(buffer, start):
+        return buffer[start:]
+    return ""
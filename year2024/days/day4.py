@@ -1,9 +1,14 @@
-from typing import Optional, Generator
+from typing import Optional
 from enum import Enum
 
 from lib.abstract_day import AbstractDay
 from helpers import InputLoader
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class CrosswordDirection(Enum):
     DOWN = 0
@@ -16,132 +21,94 @@ class CrosswordDirection(Enum):
     UP_LEFT = 7
 
 
-class ABox:
-    def __init__(self, up_left: str, up_right: str, down_left: str, down_right: str):
-        self.up_left = up_left
-        self.up_right = up_right
-        self.down_left = down_left
-        self.down_right = down_right
+class CrosswordScanner:
+    """
+    Scans text lines of equal length. Lines of the four line families (rows, columns and both diagonal directions)
+    are built once as strings by strided slicing of the joined grid; the opposite directions are covered by also
+    searching the reversed words.
+    """
+    def __init__(self, lines: list[str]):
+        self.lines = lines
+        self.row_count = len(lines)
+        self.col_count = len(lines[0]) if lines else 0
+        self._line_families: Optional[dict[CrosswordDirection, list[str]]] = None
+
+    @property
+    def line_families(self) -> dict[CrosswordDirection, list[str]]:
+        if self._line_families is None:
+            self._line_families = self._build_line_families()
+        return self._line_families
+
+    def _build_line_families(self) -> dict[CrosswordDirection, list[str]]:
+        text = "".join(self.lines)
+        rows, cols = self.row_count, self.col_count
+        down_right_step, down_left_step = cols + 1, cols - 1
+
+        # diagonals start in the first row or in the first (last respectively) column
+        down_right = [text[col:col + min(rows, cols - col) * down_right_step:down_right_step] for col in range(cols)]
+        down_right += [
+            text[row * cols:row * cols + min(rows - row, cols) * down_right_step:down_right_step]
+            for row in range(1, rows)
+        ]
+        if cols > 1:
+            down_left = [text[col:col + min(rows, col + 1) * down_left_step:down_left_step] for col in range(cols)]
+            down_left += [
+                text[row * cols + cols - 1::down_left_step][:min(rows - row, cols)] for row in range(1, rows)
+            ]
+        else:  # a single column has single char diagonals and zero is not a valid slice step
+            down_left = list(text)
+
+        return {
+            CrosswordDirection.RIGHT: self.lines,
+            CrosswordDirection.DOWN: [text[col::cols] for col in range(cols)],
+            CrosswordDirection.DOWN_RIGHT: down_right,
+            CrosswordDirection.DOWN_LEFT: down_left,
+        }
+
+    def count_words(self, words: list[str]) -> int:
+        """
+        Count occurrences of the words in all eight directions, overlapping occurrences included.
+        """
+        patterns = set(words) | {word[::-1] for word in words}
+        return sum(
+            count_overlapping(line, pattern)
+            for family in self.line_families.values()
+            for line in family
+            for pattern in patterns
+        )
+
+    def count_x_mas(self) -> int:
+        """
+        Count "A"s which have "M" and "S" at opposite ends of both diagonals, by comparing the grid with its
+        diagonally shifted copies.
+        """
+        if self.row_count < 3 or self.col_count < 3:
+            return 0
+        if numpy is not None:
+            return self._count_x_mas_numpy()
 
-    def is_xmas(self) -> bool:
         count = 0
-        if self.up_left == "M":
-            if self.down_right == "S":
-                count += 1
-        elif self.up_left == "S":
-            if self.down_right == "M":
-                count += 1
-
-        if self.up_right == "M":
-            if self.down_left == "S":
-                count += 1
-        elif self.up_right == "S":
-            if self.down_left == "M":
-                count += 1
-        return count == 2
-
-
-class CrosswordMap:
-    def __init__(self, crossword_array: list[list[str]]):
-        self.crossword_rows = crossword_array
-
-    def slice_lines_across_direction(self, direction: CrosswordDirection) -> Generator[list[str], None, None]:
-        # cardinal directions
-        if direction == CrosswordDirection.DOWN:
-            return self._slice_lines_vertical()
-        if direction == CrosswordDirection.UP:
-            return self._slice_lines_vertical(reverse=True)
-        if direction == CrosswordDirection.RIGHT:
-            return self._slice_lines_horizontal()
-        if direction == CrosswordDirection.LEFT:
-            return self._slice_lines_horizontal(reverse=True)
-        # diagonals
-        if direction == CrosswordDirection.DOWN_RIGHT:
-            return self._slice_main_diagonal()
-        if direction == CrosswordDirection.DOWN_LEFT:
-            return self._slice_side_diagonal()
-        if direction == CrosswordDirection.UP_LEFT:
-            return self._slice_main_diagonal(reverse=True)
-        if direction == CrosswordDirection.UP_RIGHT:
-            return self._slice_side_diagonal(up_right=True)
-
-    def _slice_lines_horizontal(self, reverse: bool = False) -> Generator[list[str], None, None]:
-        if not reverse:
-            return (line for line in self.crossword_rows)
-        return (line[::-1] for line in self.crossword_rows)
-
-    def _slice_lines_vertical(self, reverse: bool = False) -> Generator[list[str], None, None]:
-        col = 0
-        while col < len(self.crossword_rows[0]):
-            if not reverse:
-                yield [line[col] for line in self.crossword_rows]
-            else:
-                yield [line[col] for line in self.crossword_rows[::-1]]
-            col += 1
-
-    def _slice_main_diagonal(self, reverse: bool = False, allow_unsorted: bool = True) -> Generator[list[str], None, None]:
-        if not allow_unsorted:
-            raise NotImplementedError()
-
-        def reverse_if_needed(item: list[str]) -> list[str]:
-            if reverse:
-                return item[::-1]
-            return item
-
-        row_length = len(self.crossword_rows[0])
-        # main diagonal + under main diagonal
-        for diagonal_offset_index in range(len(self.crossword_rows)):
-            yield reverse_if_needed(
-                [
-                    row[i - diagonal_offset_index]
-                    for i, row
-                    in enumerate(self.crossword_rows)
-                    if 0 <= i - diagonal_offset_index < row_length
-                ]
-            )
-
-        # over main diagonal
-        for diagonal_offset_index in range(1, len(self.crossword_rows[0])):
-            yield reverse_if_needed(
-                [
-                    row[i + diagonal_offset_index]
-                    for i, row
-                    in enumerate(self.crossword_rows)
-                    if 0 <= i + diagonal_offset_index < row_length
-                ]
-            )
-
-    def _slice_side_diagonal(self, up_right: bool = False) -> Generator[list[str], None, None]:
-        row_col_offset = 0
-        row_length = len(self.crossword_rows[0])
-        col_length = len(self.crossword_rows)
-        max_row_col_offset = row_length + col_length - 2
-        while row_col_offset <= max_row_col_offset:
-            yield_item = [
-                row[row_col_offset - row_index]
-                for row_index, row
-                in enumerate(self.crossword_rows)
-                if 0 <= row_col_offset - row_index < row_length
-            ]
-            if not up_right:
-                yield yield_item
-            else:
-                yield yield_item[::-1]
-            row_col_offset += 1
-
-    def gather_a_boxes(self) -> Generator[ABox, None, None]:
-        row_count = len(self.crossword_rows)
-        col_count = len(self.crossword_rows[0])
-
-        for row_index, row in enumerate(self.crossword_rows):
-            for col_index, char in enumerate(row):
-                if char == "A" and 0 < row_index < row_count - 1 and 0 < col_index < col_count - 1:
-                    yield ABox(
-                        up_right=self.crossword_rows[row_index-1][col_index+1],
-                        up_left=self.crossword_rows[row_index-1][col_index-1],
-                        down_right=self.crossword_rows[row_index+1][col_index+1],
-                        down_left=self.crossword_rows[row_index+1][col_index-1],
-                    )
+        diagonal_ends = {("M", "S"), ("S", "M")}
+        for above, middle, below in zip(self.lines, self.lines[1:], self.lines[2:]):
+            col = middle.find("A", 1, self.col_count - 1)
+            while col >= 0:
+                main_diagonal = (above[col - 1], below[col + 1])
+                side_diagonal = (above[col + 1], below[col - 1])
+                if main_diagonal in diagonal_ends and side_diagonal in diagonal_ends:
+                    count += 1
+                col = middle.find("A", col + 1, self.col_count - 1)
+        return count
+
+    def _count_x_mas_numpy(self) -> int:
+        grid = numpy.frombuffer("".join(self.lines).encode("latin-1"), dtype=numpy.uint8)
+        grid = grid.reshape(self.row_count, self.col_count)
+        middle = grid[1:-1, 1:-1]
+        up_left, up_right = grid[:-2, :-2], grid[:-2, 2:]
+        down_left, down_right = grid[2:, :-2], grid[2:, 2:]
+        m, s = ord("M"), ord("S")
+        main_diagonal = ((up_left == m) & (down_right == s)) | ((up_left == s) & (down_right == m))
+        side_diagonal = ((up_right == m) & (down_left == s)) | ((up_right == s) & (down_left == m))
+        return int(numpy.count_nonzero((middle == ord("A")) & main_diagonal & side_diagonal))
 
 
 class DayRunner(AbstractDay):
@@ -151,46 +118,22 @@ class DayRunner(AbstractDay):
     def add_input_loader(self, input_loader):
         self.input_loader = input_loader
 
+    def parse(self) -> CrosswordScanner:
+        with self.input_loader.map_input_grid() as grid:
+            # rows are copied out of the mapping, it is closed once the with block ends
+            return CrosswordScanner([bytes(row).decode("ascii") for row in grid.rows()])
+
     def run_part_one(self):
-        input_string_array = self.input_loader.load_input_array(item_separator="\n")
-        crossword_map = CrosswordMap(input_string_array)
-        result = count_crosswords(crossword_map)
-        return result
+        return self.get_parsed_input().count_words(["XMAS"])
 
     def run_part_two(self):
-        input_string_array = self.input_loader.load_input_array(item_separator="\n")
-        crossword_map = CrosswordMap(input_string_array)
-        result = sum(1 for abox in crossword_map.gather_a_boxes() if abox.is_xmas())
-        return result
-
-
-def count_crosswords(crossword_map: CrosswordMap) -> int:
-    matches = 0
-    for direction in CrosswordDirection:
-        for searchable_line in crossword_map.slice_lines_across_direction(direction):
-            matches += count_matches_in_string_list(searchable_line)
-    return matches
-
-
-def count_matches_in_string_list(searchable_line: list[str]) -> int:
-    matches = 0
-    next_to_find = "X"
-    for char in searchable_line:
-        if char != next_to_find:
-            next_to_find = "X"
-            if char != "X":
-                continue
-
-        if next_to_find == "X":
-            next_to_find = "M"
-        elif next_to_find == "M":
-            next_to_find = "A"
-        elif next_to_find == "A":
-            next_to_find = "S"
-        elif next_to_find == "S":
-            matches += 1
-            next_to_find = "X"
-        else:
-            raise RuntimeError(f"Unexpected character in searchline: {next_to_find}")
-
-    return matches
+        return self.get_parsed_input().count_x_mas()
+
+
+def count_overlapping(line: str, word: str) -> int:
+    count = 0
+    index = line.find(word)
+    while index >= 0:
+        count += 1
+        index = line.find(word, index + 1)
+    return count
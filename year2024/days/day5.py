@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cmp_to_key
 from typing import Optional
 
 from lib.abstract_day import AbstractDay
@@ -14,48 +15,17 @@ class PageOrderItem:
 @dataclass
 class PageOrdering:
     items: list[PageOrderItem] = field(default_factory=list)
-    before_pages: dict[int, list[PageOrderItem]] = field(default_factory=dict)
-    after_pages: dict[int, list[PageOrderItem]] = field(default_factory=dict)
-
-    def create_bindings(self):
-        self.before_pages = {}
-        self.after_pages = {}
-
-        for item in self.items:
-            if item.before_page not in self.before_pages:
-                self.before_pages[item.before_page] = [item]
-            else:
-                self.before_pages[item.before_page].append(item)
-
-            if item.after_page not in self.after_pages:
-                self.after_pages[item.after_page] = [item]
-            else:
-                self.after_pages[item.after_page].append(item)
-
-    def get_before_rules_filtered(self, page_filter: list[int]) -> dict[int, list[int]]:
-        before_rules = {}
-        for item in self.items:
-            if item.before_page not in page_filter or item.after_page not in page_filter:
-                continue
-
-            if item.before_page not in before_rules:
-                before_rules[item.before_page] = [item.after_page]
-            else:
-                before_rules[item.before_page].append(item.after_page)
-        return before_rules
-
-    def get_where_page_is_before(self, page_number: int) -> list[PageOrderItem]:
-        return self.before_pages.get(page_number, [])
-
-    def get_where_page_is_after(self, page_number: int) -> list[PageOrderItem]:
-        return self.after_pages.get(page_number, [])
-
-    def rule_exists(self, before_page: int, after_page: int) -> bool:
-        before_rules = self.get_where_page_is_before(before_page)
-        for rule in before_rules:
-            if rule.after_page == after_page:
-                return True
-        return False
+    precedence: frozenset[tuple[int, int]] = frozenset()
+
+    def create_bindings(self) -> None:
+        self.precedence = frozenset((item.before_page, item.after_page) for item in self.items)
+
+    def compare(self, page_a: int, page_b: int) -> int:
+        if (page_a, page_b) in self.precedence:
+            return -1
+        if (page_b, page_a) in self.precedence:
+            return 1
+        return 0
 
 
 @dataclass
@@ -67,45 +37,15 @@ class PageSetItem:
         return self.pages[len(self.pages) // 2]
 
     def is_valid(self, page_ordering: PageOrdering) -> bool:
-        for first_item_index, first_item in enumerate(self.pages):
-            for second_item_index in range(first_item_index + 1, len(self.pages)):
-                second_item = self.pages[second_item_index]
-                if page_ordering.rule_exists(before_page=second_item, after_page=first_item):
-                    return False
-        return True
-
-    def create_correct_order(self, page_ordering: PageOrdering) -> None:
-        applicable_rules = page_ordering.get_before_rules_filtered(self.pages)
-        ordered = []
-        unordered = self.pages
-
-        while len(unordered) > 0:
-            removed_one = False
-            for page_number in unordered:
-                if page_number not in applicable_rules:  # not a key - is not in relationship with any other page to be before it
-                    ordered.append(page_number)
-                    unordered.remove(page_number)
-                    self._cleanse_applicable_rules(page_number, applicable_rules)
-                    removed_one = True
-                    continue
-            if not removed_one:
-                raise RuntimeError("No key was removed. Cyclic dependency detected.")
-
-        self.pages = ordered
-
-    @staticmethod
-    def _cleanse_applicable_rules(removed_number: int, applicable_rules: dict[int, list[int]]) -> None:
-        # remove the dependancy
-        for after_pages in applicable_rules.values():
-            if removed_number in after_pages:
-                after_pages.remove(removed_number)
-        # remove empty entries
-        keys_to_pop = []
-        for key, value in applicable_rules.items():
-            if len(value) == 0:
-                keys_to_pop.append(key)
-        for key in keys_to_pop:
-            applicable_rules.pop(key)
+        """
+        The rules order every pair of pages within an update, so the order relation is total on the update and
+        checking neighbouring pages is enough.
+        """
+        precedence = page_ordering.precedence
+        return not any((second, first) in precedence for first, second in zip(self.pages, self.pages[1:]))
+
+    def sorted_pages(self, page_ordering: PageOrdering) -> list[int]:
+        return sorted(self.pages, key=cmp_to_key(page_ordering.compare))
 
 
 class DayRunner(AbstractDay):
@@ -115,26 +55,23 @@ class DayRunner(AbstractDay):
     def add_input_loader(self, input_loader):
         self.input_loader = input_loader
 
-    def run_part_one(self):
+    def parse(self) -> tuple[PageOrdering, list[PageSetItem]]:
         page_ordering_raw, page_sets_raw = self.input_loader.load_input_array_of_array(
             subarray_separator="\n\n", item_separator="\n"
         )
-        page_ordering = convert_page_ordering(page_ordering_raw)
-        page_sets = convert_page_sets(page_sets_raw)
-        result = sum(page_set.middle_page for page_set in page_sets if page_set.is_valid(page_ordering))
-        return result
+        return convert_page_ordering(page_ordering_raw), convert_page_sets(page_sets_raw)
+
+    def run_part_one(self):
+        page_ordering, page_sets = self.get_parsed_input()
+        return sum(page_set.middle_page for page_set in page_sets if page_set.is_valid(page_ordering))
 
     def run_part_two(self):
-        page_ordering_raw, page_sets_raw = self.input_loader.load_input_array_of_array(
-            subarray_separator="\n\n", item_separator="\n"
-        )
-        page_ordering = convert_page_ordering(page_ordering_raw)
-        page_sets = convert_page_sets(page_sets_raw)
-        wrongly_ordered_page_sets = [page_set for page_set in page_sets if not page_set.is_valid(page_ordering)]
+        page_ordering, page_sets = self.get_parsed_input()
         middle_page_sum = 0
-        for page_set in wrongly_ordered_page_sets:
-            page_set.create_correct_order(page_ordering)
-            middle_page_sum += page_set.middle_page
+        for page_set in page_sets:
+            if not page_set.is_valid(page_ordering):
+                ordered_pages = page_set.sorted_pages(page_ordering)
+                middle_page_sum += ordered_pages[len(ordered_pages) // 2]
         return middle_page_sum
 
 
@@ -155,4 +92,3 @@ def convert_page_sets(page_sets_raw: list[str]) -> list[PageSetItem]:
             item.pages.append(int(number_string))
         page_sets.append(item)
     return page_sets
-
@@ -1,5 +1,9 @@
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
 from helpers import InputLoader
 from lib.abstract_day import AbstractDay
@@ -34,6 +38,12 @@ class Field:
         self.row = row
         self.col = col
 
+    def copy(self) -> 'Field':
+        field_copy = Field(self.type, self.row, self.col)
+        field_copy.visited = self.visited
+        field_copy.visited_directions = self.visited_directions.copy()
+        return field_copy
+
 
 class LabMap:
     fields: list[list[Field]]
@@ -42,8 +52,6 @@ class LabMap:
     row_count: int
     col_count: int
     guard_starting_field: Field
-    possible_obstacle_locations: list[Field]
-    working_makeshift_obstacle_location_count: int
 
     def __init__(self, string_map: list[str]) -> None:
         self.fields = []
@@ -68,18 +76,19 @@ class LabMap:
         self.row_count = len(self.fields)
         self.col_count = len(self.fields[0])
         self.guard_starting_field = self.current_guard_field
-        self.possible_obstacle_locations = []
-        self.working_makeshift_obstacle_location_count = 0
-
-    def reset(self):
-        for field_row in self.fields:
-            for field in field_row:
-                field.visited = False
-                field.visited_directions = []
-                if field.type == FieldType.MAKESHIFT_OBSTACLE:
-                    field.type = FieldType.EMPTY
-        self.current_guard_direction = Direction.UP
-        self.current_guard_field = self.guard_starting_field
+
+    def clone(self) -> 'LabMap':
+        """
+        Copy with its own fields, so the guard can be simulated without touching this map. Much cheaper than deepcopy.
+        """
+        lab_map = LabMap.__new__(LabMap)
+        lab_map.fields = [[field.copy() for field in field_row] for field_row in self.fields]
+        lab_map.row_count = self.row_count
+        lab_map.col_count = self.col_count
+        lab_map.current_guard_direction = self.current_guard_direction
+        lab_map.current_guard_field = lab_map.fields[self.current_guard_field.row][self.current_guard_field.col]
+        lab_map.guard_starting_field = lab_map.fields[self.guard_starting_field.row][self.guard_starting_field.col]
+        return lab_map
 
     @property
     def fields_visited_count(self) -> int:
@@ -99,6 +108,138 @@ class LabMap:
         return new_field
 
 
+EXIT = -1
+GUARD_DIRECTIONS = [Direction.UP, Direction.RIGHT, Direction.DOWN, Direction.LEFT]  # clockwise, index + 1 = turn
+
+
+class GuardSimulator:
+    """
+    Compact guard simulation over flat cell indices (row * col_count + col). For every (direction, cell) there is
+    a precomputed jump to the cell where the guard stops in front of the next obstacle (EXIT when he walks off the
+    map), so the guard moves from turn to turn instead of step by step. A makeshift obstacle is patched into the
+    jumps only where its row or column crosses the guard's way.
+    """
+    def __init__(self, lab_map: LabMap):
+        self.row_count = lab_map.row_count
+        self.col_count = lab_map.col_count
+        self.obstacles = bytearray(
+            1 if field.type == FieldType.OBSTACLE else 0 for field_row in lab_map.fields for field in field_row
+        )
+        self.start = lab_map.guard_starting_field.row * self.col_count + lab_map.guard_starting_field.col
+        self.start_direction = GUARD_DIRECTIONS.index(Direction.UP)
+        self.jumps = [self._build_jumps(direction) for direction in GUARD_DIRECTIONS]
+
+    def _build_jumps(self, direction: Direction) -> array:
+        row_diff, col_diff = direction.value
+        jumps = array('q', [EXIT]) * (self.row_count * self.col_count)
+        # walk every line against the direction of movement, remembering where the guard would stop
+        rows = range(self.row_count) if row_diff <= 0 else range(self.row_count - 1, -1, -1)
+        cols = range(self.col_count) if col_diff <= 0 else range(self.col_count - 1, -1, -1)
+        if row_diff != 0:
+            for col in cols:
+                stop = EXIT
+                for row in rows:
+                    index = row * self.col_count + col
+                    if self.obstacles[index]:
+                        stop = index - row_diff * self.col_count
+                    else:
+                        jumps[index] = stop
+        else:
+            for row in rows:
+                stop = EXIT
+                for col in cols:
+                    index = row * self.col_count + col
+                    if self.obstacles[index]:
+                        stop = index - col_diff
+                    else:
+                        jumps[index] = stop
+        return jumps
+
+    def _next_stop(self, position: int, direction: int, makeshift_obstacle: int) -> int:
+        stop = self.jumps[direction][position]
+        if makeshift_obstacle == EXIT:
+            return stop
+        row, col = divmod(position, self.col_count)
+        obstacle_row, obstacle_col = divmod(makeshift_obstacle, self.col_count)
+        row_diff, col_diff = GUARD_DIRECTIONS[direction].value
+        if row_diff != 0:
+            if obstacle_col != col or (obstacle_row - row) * row_diff <= 0:
+                return stop  # makeshift obstacle is not ahead of the guard
+            if stop != EXIT and (obstacle_row - stop // self.col_count) * row_diff > 0:
+                return stop  # real obstacle comes first
+            return makeshift_obstacle - row_diff * self.col_count
+        if obstacle_row != row or (obstacle_col - col) * col_diff <= 0:
+            return stop
+        if stop != EXIT and (obstacle_col - stop % self.col_count) * col_diff > 0:
+            return stop
+        return makeshift_obstacle - col_diff
+
+    def visited_cells(self) -> list[int]:
+        """
+        :return: Cells the guard walks through without any makeshift obstacle, in order of first visit.
+        :raise LoopDetectedError: If the guard never leaves the map.
+        """
+        seen = bytearray(self.row_count * self.col_count)
+        seen_states = bytearray(self.row_count * self.col_count * 4)
+        visited = []
+        position, direction = self.start, self.start_direction
+        while True:
+            stop = self._next_stop(position, direction, EXIT)
+            row_diff, col_diff = GUARD_DIRECTIONS[direction].value
+            step = row_diff * self.col_count + col_diff
+            row, col = divmod(position, self.col_count)
+            while True:
+                if not seen[position]:
+                    seen[position] = 1
+                    visited.append(position)
+                if position == stop:
+                    break
+                row, col = row + row_diff, col + col_diff
+                if not (0 <= row < self.row_count and 0 <= col < self.col_count):
+                    return visited
+                position += step
+            state = position * 4 + direction
+            if seen_states[state]:
+                raise LoopDetectedError()
+            seen_states[state] = 1
+            direction = (direction + 1) % 4
+
+    def causes_loop(self, makeshift_obstacle: int, seen_states: bytearray) -> bool:
+        """
+        Simulate the guard from turn to turn with the makeshift obstacle placed.
+        :param makeshift_obstacle: Cell index of the makeshift obstacle.
+        :param seen_states: Zeroed bitmap of (cell, direction) states, left zeroed on return so it can be reused.
+        """
+        touched_states = []
+        position, direction = self.start, self.start_direction
+        try:
+            while True:
+                position = self._next_stop(position, direction, makeshift_obstacle)
+                if position == EXIT:
+                    return False
+                state = position * 4 + direction
+                if seen_states[state]:
+                    return True
+                seen_states[state] = 1
+                touched_states.append(state)
+                direction = (direction + 1) % 4
+        finally:
+            for state in touched_states:
+                seen_states[state] = 0
+
+    def candidate_obstacle_locations(self) -> list[int]:
+        """
+        Only cells on the guard's original way can change it, the starting cell is off limits.
+        """
+        return [cell for cell in self.visited_cells() if cell != self.start]
+
+    def count_loop_causing_obstacle_locations(self, candidates: Optional[list[int]] = None) -> int:
+        if candidates is None:
+            candidates = self.candidate_obstacle_locations()
+        seen_states = bytearray(self.row_count * self.col_count * 4)
+        return sum(1 for candidate in candidates if self.causes_loop(candidate, seen_states))
+
+
 class DayRunner(AbstractDay):
     def __init__(self):
         self.input_loader: Optional[InputLoader] = None
@@ -106,18 +247,66 @@ class DayRunner(AbstractDay):
     def add_input_loader(self, input_loader):
         self.input_loader = input_loader
 
+    def parse(self) -> LabMap:
+        return LabMap(self.input_loader.load_input_array(item_separator="\n"))
+
     def run_part_one(self):
-        map_array = self.input_loader.load_input_array(item_separator="\n")
-        lab_map = LabMap(map_array)
+        lab_map = self.get_parsed_input(clone=True)
         simulate_guard_movement(lab_map)
         return lab_map.fields_visited_count
 
     def run_part_two(self):
-        map_array = self.input_loader.load_input_array(item_separator="\n")
-        lab_map = LabMap(map_array)
-        collect_possible_makeshift_obstacle_locations(lab_map)
-        check_each_possible_makeshift_obstacle_location(lab_map)
-        return lab_map.working_makeshift_obstacle_location_count
+        guard_simulator = GuardSimulator(self.get_parsed_input())
+        if self.worker_count is not None and self.worker_count > 1:
+            return count_loop_causing_obstacle_locations_in_parallel(
+                guard_simulator, self.worker_count, record_timing=self.record_timing
+            )
+        return guard_simulator.count_loop_causing_obstacle_locations()
+
+
+_worker_guard_simulator: Optional[GuardSimulator] = None
+
+
+def _init_worker(guard_simulator: GuardSimulator) -> None:
+    # the simulator is shipped to every worker once, chunks then carry only candidate indices
+    global _worker_guard_simulator
+    _worker_guard_simulator = guard_simulator
+
+
+def _count_loops_in_chunk(candidates: list[int]) -> tuple[int, int, int, float]:
+    before = time.perf_counter()
+    loop_count = _worker_guard_simulator.count_loop_causing_obstacle_locations(candidates)
+    return os.getpid(), len(candidates), loop_count, time.perf_counter() - before
+
+
+def count_loop_causing_obstacle_locations_in_parallel(
+    guard_simulator: GuardSimulator, worker_count: int, chunks_per_worker: int = 4,
+    record_timing: Optional[Callable[[str, float], None]] = None
+) -> int:
+    """
+    :param record_timing: Optional callback receiving the busy time of every worker process, see
+    AbstractDay.record_timing.
+    """
+    candidates = guard_simulator.candidate_obstacle_locations()
+    chunk_size = max(1, -(-len(candidates) // (worker_count * chunks_per_worker)))
+    chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+
+    worker_stats = {}
+    loop_count = 0
+    with ProcessPoolExecutor(
+        max_workers=worker_count, initializer=_init_worker, initargs=(guard_simulator,)
+    ) as executor:
+        for pid, candidate_count, chunk_loop_count, elapsed in executor.map(_count_loops_in_chunk, chunks):
+            loop_count += chunk_loop_count
+            stats = worker_stats.setdefault(pid, [0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += candidate_count
+            stats[2] += elapsed
+
+    if record_timing is not None:
+        for pid, (chunk_count, candidate_count, elapsed) in sorted(worker_stats.items()):
+            record_timing(f"worker {pid} ({chunk_count} chunks, {candidate_count} candidates)", elapsed)
+    return loop_count
 
 
 def simulate_guard_movement(lab_map: LabMap) -> None:
@@ -144,34 +333,3 @@ def move_guard_one_step(lab_map: LabMap) -> None:
     next_field.visited = True
     next_field.visited_directions.append(lab_map.current_guard_direction)
     lab_map.current_guard_field = next_field
-
-
-def collect_possible_makeshift_obstacle_locations(lab_map: LabMap) -> None:
-    try:
-        while True:
-            move_guard_one_step(lab_map)
-            if (
-                lab_map.current_guard_field.type != FieldType.GUARD_START and lab_map.current_guard_field
-                not in lab_map.possible_obstacle_locations
-            ):
-                lab_map.possible_obstacle_locations.append(lab_map.current_guard_field)
-    except OutOfBoundsError:
-        lab_map.reset()
-
-
-def check_each_possible_makeshift_obstacle_location(lab_map: LabMap) -> None:
-    for makeshift_location in lab_map.possible_obstacle_locations:
-        makeshift_location.type = FieldType.MAKESHIFT_OBSTACLE
-        if check_one_possible_makeshift_obstacle_location(lab_map):
-            lab_map.working_makeshift_obstacle_location_count += 1
-        lab_map.reset()
-
-
-def check_one_possible_makeshift_obstacle_location(lab_map: LabMap) -> bool:
-    try:
-        while True:
-            move_guard_one_step(lab_map)
-    except OutOfBoundsError:
-        return False
-    except LoopDetectedError:
-        return True
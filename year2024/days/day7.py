@@ -1,7 +1,9 @@
 import itertools
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Generator
+from functools import partial
+from typing import Optional, Generator, Iterable
 
 from lib.abstract_day import AbstractDay
 from helpers import InputLoader
@@ -18,16 +20,10 @@ class Operation(Enum):
         elif self == Operation.MUL:
             return item_a * item_b
         elif self == Operation.CONCAT:
-            return int(f"{item_a}{item_b}")
+            return item_a * next_power_of_ten(item_b) + item_b
         else:
             raise ValueError("Operation not supported")
 
-    @classmethod
-    def create_possible_combinations(cls, n: int, exclude_concat: bool) -> Generator[list['Operation'], None, None]:
-        if exclude_concat:
-            return itertools.product([Operation.ADD, Operation.MUL], repeat=n)
-        return itertools.product([Operation.ADD, Operation.CONCAT, Operation.MUL], repeat=n)
-
 
 @dataclass
 class Equation:
@@ -35,12 +31,36 @@ class Equation:
     numbers: list[int]
 
     def is_solvable(self, exclude_concat: bool) -> bool:
-        for operation_combo in Operation.create_possible_combinations(len(self.numbers) - 1, exclude_concat=exclude_concat):
-            actual_result = self.numbers[0]
-            for number, operation in zip(self.numbers[1:], operation_combo):
-                actual_result = operation.exec(actual_result, number)
-            if actual_result == self.result:
-                return True
+        """
+        Work backwards from the result: the last operation can only have been an addition if the result is at
+        least the last number, a multiplication if it divides exactly and a concatenation if the result ends with
+        the digits of the last number. Most branches die after a step or two.
+        Partial results never drop below the next number, except for a zero prefix multiplied by it, which yields
+        zero. So a target below the number is only reachable as zero, by a prefix evaluating to zero.
+        """
+        numbers = self.numbers
+        stack = [(self.result, len(numbers) - 1)]
+        while stack:
+            target, index = stack.pop()
+            number = numbers[index]
+            if index == 0:
+                if target == number:
+                    return True
+                continue
+            if target < number:
+                if target == 0:
+                    stack.append((0, index - 1))  # zero prefix multiplied by the number
+                continue
+            stack.append((target - number, index - 1))
+            if number == 0:
+                if target == 0:
+                    return True  # anything multiplied by zero
+            elif target % number == 0:
+                stack.append((target // number, index - 1))
+            if not exclude_concat:
+                prefix, suffix = divmod(target, next_power_of_ten(number))
+                if suffix == number:
+                    stack.append((prefix, index - 1))
         return False
 
 
@@ -52,22 +72,46 @@ class DayRunner(AbstractDay):
         self.input_loader = input_loader
 
     def run_part_one(self):
-        input_array = self.input_loader.load_input_array(item_separator="\n")
-        equations = load_equations_from_input(input_array)
-        return sum(equation.result for equation in equations if equation.is_solvable(exclude_concat=True))
+        return self.sum_solvable_results(exclude_concat=True)
 
     def run_part_two(self):
-        input_array = self.input_loader.load_input_array(item_separator="\n")
-        equations = load_equations_from_input(input_array)
-        return sum(equation.result for equation in equations if equation.is_solvable(exclude_concat=False))
+        return self.sum_solvable_results(exclude_concat=False)
+
+    def sum_solvable_results(self, exclude_concat: bool) -> int:
+        input_lines = self.input_loader.load_input_as_generator(item_separator="\n")
+        equations = load_equations_from_input(input_lines)
+        if self.worker_count is not None and self.worker_count > 1:
+            return sum_solvable_results_in_parallel(equations, exclude_concat, self.worker_count)
+        return sum(equation.result for equation in equations if equation.is_solvable(exclude_concat=exclude_concat))
+
+
+def next_power_of_ten(number: int) -> int:
+    """
+    :return: Smallest power of ten greater than the number, the factor shifting a number left by the digits of it.
+    """
+    power_of_ten = 10
+    while power_of_ten <= number:
+        power_of_ten *= 10
+    return power_of_ten
+
+
+def _sum_solvable_results_in_chunk(equations: list[Equation], exclude_concat: bool) -> int:
+    return sum(equation.result for equation in equations if equation.is_solvable(exclude_concat=exclude_concat))
+
+
+def sum_solvable_results_in_parallel(
+    equations: Iterable[Equation], exclude_concat: bool, worker_count: int, chunk_size: int = 64
+) -> int:
+    equations = iter(equations)
+    chunks = iter(lambda: list(itertools.islice(equations, chunk_size)), [])
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        return sum(executor.map(partial(_sum_solvable_results_in_chunk, exclude_concat=exclude_concat), chunks))
 
 
-def load_equations_from_input(input_array: list[str]) -> list[Equation]:
-    equations = []
-    for line in input_array:
+def load_equations_from_input(input_lines: Iterable[str]) -> Generator[Equation, None, None]:
+    for line in input_lines:
         raw_result, raw_numbers = line.split(": ")
         equation = Equation(int(raw_result), [])
         for raw_number in raw_numbers.split(" "):
             equation.numbers.append(int(raw_number))
-        equations.append(equation)
-    return equations
+        yield equation
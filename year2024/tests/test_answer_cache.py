@@ -0,0 +1,146 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+from lib.abstract_day import AbstractDay
+from lib.answer_cache import AnswerCache, _module_imports
+from lib.argument_parser import ArgumentParser
+from lib.runner import Runner
+
+
+DAY_SOURCE = """
+from {year_package}.days.solver import solve
+
+
+def answer():
+    return solve()
+"""
+
+
+@pytest.fixture
+def day_module(tmp_path, monkeypatch):
+    """
+    Temporary year package with day1 importing a solver module, both sources can be changed by the test.
+    """
+    year_package = 'year9999'
+    days_dir = tmp_path / year_package / 'days'
+    days_dir.mkdir(parents=True)
+    (tmp_path / year_package / '__init__.py').write_text('')
+    (days_dir / '__init__.py').write_text('')
+    (days_dir / 'day1.py').write_text(DAY_SOURCE.format(year_package=year_package))
+    (days_dir / 'solver.py').write_text('def solve():\n    return 1\n')
+    input_path = tmp_path / 'day1_input'
+    input_path.write_text('input\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    yield days_dir, input_path
+    for module_name in [name for name in sys.modules if name.startswith(year_package)]:
+        del sys.modules[module_name]
+
+
+def _make_key(cache_dir, input_path) -> str:
+    # a fresh cache instance, source hashes are memoized per instance
+    return AnswerCache(cache_dir=str(cache_dir)).make_key(1, 9999, 1, input_path)
+
+
+def test_key_changes_with_input_and_code(tmp_path, day_module):
+    days_dir, input_path = day_module
+    original_key = _make_key(tmp_path / 'cache', input_path)
+    assert _make_key(tmp_path / 'cache', input_path) == original_key
+
+    input_path.write_text('other input\n')
+    input_changed_key = _make_key(tmp_path / 'cache', input_path)
+    assert input_changed_key != original_key
+
+    (days_dir / 'solver.py').write_text('def solve():\n    return 2\n')
+    assert _make_key(tmp_path / 'cache', input_path) not in (original_key, input_changed_key)
+
+
+def test_put_get_and_placeholders(tmp_path):
+    cache = AnswerCache(cache_dir=str(tmp_path))
+    cache.put('answer', 42)
+    cache.put('placeholder', '---')
+    cache.put('nothing', None)
+    assert cache.get('answer') == (True, 42)
+    assert cache.get('placeholder') == (False, None)
+    assert cache.get('nothing') == (False, None)
+
+
+def test_answers_changing_in_json_round_trip_are_not_cached(tmp_path):
+    cache = AnswerCache(cache_dir=str(tmp_path))
+    cache.put('tuple', (1, 2))
+    cache.put('list', [1, 2])
+    assert cache.get('tuple') == (False, None)
+    assert cache.get('list') == (True, [1, 2])
+
+
+def test_hit_survives_entry_evicted_by_another_process(tmp_path, monkeypatch):
+    cache = AnswerCache(cache_dir=str(tmp_path))
+    cache.put('answer', 42)
+
+    def evicted_meanwhile(path):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, 'utime', evicted_meanwhile)
+    assert cache.get('answer') == (True, 42)
+
+
+def test_config_counts_as_local_module():
+    source = 'import config\nimport configparser\nfrom lib.models import DenseGrid\nimport numpy\n'
+    assert _module_imports(source, 'year9999.days.day1') == {'config', 'lib.models', 'lib.models.DenseGrid'}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = AnswerCache(cache_dir=str(tmp_path), max_bytes=60)
+    for age, key in enumerate(['oldest', 'older', 'newer']):
+        cache.put(key, 'x' * 5)
+        os.utime(tmp_path / (key + '.json'), (1000 + age, 1000 + age))
+    cache.get('oldest')  # using an entry makes it the most recent one
+    cache.put('newest', 'x' * 5)
+    assert cache.get('older') == (False, None)
+    assert cache.get('oldest') == (True, 'x' * 5)
+    assert cache.get('newest') == (True, 'x' * 5)
+    assert sum(path.stat().st_size for path in tmp_path.glob('*.json')) <= 60
+
+
+class CountingDay(AbstractDay):
+    cacheable_parts = (1,)
+
+    def __init__(self):
+        self.calls = 0
+
+    def add_input_loader(self, input_loader):
+        pass
+
+    def run_part_one(self):
+        self.calls += 1
+        return 'one'
+
+    def run_part_two(self):
+        self.calls += 1
+        return 'two'
+
+
+def test_runner_serves_cacheable_parts_only(tmp_path, monkeypatch):
+    input_path = tmp_path / 'input'
+    input_path.write_text('input\n')
+    monkeypatch.setattr(Runner, '_input_filepath', staticmethod(lambda day, year: input_path))
+    monkeypatch.setattr(AnswerCache, 'make_key', lambda self, day, year, part, path: f'{year}-{day}-{part}')
+    cache = AnswerCache(cache_dir=str(tmp_path / 'cache'))
+    day = CountingDay()
+
+    assert Runner.run_part_cached(day, 1, 9999, 1, cache) == ('one', False)
+    assert Runner.run_part_cached(day, 1, 9999, 1, cache) == ('one', True)
+    assert Runner.run_part_cached(day, 1, 9999, 2, cache) == ('two', False)
+    assert Runner.run_part_cached(day, 1, 9999, 2, cache) == ('two', False)
+    assert Runner.run_part_cached(day, 1, 9999, 1, None) == ('one', False)
+    assert day.calls == 4
+
+
+def test_no_cache_flag(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['main.py', '-r', '-d', '1', '--no-cache'])
+    assert ArgumentParser().parse().use_cache is False
+    monkeypatch.setattr(sys, 'argv', ['main.py', '-r', '-d', '1'])
+    assert ArgumentParser().parse().use_cache is True
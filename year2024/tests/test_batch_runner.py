@@ -0,0 +1,80 @@
+import importlib
+import sys
+
+import pytest
+
+from lib.argument_parser import ArgumentParser
+from lib.batch_runner import BatchJob, BatchRunner
+from lib.exceptions import ArgumentException
+
+
+DAY_SOURCE = """
+import time
+
+from lib.abstract_day import AbstractDay
+
+
+class DayRunner(AbstractDay):
+    def add_input_loader(self, input_loader):
+        pass
+
+    def run_part_one(self):
+        # earlier days finish last, so the results arrive out of order
+        time.sleep({delay})
+        return {day} * 10 + 1
+
+    def run_part_two(self):
+        return {day} * 10 + 2, self.worker_count
+"""
+
+
+@pytest.fixture
+def year_root(tmp_path, monkeypatch):
+    """
+    Temporary year package with days 1 to 3 as current working directory, like the repository root is.
+    """
+    year_package = 'year9998'
+    days_dir = tmp_path / year_package / 'days'
+    inputs_dir = tmp_path / year_package / 'inputs'
+    days_dir.mkdir(parents=True)
+    inputs_dir.mkdir()
+    (tmp_path / year_package / '__init__.py').write_text('')
+    (days_dir / '__init__.py').write_text('')
+    for day in range(1, 4):
+        (days_dir / f'day{day}.py').write_text(DAY_SOURCE.format(day=day, delay=(4 - day) * 0.05))
+        (inputs_dir / f'day{day}_input').write_text('input\n')
+    (days_dir / 'helpers.py').write_text('')  # not a day, has to be skipped
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    yield tmp_path
+    for module_name in [name for name in sys.modules if name.startswith(year_package)]:
+        del sys.modules[module_name]
+
+
+def test_collect_jobs_in_stable_order(year_root):
+    assert BatchRunner.discover_days(year_root) == {9998: [1, 2, 3]}
+    assert BatchRunner.collect_jobs([9998], [3, 1], 0) == [
+        BatchJob(9998, 1, 1), BatchJob(9998, 1, 2), BatchJob(9998, 3, 1), BatchJob(9998, 3, 2),
+    ]
+
+
+def test_results_come_back_in_job_order(year_root, capsys):
+    results = BatchRunner.run([9998], None, 0, batch_workers=3, use_cache=False)
+    assert [job_result.job for job_result in results] == BatchRunner.collect_jobs([9998], None, 0)
+    assert [job_result.result for job_result in results] == [11, (12, None), 21, (22, None), 31, (32, None)]
+    assert all(job_result.error is None and not job_result.cached for job_result in results)
+    assert '6 jobs (0 failed)' in capsys.readouterr().out
+
+
+def test_day_workers_are_forwarded_to_the_days(year_root, capsys):
+    results = BatchRunner.run([9998], [2], 2, batch_workers=1, use_cache=False, day_workers=4)
+    assert [job_result.result for job_result in results] == [(22, 4)]
+
+
+def test_batch_mode_rejects_timing(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['main.py', '-a', '-t'])
+    with pytest.raises(ArgumentException):
+        ArgumentParser().parse()
+    monkeypatch.setattr(sys, 'argv', ['main.py', '-a'])
+    assert ArgumentParser().parse().batch
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from lib import benchmark
+from lib.abstract_day import AbstractDay
+from lib.batch_runner import BatchJob
+from lib.benchmark import Benchmark, BenchmarkStats
+from lib.exceptions import BenchmarkRegressionException
+from lib.runner import Runner
+
+
+def test_stats_percentiles():
+    stats = BenchmarkStats.from_samples([50, 10, 40, 20, 30])
+    assert (stats.runs, stats.min_ns, stats.median_ns, stats.p95_ns) == (5, 10, 30, 50)
+    assert stats.stddev_ns == pytest.approx(15.811, abs=1e-3)
+
+    stats = BenchmarkStats.from_samples(list(range(1, 101)))
+    assert (stats.median_ns, stats.p95_ns) == (50.5, 95)
+
+
+def test_stats_of_single_sample():
+    assert BenchmarkStats.from_samples([7]) == BenchmarkStats(runs=1, min_ns=7, median_ns=7, p95_ns=7, stddev_ns=0.0)
+
+
+def test_regression_check_against_baseline():
+    results = {'2024/1/1': BenchmarkStats.from_samples([110]), '2024/1/2': BenchmarkStats.from_samples([500])}
+    # within threshold, jobs missing in the baseline are not compared
+    Benchmark._check_regressions(results, {'2024/1/1': {'median_ns': 100}}, threshold=0.1)
+    with pytest.raises(BenchmarkRegressionException, match='2024/1/1'):
+        Benchmark._check_regressions(results, {'2024/1/1': {'median_ns': 99}}, threshold=0.1)
+
+
+def test_run_saves_baseline_and_gates_regressions(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(benchmark, 'get_git_revision', lambda: 'abc1234')
+    medians = iter([100, 200])
+    monkeypatch.setattr(Benchmark, 'measure', staticmethod(
+        lambda job, runs, warmup_runs, workers: BenchmarkStats.from_samples([next(medians)] * runs)
+    ))
+    jobs = [BatchJob(2024, 1, 1)]
+
+    Benchmark.run(jobs, runs=3, save_baseline=True)
+    assert (tmp_path / 'bench_baseline.json').exists()
+    with pytest.raises(BenchmarkRegressionException, match='abc1234'):
+        Benchmark.run(jobs, runs=3)
+    assert json.loads((tmp_path / 'bench_results.json').read_text())['abc1234']['2024/1/1']['median_ns'] == 200
+
+
+class IdleDay(AbstractDay):
+    def add_input_loader(self, input_loader):
+        pass
+
+    def run_part_one(self):
+        return self.worker_count
+
+    def run_part_two(self):
+        return self.worker_count
+
+
+def test_measure_forwards_worker_count(monkeypatch):
+    prepared_days = []
+
+    def prepare_day_runner(day, year, workers=None):
+        prepared_days.append(IdleDay())
+        prepared_days[-1].add_worker_count(workers)
+        return prepared_days[-1]
+
+    monkeypatch.setattr(Runner, 'prepare_day_runner', staticmethod(prepare_day_runner))
+    assert Benchmark.measure(BatchJob(2024, 6, 1), runs=2, warmup_runs=1, workers=3).runs == 2
+    assert [day.worker_count for day in prepared_days] == [3, 3, 3]
@@ -0,0 +1,47 @@
+import pytest
+
+from helpers import InputLoader
+from helpers.byte_grid_view import ByteGridView
+from lib.exceptions import OutOfBoundsError
+
+
+@pytest.mark.parametrize("text", [
+    b"abc\ndef\nghi",
+    b"abc\ndef\nghi\n",
+    b"abc\r\ndef\r\nghi",
+    b"abc\r\ndef\r\nghi\r\n",
+])
+def test_from_text_buffer_line_endings(text: bytes):
+    grid = ByteGridView.from_text_buffer(text)
+    assert (grid.width, grid.height) == (3, 3)
+    assert [bytes(row) for row in grid.rows()] == [b"abc", b"def", b"ghi"]
+
+
+@pytest.mark.parametrize("text", [b"abc\ndef\nghi\n", b"abc\r\ndef\r\nghi\r\n"])
+def test_columns_follow_stride(text: bytes):
+    grid = ByteGridView.from_text_buffer(text)
+    assert [bytes(grid.col(col)) for col in range(grid.width)] == [b"adg", b"beh", b"cfi"]
+    assert grid.get(2, 1) == ord("h")
+    assert text[grid.index(1, 2)] == ord("f")
+
+
+def test_single_line_and_empty_buffer():
+    grid = ByteGridView.from_text_buffer(b"abc")
+    assert (grid.width, grid.height) == (3, 1)
+    assert bytes(grid.col(1)) == b"b"
+    assert ByteGridView.from_text_buffer(b"").height == 0
+
+
+def test_get_out_of_bounds():
+    grid = ByteGridView.from_text_buffer(b"ab\ncd\n")
+    for row, col in [(-1, 0), (0, -1), (2, 0), (0, 2)]:
+        with pytest.raises(OutOfBoundsError):
+            grid.get(row, col)
+
+
+def test_map_input_grid(tmp_path):
+    input_path = tmp_path / "input"
+    input_path.write_bytes(b"12\r\n34\r\n")
+    with InputLoader(input_path).map_input_grid() as grid:
+        assert [bytes(row) for row in grid.rows()] == [b"12", b"34"]
+        assert bytes(grid.col(1)) == b"24"
@@ -0,0 +1,42 @@
+from year2024.days.day11 import (
+    DayRunner, StoneLine, blink_stone, count_digits, count_stone_line, count_stone_line_for_blinks, count_stones,
+)
+
+
+def test_blink_stone_splits_digits_arithmetically():
+    assert blink_stone(0) == (1,)
+    assert blink_stone(1000) == (10, 0)
+    assert blink_stone(253000) == (253, 0)
+    assert blink_stone(125) == (253000,)
+
+
+def test_batched_blink_counts_match_single_queries():
+    assert count_stone_line_for_blinks([125, 17], [25, 6]) == {6: 22, 25: 55312}
+    assert count_stone_line([125, 17], 25) == 55312
+
+
+def test_count_digits_beyond_precomputed_powers():
+    assert count_digits(10 ** 63) == 64
+    assert count_digits(10 ** 64) == 65
+    assert count_digits(10 ** 100 - 1) == 100
+    # 65 digits is odd, the stone has to be multiplied instead of split
+    assert blink_stone(10 ** 64) == (10 ** 64 * 2024,)
+
+
+def test_stone_line_reuses_evaluated_blinks():
+    stone_line = StoneLine.from_values([125, 17])
+    assert stone_line.count_stones_after(6) == 22
+    assert stone_line.count_stones_after(3) == count_stone_line([125, 17], 3)
+    assert stone_line.blinks == 6
+    assert stone_line.count_stones_after(25) == 55312
+    assert len(stone_line.counts_per_blink) == 26
+    assert count_stones(0, 4) == count_stone_line([0], 4) == 4  # 0, 1, 2024, 20 24, 2 0 2 4
+
+
+def test_parts_share_the_stone_line_of_one_runner_only():
+    first_runner, second_runner = DayRunner(), DayRunner()
+    for runner in (first_runner, second_runner):
+        runner._parsed_input = StoneLine.from_values([125, 17])
+    assert first_runner.run_part_one() == 55312
+    assert first_runner.get_parsed_input().blinks == 25
+    assert second_runner.get_parsed_input().blinks == 0
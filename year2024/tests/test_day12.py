@@ -0,0 +1,30 @@
+from year2024.days.day12 import Farm, Region, label_regions, label_regions_in_parallel
+
+
+TEST_FARM = """
+RRRRIICCFF
+RRRRIICCCF
+VVRRRCCFFF
+VVRCCCJFFF
+VVVVCJJCFE
+VVIVCCJJEE
+VVIIICJJEE
+MIIIIIJJEE
+MIIISIJEEE
+MMMISSJEEE
+"""
+
+
+def test_fence_prices():
+    regions = label_regions(Farm(TEST_FARM.strip().splitlines()))
+    assert sum(region.area * region.perimeter for region in regions) == 1930
+    assert sum(region.area * region.number_of_sides for region in regions) == 1206
+
+
+def region_key(region: Region) -> tuple[str, int, int, int]:
+    return region.plant, region.area, region.perimeter, region.corners
+
+
+def test_parallel_strips_are_merged():
+    farm = Farm(TEST_FARM.strip().splitlines())
+    assert sorted(label_regions_in_parallel(farm, 3), key=region_key) == sorted(label_regions(farm), key=region_key)
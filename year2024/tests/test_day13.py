@@ -0,0 +1,24 @@
+from year2024.days.day13 import Button, ClawMachine, cheapest_presses_on_line
+
+
+def test_cramers_rule_solution():
+    claw_machine = ClawMachine(Button(94, 34), Button(22, 67), x_goal=8400, y_goal=5400)
+    assert claw_machine.find_cheapest_winning_move().price == 280
+    assert ClawMachine(Button(26, 66), Button(67, 21), x_goal=12748, y_goal=12176).find_cheapest_winning_move() is None
+
+
+def test_collinear_buttons_pick_cheapest_solution():
+    # B moves twice as far as A for a third of the price, so as many B presses as possible
+    claw_machine = ClawMachine(Button(1, 2), Button(2, 4), x_goal=7, y_goal=14)
+    winning_move = claw_machine.find_cheapest_winning_move()
+    assert (winning_move.a_presses, winning_move.b_presses) == (1, 3)
+    # A moves four times as far as B, which outweighs its triple price
+    assert cheapest_presses_on_line(4, 1, 9).a_presses == 2
+    assert ClawMachine(Button(1, 2), Button(2, 4), x_goal=7, y_goal=13).find_cheapest_winning_move() is None
+
+
+def test_buttons_without_movement():
+    assert ClawMachine(Button(0, 0), Button(0, 0), x_goal=1, y_goal=0).find_cheapest_winning_move() is None
+    assert ClawMachine(Button(0, 0), Button(0, 0), x_goal=0, y_goal=1).find_cheapest_winning_move() is None
+    winning_move = ClawMachine(Button(0, 0), Button(0, 0), x_goal=0, y_goal=0).find_cheapest_winning_move()
+    assert winning_move.price == 0
@@ -0,0 +1,27 @@
+from year2024.days.day14 import combine_with_crt, load_robot_swarm
+
+
+TEST_ROBOTS = """
+p=0,4 v=3,-3
+p=6,3 v=-1,-3
+p=10,3 v=-1,2
+p=2,0 v=2,-1
+p=0,0 v=1,3
+p=3,0 v=-2,-2
+p=7,6 v=-1,-3
+p=3,0 v=-1,-2
+p=9,3 v=2,3
+p=7,3 v=-1,2
+p=2,4 v=2,-3
+p=9,5 v=-3,-3
+"""
+
+
+def test_quadrants_after_100_seconds():
+    robot_swarm = load_robot_swarm(TEST_ROBOTS.strip().splitlines(), width=11, height=7)
+    assert robot_swarm.calculate_robot_counts_in_quadrants(100) == (1, 3, 4, 1)
+
+
+def test_combine_with_crt():
+    time = combine_with_crt(30, 101, 50, 103)
+    assert time % 101 == 30 and time % 103 == 50 and 0 <= time < 101 * 103
@@ -0,0 +1,20 @@
+from year2024.days.day2 import Report
+
+
+TEST_REPORTS = [
+    [7, 6, 4, 2, 1],
+    [1, 2, 7, 8, 9],
+    [9, 7, 6, 2, 1],
+    [1, 3, 2, 4, 5],
+    [8, 6, 4, 4, 1],
+    [1, 3, 6, 7, 9],
+]
+
+
+def test_single_removal_checker():
+    assert [Report(levels).is_safe() for levels in TEST_REPORTS] == [True, False, False, False, False, True]
+    assert [Report(levels).is_safe(can_ignore_one_level=True) for levels in TEST_REPORTS] == \
+        [True, False, False, True, True, True]
+    # removing the first or the last level only drops one difference
+    assert Report([9, 1, 2, 3]).is_safe(can_ignore_one_level=True)
+    assert Report([1, 2, 3, 9]).is_safe(can_ignore_one_level=True)
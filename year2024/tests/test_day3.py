@@ -0,0 +1,13 @@
+import pytest
+
+from year2024.days.day3 import sum_multiplications
+
+
+TEST_MEMORY = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, len(TEST_MEMORY)])
+def test_instructions_split_across_chunks(chunk_size: int):
+    chunks = [TEST_MEMORY[i:i + chunk_size] for i in range(0, len(TEST_MEMORY), chunk_size)]
+    assert sum_multiplications(chunks, honor_conditionals=False) == 161
+    assert sum_multiplications(chunks, honor_conditionals=True) == 48
@@ -1,6 +1,6 @@
 import pytest
 
-from year2024.days.day4 import CrosswordDirection, CrosswordMap
+from year2024.days.day4 import CrosswordDirection, CrosswordScanner
 
 
 TEST_CROSSWORD_BASIC = [
@@ -15,9 +15,7 @@ BASIC_EXPECTED_DOWN = [
     ["1C", "2C", "3C"],
     ["1D", "2D", "3D"],
 ]
-BASIC_EXPECTED_UP = [result_row[::-1] for result_row in BASIC_EXPECTED_DOWN]
 BASIC_EXPECTED_RIGHT = TEST_CROSSWORD_BASIC
-BASIC_EXPECTED_LEFT = [result_row[::-1] for result_row in BASIC_EXPECTED_RIGHT]
 BASIC_EXPECTED_DOWN_RIGHT = [
     ["3A"],
     ["2A", "3B"],
@@ -26,7 +24,6 @@ BASIC_EXPECTED_DOWN_RIGHT = [
     ["1C", "2D"],
     ["1D"],
 ]
-BASIC_EXPECTED_UP_LEFT = [result_row[::-1] for result_row in BASIC_EXPECTED_DOWN_RIGHT]
 BASIC_EXPECTED_DOWN_LEFT = [
     ["1A"],
     ["1B", "2A"],
@@ -35,16 +32,11 @@ BASIC_EXPECTED_DOWN_LEFT = [
     ["2D", "3C"],
     ["3D"],
 ]
-BASIC_EXPECTED_UP_RIGHT = [result_row[::-1] for result_row in BASIC_EXPECTED_DOWN_LEFT]
 BASIC_EXPECTED_RESULTS = {
     CrosswordDirection.DOWN: BASIC_EXPECTED_DOWN,
-    CrosswordDirection.UP: BASIC_EXPECTED_UP,
     CrosswordDirection.RIGHT: BASIC_EXPECTED_RIGHT,
-    CrosswordDirection.LEFT: BASIC_EXPECTED_LEFT,
     CrosswordDirection.DOWN_RIGHT: BASIC_EXPECTED_DOWN_RIGHT,
-    CrosswordDirection.UP_RIGHT: BASIC_EXPECTED_UP_RIGHT,
     CrosswordDirection.DOWN_LEFT: BASIC_EXPECTED_DOWN_LEFT,
-    CrosswordDirection.UP_LEFT: BASIC_EXPECTED_UP_LEFT,
 }
 
 
@@ -52,10 +44,10 @@ TEST_CROSSWORD_DIAGONAL_1 = [
     ["1", "2", "3", "4", "5"],
 ]
 DIAGONAL_1_EXPECTED_RESULTS = {
+    CrosswordDirection.DOWN: [["1"], ["2"], ["3"], ["4"], ["5"]],
+    CrosswordDirection.RIGHT: TEST_CROSSWORD_DIAGONAL_1,
     CrosswordDirection.DOWN_LEFT: [["1"], ["2"], ["3"], ["4"], ["5"]],
-    CrosswordDirection.DOWN_RIGHT:  [["1"], ["2"], ["3"], ["4"], ["5"]],
-    CrosswordDirection.UP_RIGHT: [["1"], ["2"], ["3"], ["4"], ["5"]],
-    CrosswordDirection.UP_LEFT: [["1"], ["2"], ["3"], ["4"], ["5"]],
+    CrosswordDirection.DOWN_RIGHT: [["1"], ["2"], ["3"], ["4"], ["5"]],
 }
 
 TEST_CROSSWORD_DIAGONAL_2 = [
@@ -64,6 +56,14 @@ TEST_CROSSWORD_DIAGONAL_2 = [
     ["3A", "3B"],
     ["4A", "4B"],
 ]
+TEST_CROSSWORD_COLUMN = [["1"], ["2"], ["3"]]
+COLUMN_EXPECTED_RESULTS = {
+    CrosswordDirection.DOWN: [["1", "2", "3"]],
+    CrosswordDirection.RIGHT: TEST_CROSSWORD_COLUMN,
+    CrosswordDirection.DOWN_LEFT: TEST_CROSSWORD_COLUMN,
+    CrosswordDirection.DOWN_RIGHT: TEST_CROSSWORD_COLUMN,
+}
+
 DIAGONAL_2_EXPECTED_DOWN_RIGHT = [
     ["1B"],
     ["1A", "2B"],
@@ -79,41 +79,54 @@ DIAGONAL_2_EXPECTED_DOWN_LEFT = [
     ["4B"],
 ]
 DIAGONAL_2_EXPECTED_RESULTS = {
+    CrosswordDirection.DOWN: [["1A", "2A", "3A", "4A"], ["1B", "2B", "3B", "4B"]],
+    CrosswordDirection.RIGHT: TEST_CROSSWORD_DIAGONAL_2,
     CrosswordDirection.DOWN_LEFT: DIAGONAL_2_EXPECTED_DOWN_LEFT,
     CrosswordDirection.DOWN_RIGHT: DIAGONAL_2_EXPECTED_DOWN_RIGHT,
-    CrosswordDirection.UP_RIGHT: [result_row[::-1] for result_row in DIAGONAL_2_EXPECTED_DOWN_LEFT],
-    CrosswordDirection.UP_LEFT: [result_row[::-1] for result_row in DIAGONAL_2_EXPECTED_DOWN_RIGHT],
 }
 
 
-def test_basic_crossword_direction_slice():
-    crossword_map = CrosswordMap(TEST_CROSSWORD_BASIC)
-    for direction in [CrosswordDirection.UP, CrosswordDirection.DOWN, CrosswordDirection.RIGHT, CrosswordDirection.LEFT]:
-        expected_result = BASIC_EXPECTED_RESULTS[direction]
-        _test_crossword_direction_slice(crossword_map, direction, expected_result)
-
-
 @pytest.mark.parametrize(
     "crossword_map_strings, expected_results",
     [
         (TEST_CROSSWORD_BASIC, BASIC_EXPECTED_RESULTS),
         (TEST_CROSSWORD_DIAGONAL_1, DIAGONAL_1_EXPECTED_RESULTS),
         (TEST_CROSSWORD_DIAGONAL_2, DIAGONAL_2_EXPECTED_RESULTS),
+        (TEST_CROSSWORD_COLUMN, COLUMN_EXPECTED_RESULTS),
     ]
 )
-def test_crossword_diagonal_direction_slice(
+def test_scanner_line_families(
     crossword_map_strings: list[list[str]], expected_results: dict[CrosswordDirection, list[list[str]]]
 ):
-    crossword_map = CrosswordMap(crossword_map_strings)
-    for direction in [
-        CrosswordDirection.DOWN_LEFT, CrosswordDirection.UP_LEFT, CrosswordDirection.DOWN_RIGHT, CrosswordDirection.UP_RIGHT
-    ]:
-        expected_result = expected_results[direction]
-        _test_crossword_direction_slice(crossword_map, direction, expected_result)
+    # cells of the test crosswords are multi char strings, the scanner needs a single char per cell
+    cell_chars = {}
+    for row in crossword_map_strings:
+        for cell in row:
+            cell_chars.setdefault(cell, chr(ord("a") + len(cell_chars)))
+    lines = ["".join(cell_chars[cell] for cell in row) for row in crossword_map_strings]
+
+    line_families = CrosswordScanner(lines).line_families
+    assert set(line_families) == set(expected_results)
+    for direction, expected_result in expected_results.items():
+        expected_lines = ["".join(cell_chars[cell] for cell in line) for line in expected_result]
+        assert sorted(line_families[direction]) == sorted(expected_lines)
+
+
+TEST_WORD_SEARCH = """
+MMMSXXMASM
+MSAMXMSMSA
+AMXSXMAAMM
+MSAMASMSMX
+XMASAMXAMM
+XXAMMXXAMA
+SMSMSASXSS
+SAXAMASAAA
+MAMMMXMMMM
+MXMXAXMASX
+"""
 
 
-def _test_crossword_direction_slice(crossword_map: CrosswordMap, direction: CrosswordDirection, expected_result: list[list[str]]):
-    sliced_lines = list(crossword_map.slice_lines_across_direction(direction))
-    assert len(sliced_lines) == len(expected_result)
-    for line in sliced_lines:
-        assert line in expected_result
+def test_scanner_counts():
+    crossword_scanner = CrosswordScanner(TEST_WORD_SEARCH.strip().splitlines())
+    assert crossword_scanner.count_words(["XMAS"]) == 18
+    assert crossword_scanner.count_x_mas() == 9
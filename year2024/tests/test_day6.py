@@ -0,0 +1,54 @@
+import pytest
+
+from year2024.days.day6 import (
+    GuardSimulator, LabMap, LoopDetectedError, count_loop_causing_obstacle_locations_in_parallel,
+    simulate_guard_movement,
+)
+
+
+TEST_LAB_MAP = """
+....#.....
+.........#
+..........
+..#.......
+.......#..
+..........
+.#..^.....
+........#.
+#.........
+......#...
+"""
+
+
+def test_guard_simulator_visited_cells_match_step_by_step_simulation():
+    lab_map = LabMap(TEST_LAB_MAP.strip().splitlines())
+    guard_simulator = GuardSimulator(lab_map)
+    simulate_guard_movement(lab_map)
+    assert len(guard_simulator.visited_cells()) == lab_map.fields_visited_count == 41
+
+
+def test_guard_simulator_loop_causing_obstacles():
+    guard_simulator = GuardSimulator(LabMap(TEST_LAB_MAP.strip().splitlines()))
+    assert guard_simulator.count_loop_causing_obstacle_locations() == 6
+
+
+def test_parallel_loop_causing_obstacles_match_serial():
+    guard_simulator = GuardSimulator(LabMap(TEST_LAB_MAP.strip().splitlines()))
+    assert count_loop_causing_obstacle_locations_in_parallel(guard_simulator, worker_count=2) == 6
+
+
+def test_parallel_worker_timings_are_recorded_not_printed(capsys):
+    guard_simulator = GuardSimulator(LabMap(TEST_LAB_MAP.strip().splitlines()))
+    timings = []
+    count_loop_causing_obstacle_locations_in_parallel(
+        guard_simulator, worker_count=2, record_timing=lambda name, seconds: timings.append((name, seconds))
+    )
+    assert timings and all(name.startswith("worker ") and seconds >= 0 for name, seconds in timings)
+    assert capsys.readouterr().out == ""
+
+
+def test_guard_simulator_detects_loop_without_makeshift_obstacle():
+    # the guard walks around the 2x2 square in the middle forever
+    guard_simulator = GuardSimulator(LabMap([".#..", "...#", "#^..", "..#."]))
+    with pytest.raises(LoopDetectedError):
+        guard_simulator.visited_cells()
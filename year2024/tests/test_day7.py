@@ -0,0 +1,64 @@
+import itertools
+import random
+
+import pytest
+
+from year2024.days.day7 import Equation, Operation, load_equations_from_input, sum_solvable_results_in_parallel
+
+
+TEST_EQUATIONS = """
+190: 10 19
+3267: 81 40 27
+83: 17 5
+156: 15 6
+7290: 6 8 6 15
+161011: 16 10 13
+192: 17 8 14
+21037: 9 7 18 13
+292: 11 6 16 20
+"""
+
+
+def test_backward_solver():
+    equations = list(load_equations_from_input(TEST_EQUATIONS.strip().splitlines()))
+    assert sum(equation.result for equation in equations if equation.is_solvable(exclude_concat=True)) == 3749
+    assert sum(equation.result for equation in equations if equation.is_solvable(exclude_concat=False)) == 11387
+
+
+def test_concat_and_parallel_sum():
+    assert Operation.CONCAT.exec(15, 6) == 156
+    assert Operation.CONCAT.exec(12, 10) == 1210
+    equations = load_equations_from_input(TEST_EQUATIONS.strip().splitlines())
+    assert sum_solvable_results_in_parallel(equations, exclude_concat=False, worker_count=2, chunk_size=2) == 11387
+
+
+@pytest.mark.parametrize("equation, exclude_concat, expected", [
+    (Equation(0, [0, 2]), True, True),
+    (Equation(9, [0, 8, 9]), True, True),
+    (Equation(0, [5, 0]), True, True),
+    (Equation(0, [3, 4]), False, False),
+    (Equation(7, [0, 3, 7]), False, True),
+    (Equation(30, [0, 3, 0]), False, True),
+])
+def test_zero_operands(equation: Equation, exclude_concat: bool, expected: bool):
+    assert equation.is_solvable(exclude_concat=exclude_concat) == expected
+
+
+def test_backward_solver_matches_enumeration():
+    def solvable_by_enumeration(equation: Equation, operations: list[Operation]) -> bool:
+        for operation_combo in itertools.product(operations, repeat=len(equation.numbers) - 1):
+            result = equation.numbers[0]
+            for number, operation in zip(equation.numbers[1:], operation_combo):
+                result = operation.exec(result, number)
+            if result == equation.result:
+                return True
+        return False
+
+    random.seed(7)
+    for _ in range(2000):
+        numbers = [random.randint(0, 4) for _ in range(random.randint(1, 4))]
+        equation = Equation(random.randint(0, 60), numbers)
+        assert equation.is_solvable(exclude_concat=True) == \
+            solvable_by_enumeration(equation, [Operation.ADD, Operation.MUL])
+        assert equation.is_solvable(exclude_concat=False) == \
+            solvable_by_enumeration(equation, [Operation.ADD, Operation.MUL, Operation.CONCAT])
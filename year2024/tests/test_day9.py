@@ -0,0 +1,12 @@
+from year2024.days.day9 import calculate_checksum, compact_blocks, defragment_files, parse_disk_map
+
+
+TEST_DISK_MAP = "2333133121414131402"
+
+
+def test_compact_blocks_checksum():
+    assert calculate_checksum(compact_blocks(parse_disk_map(TEST_DISK_MAP))) == 1928
+
+
+def test_defragment_files_checksum():
+    assert calculate_checksum(defragment_files(parse_disk_map(TEST_DISK_MAP))) == 2858
@@ -0,0 +1,44 @@
+from array import array
+
+import pytest
+
+from lib.exceptions import OutOfBoundsError
+from lib.models import dense_grid, DenseGrid, Direction
+
+
+def _expected_shift(grid: DenseGrid, direction: Direction, fill: int) -> list[int]:
+    expected = []
+    for index in range(len(grid)):
+        try:
+            expected.append(grid[grid.get_next_index_in_direction(index, direction)])
+        except OutOfBoundsError:
+            expected.append(fill)
+    return expected
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize("direction", Direction.get_omnidirectional())
+@pytest.mark.parametrize("row_count, col_count", [(3, 4), (1, 5), (4, 1), (1, 1)])
+def test_shifted_matches_neighbour_lookup(monkeypatch, use_numpy: bool, direction: Direction, row_count: int,
+                                          col_count: int):
+    if use_numpy and dense_grid.numpy is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(dense_grid, "numpy", None)
+    grid = DenseGrid(row_count, col_count, bytearray(range(1, row_count * col_count + 1)))
+    shifted = grid.shifted(direction, fill=255)
+    assert (shifted.row_count, shifted.col_count) == (row_count, col_count)
+    assert list(shifted.cells) == _expected_shift(grid, direction, 255)
+    assert isinstance(shifted.cells, bytearray)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_shifted_keeps_typecode(monkeypatch, use_numpy: bool):
+    if use_numpy and dense_grid.numpy is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(dense_grid, "numpy", None)
+    grid = DenseGrid(2, 2, array('q', [-1, 2, 3, 1 << 40]))
+    shifted = grid.shifted(Direction.LEFT, fill=-7)
+    assert shifted.cells == array('q', [-7, -1, -7, 3])
+    assert grid.cells == array('q', [-1, 2, 3, 1 << 40])
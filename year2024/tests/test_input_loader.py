@@ -0,0 +1,45 @@
+import pytest
+
+from helpers import InputLoader
+from lib.exceptions import RunException
+
+
+@pytest.mark.parametrize("content", [
+    "1\n2\n3",
+    "1\n2\n3\n",
+    "\n\n  1\n2\n\n\n3\n\n \n",
+    "a,,b, ,c,\n",
+    "",
+    "\n \n",
+])
+@pytest.mark.parametrize("item_separator", ["\n", ",", "\n\n", ", "])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1 << 16])
+def test_generator_matches_load_input_array(tmp_path, content: str, item_separator: str, chunk_size: int):
+    input_path = tmp_path / "input"
+    input_path.write_text(content)
+    input_loader = InputLoader(input_path)
+    streamed = list(input_loader.load_input_as_generator(item_separator, chunk_size=chunk_size))
+    assert streamed == input_loader.load_input_array(item_separator)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 16])
+def test_generator_with_multi_character_separator(tmp_path, chunk_size: int):
+    input_path = tmp_path / "input"
+    input_path.write_text("1 2\n3\n\n4\n\n\n5\n\n")
+    items = list(InputLoader(input_path).load_input_as_generator("\n\n", chunk_size=chunk_size))
+    assert items == ["1 2\n3", "4", "\n5"]
+
+
+def test_generator_retypes_to_int(tmp_path):
+    input_path = tmp_path / "input"
+    input_path.write_text("10\n-2\n3\n")
+    input_loader = InputLoader(input_path)
+    assert list(input_loader.load_input_as_generator("\n", retype_int=True, chunk_size=2)) == [10, -2, 3]
+    assert input_loader.load_input_array("\n", retype_item_to_int=True) == [10, -2, 3]
+
+
+def test_generator_rejects_empty_separator(tmp_path):
+    input_path = tmp_path / "input"
+    input_path.write_text("1")
+    with pytest.raises(RunException):
+        next(InputLoader(input_path).load_input_as_generator(""))
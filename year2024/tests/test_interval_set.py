@@ -0,0 +1,89 @@
+import random
+
+from lib.models import CustomRange, IntervalSet
+
+
+def _bounds(ranges) -> list[tuple[int, int]]:
+    return [(custom_range.start, custom_range.end) for custom_range in ranges]
+
+
+def _values(interval_set: IntervalSet) -> set[int]:
+    return {value for custom_range in interval_set for value in custom_range}
+
+
+def test_add_merges_overlapping_and_touching_ranges():
+    interval_set = IntervalSet([CustomRange(10, 12), CustomRange(1, 3)])
+    interval_set.add(5, 6)
+    assert _bounds(interval_set) == [(1, 3), (5, 6), (10, 12)]
+    interval_set.add(4, 4)  # touches both neighbours
+    assert _bounds(interval_set) == [(1, 6), (10, 12)]
+    interval_set.add(8, 20)
+    assert _bounds(interval_set) == [(1, 6), (8, 20)]
+    interval_set.add(0, 30)
+    assert _bounds(interval_set) == [(0, 30)]
+    interval_set.add(5, 4)  # empty range
+    assert _bounds(interval_set) == [(0, 30)]
+
+
+def test_remove_trims_and_splits_ranges():
+    interval_set = IntervalSet.from_bounds([(1, 10), (20, 30)])
+    interval_set.remove(5, 6)
+    assert _bounds(interval_set) == [(1, 4), (7, 10), (20, 30)]
+    interval_set.remove(9, 25)
+    assert _bounds(interval_set) == [(1, 4), (7, 8), (26, 30)]
+    interval_set.remove(11, 25)  # nothing covered
+    assert _bounds(interval_set) == [(1, 4), (7, 8), (26, 30)]
+    interval_set.remove_range(CustomRange(0, 100))
+    assert not interval_set
+
+
+def test_from_bounds_skips_inverted_bounds():
+    interval_set = IntervalSet.from_bounds([(5, 3), (1, 2), (7, 6)])
+    assert _bounds(interval_set) == [(1, 2)]
+    assert interval_set.coverage == 2
+    assert not IntervalSet.from_bounds([(5, 3)])
+
+
+def test_gaps_and_coverage():
+    interval_set = IntervalSet.from_bounds([(3, 5), (8, 8), (12, 20)])
+    assert interval_set.coverage == 3 + 1 + 9
+    assert (interval_set.min, interval_set.max, interval_set.range_count) == (3, 20, 3)
+    assert _bounds(interval_set.gaps(0, 15)) == [(0, 2), (6, 7), (9, 11)]
+    assert _bounds(interval_set.gaps(12, 20)) == []
+    assert _bounds(IntervalSet().gaps(1, 2)) == [(1, 2)]
+    assert IntervalSet().coverage == 0 and IntervalSet().min is None
+
+
+def test_map_offsets():
+    interval_set = IntervalSet.from_bounds([(0, 9), (20, 29)])
+    # almanac style mapping, 5..24 moves by +100 and 28..40 by -28, 28..29 lands on unmapped 0..4
+    mapped = interval_set.map_offsets([(CustomRange(5, 24), 100), (CustomRange(28, 40), -28)])
+    assert _bounds(mapped) == [(0, 4), (25, 27), (105, 109), (120, 124)]
+    assert _bounds(interval_set.map_offsets([])) == [(0, 9), (20, 29)]
+
+
+def test_operations_match_python_sets():
+    randomizer = random.Random(2024)
+    for _ in range(200):
+        interval_set, expected = IntervalSet(), set()
+        for _ in range(8):
+            start = randomizer.randint(0, 40)
+            end = start + randomizer.randint(-1, 8)
+            if randomizer.random() < 0.6:
+                interval_set.add(start, end)
+                expected |= set(range(start, end + 1))
+            else:
+                interval_set.remove(start, end)
+                expected -= set(range(start, end + 1))
+            assert _values(interval_set) == expected
+            assert interval_set.coverage == len(expected)
+            assert all(value in interval_set for value in expected)
+            # ranges stay sorted and never touch each other
+            assert all(end + 1 < next_start for end, next_start in zip(interval_set.ends, interval_set.starts[1:]))
+
+        other = IntervalSet.from_bounds([(randomizer.randint(0, 20), randomizer.randint(20, 40))])
+        other_values = _values(other)
+        assert _values(interval_set.union(other)) == expected | other_values
+        assert _values(interval_set.intersection(other)) == expected & other_values
+        assert _values(interval_set.difference(other)) == expected - other_values
+        assert {value for gap in interval_set.gaps(0, 50) for value in gap} == set(range(51)) - expected
@@ -0,0 +1,55 @@
+from array import array
+
+import pytest
+
+from lib.models import DenseGrid, Direction, NeighbourTable, NO_NEIGHBOUR, get_cardinal_neighbour_table
+from lib.models.neighbour_table import index_typecode
+
+
+def _expected_neighbour(row_count: int, col_count: int, index: int, direction: Direction) -> int:
+    row, col = divmod(index, col_count)
+    new_row, new_col = row + direction.value[0], col + direction.value[1]
+    if 0 <= new_row < row_count and 0 <= new_col < col_count:
+        return new_row * col_count + new_col
+    return NO_NEIGHBOUR
+
+
+@pytest.mark.parametrize("row_count, col_count", [(3, 4), (1, 1), (1, 4), (4, 1), (2, 2)])
+def test_tables_match_bounds_checked_lookup(row_count: int, col_count: int):
+    directions = tuple(Direction.get_omnidirectional())
+    neighbour_table = NeighbourTable(row_count, col_count, directions)
+    for direction in directions:
+        assert list(neighbour_table.table_for(direction)) == [
+            _expected_neighbour(row_count, col_count, index, direction) for index in range(row_count * col_count)
+        ]
+
+
+def test_edge_cells():
+    neighbour_table = get_cardinal_neighbour_table(3, 4)
+    # corners, an edge cell and the inner cell right above the bottom edge
+    assert sorted(neighbour_table.iter_neighbours(0)) == [1, 4]
+    assert sorted(neighbour_table.iter_neighbours(3)) == [2, 7]
+    assert sorted(neighbour_table.iter_neighbours(8)) == [4, 9]
+    assert sorted(neighbour_table.iter_neighbours(11)) == [7, 10]
+    assert sorted(neighbour_table.iter_neighbours(4)) == [0, 5, 8]
+    assert sorted(neighbour_table.iter_neighbours(5)) == [1, 4, 6, 9]
+    assert dict(neighbour_table.iter_neighbours_with_directions(3)) == {
+        Direction.UP: NO_NEIGHBOUR, Direction.RIGHT: NO_NEIGHBOUR, Direction.DOWN: 7, Direction.LEFT: 2,
+    }
+
+
+def test_single_cell_has_no_neighbours():
+    assert list(get_cardinal_neighbour_table(1, 1).iter_neighbours(0)) == []
+
+
+def test_tables_use_smallest_index_typecode():
+    assert get_cardinal_neighbour_table(3, 4).tables[0].typecode == 'i'
+    assert index_typecode(1 << 31) == 'i'
+    assert array(index_typecode((1 << 31) + 1)).itemsize == 8
+
+
+def test_tables_live_with_their_grid():
+    grid = DenseGrid(3, 4)
+    assert grid.cardinal_neighbour_table is grid.cardinal_neighbour_table
+    assert DenseGrid(3, 4).cardinal_neighbour_table is not grid.cardinal_neighbour_table
+    assert get_cardinal_neighbour_table(3, 4) is not get_cardinal_neighbour_table(3, 4)
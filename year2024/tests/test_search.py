@@ -0,0 +1,99 @@
+import math
+
+import pytest
+
+from lib.models import DenseGrid
+from lib.search import UNREACHED, a_star, bfs, dijkstra, grid_neighbours, manhattan_heuristic, multi_source_bfs
+
+
+WALL = ord('#')
+MAZE = [
+    "S..#....",
+    ".#.#.##.",
+    ".#...#..",
+    ".####.#.",
+    "......#E",
+]
+
+
+@pytest.fixture
+def maze() -> DenseGrid:
+    return DenseGrid.from_lines(MAZE)
+
+
+def _open_neighbours(grid: DenseGrid):
+    return grid_neighbours(grid, lambda node, neighbour: grid[neighbour] != WALL)
+
+
+def _unit_costs(grid: DenseGrid):
+    neighbours = _open_neighbours(grid)
+    return lambda node: ((neighbour, 1) for neighbour in neighbours(node))
+
+
+def _assert_valid_path(grid: DenseGrid, path: list[int], start: int, end: int):
+    assert path[0] == start and path[-1] == end
+    assert all(grid[node] != WALL for node in path)
+    for node, next_node in zip(path, path[1:]):
+        (row, col), (next_row, next_col) = grid.coordinates(node), grid.coordinates(next_node)
+        assert abs(row - next_row) + abs(col - next_col) == 1
+
+
+def test_bfs_distances_and_path(maze: DenseGrid):
+    start, end = maze.find_all(ord('S'))[0], maze.find_all(ord('E'))[0]
+    result = bfs(len(maze), start, _open_neighbours(maze), track_paths=True)
+    assert result.distances[end] == 15
+    assert result.distances[maze.index(0, 3)] == UNREACHED and not result.reached(maze.index(0, 3))
+    path = result.path_to(end)
+    assert len(path) == 16
+    _assert_valid_path(maze, path, start, end)
+    with pytest.raises(ValueError):
+        result.path_to(maze.index(0, 3))
+
+
+def test_bfs_stops_at_target(maze: DenseGrid):
+    start = maze.index(0, 0)
+    result = bfs(len(maze), start, _open_neighbours(maze), is_target=lambda node: node == maze.index(2, 2))
+    assert (result.target, result.target_distance) == (maze.index(2, 2), 4)
+    assert result.distances[maze.index(4, 7)] == UNREACHED
+    with pytest.raises(ValueError):
+        result.path_to(result.target)  # paths were not tracked
+
+
+def test_multi_source_bfs_measures_distance_to_closest_start(maze: DenseGrid):
+    starts = [maze.index(0, 0), maze.index(4, 7)]
+    result = multi_source_bfs(len(maze), starts, _open_neighbours(maze), track_paths=True)
+    assert result.distances[maze.index(2, 4)] == 6  # closer to the top left corner
+    assert result.distances[maze.index(0, 5)] == 6  # closer to the bottom right corner, up the right edge
+    assert result.path_to(maze.index(2, 4))[0] == maze.index(0, 0)
+    assert result.path_to(maze.index(0, 5))[0] == maze.index(4, 7)
+    first_start = multi_source_bfs(len(maze), starts, _open_neighbours(maze), is_target=lambda node: node in starts)
+    assert (first_start.target, first_start.target_distance) == (starts[0], 0)
+
+
+def test_dijkstra_prefers_cheaper_longer_path():
+    # 0 -> 3 directly costs 10, around through 1 and 2 only 3
+    edges = {0: [(3, 10), (1, 1)], 1: [(2, 1)], 2: [(3, 1)], 3: [], 4: []}
+    result = dijkstra(5, [0], lambda node: edges[node], track_paths=True)
+    assert result.distances[3] == 3
+    assert result.path_to(3) == [0, 1, 2, 3]
+    assert result.distances[4] == math.inf and not result.reached(4)
+
+
+def test_a_star_matches_dijkstra(maze: DenseGrid):
+    start, end = maze.find_all(ord('S'))[0], maze.find_all(ord('E'))[0]
+
+    def is_end(node: int) -> bool:
+        return node == end
+
+    a_star_result = a_star(len(maze), [start], _unit_costs(maze), manhattan_heuristic(maze, end), is_end,
+                           track_paths=True)
+    dijkstra_result = dijkstra(len(maze), [start], _unit_costs(maze), is_end)
+    assert a_star_result.target_distance == dijkstra_result.target_distance == 15
+    _assert_valid_path(maze, a_star_result.path_to(end), start, end)
+
+
+def test_a_star_without_reachable_target(maze: DenseGrid):
+    unreachable = maze.index(0, 3)
+    result = a_star(len(maze), [0], _unit_costs(maze), manhattan_heuristic(maze, unreachable),
+                    lambda node: node == unreachable)
+    assert result.target is None and result.target_distance is None
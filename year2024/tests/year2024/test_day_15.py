@@ -1,7 +1,6 @@
 import pytest
 
-from lib.models import Direction
-from year2024.days.day15 import Robot, FactoryMap, FactoryMapField, FieldType, InstructionSet, parse_factory_map
+from year2024.days.day15 import Warehouse
 
 
 TEST_MOVE_SETUP_1 = """
@@ -14,7 +13,7 @@ TEST_MOVE_SETUP_1 = """
 ##....@...##
 ############
 """
-TEST_MOVE_INSTRUCTIONS_1 = [Direction.UP]
+TEST_MOVE_INSTRUCTIONS_1 = "^"
 TEST_MOVE_EXPECTED_RESULT_1 = """
 ############
 ##.....[].##
@@ -31,9 +30,7 @@ TEST_MOVE_SETUP_2 = """
 ##......[][].@.##
 #################
 """
-TEST_MOVE_INSTRUCTIONS_2 = [
-    Direction.UP, Direction.LEFT, Direction.LEFT, Direction.LEFT, Direction.DOWN, Direction.RIGHT
-]
+TEST_MOVE_INSTRUCTIONS_2 = "^<<<v>"
 TEST_MOVE_EXPECTED_RESULT_2 = """
 #################
 ##....[][].@...##
@@ -50,16 +47,29 @@ TEST_INVALID_MOVE_SETUP_1 = """
 ##....@...##
 ############
 """
-TEST_INVALID_MOVE_INSTRUCTIONS_1 = [Direction.UP]
-TEST_INVALID_MOVE_EXPECTED_RESULT_1 = """
-############
-##......[]##
-##.....[].##
-##[][][]..##
-##...[][].##
-##....[][]##
-##....@...##
-############
+TEST_INVALID_MOVE_INSTRUCTIONS_1 = "^"
+TEST_INVALID_MOVE_EXPECTED_RESULT_1 = TEST_INVALID_MOVE_SETUP_1
+
+TEST_NARROW_SETUP = """
+########
+#..O.O.#
+##@.O..#
+#...O..#
+#.#.O..#
+#...O..#
+#......#
+########
+"""
+TEST_NARROW_INSTRUCTIONS = "<^^>>>vv<v>>v<<"
+TEST_NARROW_EXPECTED_RESULT = """
+########
+#....OO#
+##.....#
+#.....O#
+#.#O@..#
+#...O..#
+#...O..#
+########
 """
 
 
@@ -69,34 +79,36 @@ TEST_INVALID_MOVE_EXPECTED_RESULT_1 = """
         (TEST_INVALID_MOVE_SETUP_1, TEST_INVALID_MOVE_INSTRUCTIONS_1, TEST_INVALID_MOVE_EXPECTED_RESULT_1),
         (TEST_MOVE_SETUP_1, TEST_MOVE_INSTRUCTIONS_1, TEST_MOVE_EXPECTED_RESULT_1),
         (TEST_MOVE_SETUP_2, TEST_MOVE_INSTRUCTIONS_2, TEST_MOVE_EXPECTED_RESULT_2),
+        (TEST_NARROW_SETUP, TEST_NARROW_INSTRUCTIONS, TEST_NARROW_EXPECTED_RESULT),
     ]
 )
-def test_move_robot(setup: str, instructions: list[Direction], expected_result: str):
-    robot_map = load_setup(setup.strip(), instructions)
-    while robot_map.process_next_instruction(wide_version=True):
-        pass
-    assert check_expected_result(robot_map, expected_result.strip())
+def test_move_robot(setup: str, instructions: str, expected_result: str):
+    warehouse = Warehouse(setup)
+    warehouse.execute(instructions)
+    assert check_expected_result(warehouse, expected_result.strip())
 
 
-def load_setup(raw_setup: str, instructions: list[Direction]) -> FactoryMap:
-    return parse_factory_map(raw_setup, InstructionSet(instructions))
+def test_wide_map_gps_coordinates():
+    warehouse = Warehouse.from_raw_map(TEST_NARROW_SETUP, wide_version=True)
+    assert warehouse.width == 16
+    assert warehouse.crate_gps_coordinates == sum(
+        100 * row + 2 * col for row, line in enumerate(TEST_NARROW_SETUP.strip().splitlines())
+        for col, char in enumerate(line) if char == "O"
+    )
 
 
-def check_expected_result(robot_map: FactoryMap, expected_result: str) -> bool:
+def check_expected_result(warehouse: Warehouse, expected_result: str) -> bool:
     differences = []
     for row_id, row in enumerate(expected_result.splitlines()):
         for col_id, char in enumerate(row):
-            real_value = (
-                "@"
-                if robot_map.robot.row == row_id and robot_map.robot.col == col_id
-                else robot_map.fields[row_id][col_id].type.value
-            )
+            index = row_id * warehouse.width + col_id
+            real_value = "@" if warehouse.robot == index else chr(warehouse.cells[index])
             if char != real_value:
                 differences.append((row_id, col_id, char, real_value))
 
     if differences:
-        print("\nRobot map:")
-        robot_map.print_map()
+        print("\nWarehouse:")
+        warehouse.print_map()
         print(f"Expected:\n{expected_result}")
         print("Differences:")
         for diff in differences: